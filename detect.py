@@ -44,6 +44,9 @@ Examples:
   # Batch processing with parallel processing
   python detect.py --batch data/videos/fake/*.mp4 --output-dir results/ --parallel
 
+  # Batch processing with 4 videos analyzed concurrently
+  python detect.py --batch data/videos/fake/*.mp4 --batch-workers 4
+
 Supported Providers:
   - local: Self-contained reasoning agent (default, no API required)
   - anthropic: Claude 3.5 Sonnet (requires API key)
@@ -131,6 +134,12 @@ Environment Variables (optional):
         type=int,
         help='Number of parallel workers (default: auto-detect based on CPU cores)'
     )
+    parser.add_argument(
+        '--batch-workers',
+        type=int,
+        default=1,
+        help='Number of videos to process concurrently in --batch mode (default: 1)'
+    )
 
     # Display options
     parser.add_argument(
@@ -239,7 +248,8 @@ def main():
             # Process batch
             results = detector.batch_detect(
                 video_paths=video_paths,
-                output_dir=args.output_dir
+                output_dir=args.output_dir,
+                video_workers=args.batch_workers
             )
 
             # Print summary
@@ -5,10 +5,12 @@ Main orchestration logic for the deepfake detection system.
 Coordinates video processing, LLM analysis, and result generation.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
+import os
 
 from .video_processor import VideoProcessor, validate_video_file
 from .llm_analyzer import LLMAnalyzer
@@ -59,6 +61,7 @@ class DeepfakeDetector:
         self.verbose = verbose
         self.use_parallel = use_parallel
         self.max_workers = max_workers
+        self.prompts_dir = prompts_dir
 
         # Initialize LLM analyzer
         self.llm_analyzer = LLMAnalyzer(
@@ -344,7 +347,8 @@ class DeepfakeDetector:
     def batch_detect(
         self,
         video_paths: list,
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        video_workers: Optional[int] = 1
     ) -> Dict[str, Dict[str, Any]]:
         """
         Perform batch detection on multiple videos.
@@ -352,17 +356,25 @@ class DeepfakeDetector:
         Args:
             video_paths: List of video file paths
             output_dir: Optional directory to save results
+            video_workers: Number of videos processed concurrently in separate
+                processes (default: 1, sequential; None: one per CPU core)
 
         Returns:
             Dictionary mapping video paths to results
         """
-        results = {}
+        if video_workers is None:
+            video_workers = os.cpu_count() or 1
+        video_workers = min(video_workers, len(video_paths))
 
-        for i, video_path in enumerate(video_paths):
-            self.logger.info(f"\nProcessing video {i + 1}/{len(video_paths)}: {video_path}")
+        if video_workers > 1:
+            outcomes = self._detect_in_processes(video_paths, video_workers)
+        else:
+            outcomes = self._detect_sequentially(video_paths)
 
-            try:
-                result = self.detect(video_path)
+        results = {}
+
+        for video_path, (result, error) in zip(video_paths, outcomes):
+            if error is None:
                 results[video_path] = result
 
                 # Print summary
@@ -375,17 +387,121 @@ class DeepfakeDetector:
 
                     json_path = output_path / f"{video_name}_analysis.json"
                     OutputFormatter.save_json(result, str(json_path))
-
-            except Exception as e:
-                self.logger.error(f"Failed to process {video_path}: {str(e)}")
+            else:
+                self.logger.error(f"Failed to process {video_path}: {error}")
                 results[video_path] = {
-                    'error': str(e),
+                    'error': error,
                     'classification': 'ERROR',
                     'confidence': 0
                 }
 
         return results
 
+    def _detect_sequentially(self, video_paths: list):
+        """
+        Run detection on each video in this process, one after another.
+
+        Args:
+            video_paths: List of video file paths
+
+        Yields:
+            Tuples of (result, error message) in input order
+        """
+        for i, video_path in enumerate(video_paths):
+            self.logger.info(f"\nProcessing video {i + 1}/{len(video_paths)}: {video_path}")
+
+            try:
+                yield self.detect(video_path), None
+            except Exception as e:
+                yield None, str(e)
+
+    def _detect_in_processes(self, video_paths: list, video_workers: int) -> list:
+        """
+        Run detection on videos concurrently, one video per worker process.
+
+        Parallelism is at file granularity and each worker decodes with a
+        single OpenCV thread, avoiding decoder thread contention.
+
+        Args:
+            video_paths: List of video file paths
+            video_workers: Number of worker processes
+
+        Returns:
+            List of (result, error message) tuples in input order
+        """
+        self.logger.info(
+            f"Processing {len(video_paths)} videos with {video_workers} worker processes"
+        )
+
+        with ProcessPoolExecutor(
+            max_workers=video_workers,
+            initializer=_init_batch_worker,
+            initargs=(self._worker_config(),)
+        ) as executor:
+            futures = [executor.submit(_detect_in_worker, path) for path in video_paths]
+
+            outcomes = []
+            for future in futures:
+                try:
+                    outcomes.append((future.result(), None))
+                except Exception as e:
+                    outcomes.append((None, str(e)))
+
+        return outcomes
+
+    def _worker_config(self) -> Dict[str, Any]:
+        """
+        Get constructor arguments to rebuild this detector in a worker process.
+
+        Frame extraction inside workers is sequential, since the batch
+        already uses one process per video.
+
+        Returns:
+            Keyword arguments for DeepfakeDetector
+        """
+        return {
+            'api_provider': self.api_provider,
+            'model_name': self.model_name,
+            'api_key': self.llm_analyzer.api_key,
+            'num_frames': self.num_frames,
+            'sampling_strategy': self.sampling_strategy,
+            'prompts_dir': self.prompts_dir,
+            'verbose': self.verbose,
+            'use_parallel': False
+        }
+
+
+# Per-process detector used by batch worker processes
+_worker_detector = None
+
+
+def _init_batch_worker(config: Dict[str, Any]) -> None:
+    """
+    Initialize a batch worker process with a single-threaded decoder.
+
+    Args:
+        config: Keyword arguments for DeepfakeDetector
+    """
+    global _worker_detector
+
+    import cv2
+    cv2.setNumThreads(1)
+
+    _worker_detector = DeepfakeDetector(**config)
+
+
+def _detect_in_worker(video_path: str) -> Dict[str, Any]:
+    """
+    Run detection on one video inside a batch worker process.
+
+    Args:
+        video_path: Path to video file
+
+    Returns:
+        Detection results dictionary
+    """
+    return _worker_detector.detect(video_path)
+
 
 def create_detector(
     api_provider: str = "anthropic",
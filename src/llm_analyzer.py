@@ -6,14 +6,225 @@ using vision-capable language models.
 """
 
 import base64
+import functools
 import json
 import os
+import re
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Any
 import numpy as np
 from io import BytesIO
 from PIL import Image
 
+try:
+    # SIMD base64 encoder, output identical to the standard library's
+    import pybase64 as _base64
+except ImportError:
+    _base64 = base64
+
+
+def _to_pil_rgb(image: np.ndarray) -> Image.Image:
+    """
+    Wrap an RGB frame as a PIL image with as little copying as possible.
+
+    A zero-copy RGB view of a BGR frame (``frame[..., ::-1]``) has negative
+    channel strides, so making it contiguous means a slow strided gather.
+    PIL's ``BGR`` raw mode unpacks the underlying buffer directly instead.
+
+    Args:
+        image: RGB image as numpy array
+
+    Returns:
+        PIL image in RGB mode
+    """
+    if image.dtype == np.uint8 and image.ndim == 3 and image.shape[2] == 3:
+        bgr = image[..., ::-1]
+        if bgr.flags.c_contiguous:
+            height, width = image.shape[:2]
+            return Image.frombuffer('RGB', (width, height), bgr, 'raw', 'BGR', 0, 1)
+
+    # Copies only if the frame is not already a contiguous uint8 buffer
+    return Image.fromarray(np.ascontiguousarray(image, dtype=np.uint8), 'RGB')
+
+
+# Verdict phrases in priority order (earlier wins), found in a single scan
+_VERDICT_PHRASES = (
+    (r'(?:CLASSIFICATION|VERDICT):\s*FAKE', 'FAKE'),
+    (r'(?:CLASSIFICATION|VERDICT):\s*REAL', 'REAL'),
+    (r'(?:LIKELY|PROBABLY)\s+FAKE', 'LIKELY FAKE'),
+    (r'(?:LIKELY|PROBABLY)\s+REAL', 'LIKELY REAL'),
+)
+_VERDICT_RE = re.compile(
+    '|'.join(f'({pattern})' for pattern, _ in _VERDICT_PHRASES), re.IGNORECASE
+)
+# Only the labelled field counts; prose such as "low confidence in frame 3" does not
+_CONFIDENCE_RE = re.compile(
+    r'confidence(?:\s+level)?\s*[:=]\s*(\d{1,3})\s*%?', re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_verdict_cached(synthesis_text: str) -> Tuple[str, int]:
+    """
+    Parse classification and confidence from synthesis text (memoized).
+
+    Args:
+        synthesis_text: LLM synthesis output
+
+    Returns:
+        Tuple of (classification, confidence)
+    """
+    # Default values
+    classification = "UNCERTAIN"
+    confidence = 50
+
+    # Determine classification: one scan, keep the highest-priority phrase
+    best = len(_VERDICT_PHRASES)
+    for match in _VERDICT_RE.finditer(synthesis_text):
+        best = min(best, match.lastindex - 1)
+        if best == 0:
+            break
+    if best < len(_VERDICT_PHRASES):
+        classification = _VERDICT_PHRASES[best][1]
+
+    # Extract confidence (look for percentage)
+    confidence_match = _CONFIDENCE_RE.search(synthesis_text)
+    if confidence_match:
+        confidence = min(int(confidence_match.group(1)), 100)
+
+    return classification, confidence
+
+
+def _join_prompt(prompt: str, instructions: Optional[str]) -> str:
+    """
+    Combine per-call context with the prompt template that follows it.
+
+    Args:
+        prompt: Per-call context (may be empty)
+        instructions: Optional prompt template
+
+    Returns:
+        Single prompt string
+    """
+    if instructions is None:
+        return prompt
+    return f"{prompt}\n{instructions}" if prompt else instructions
+
+
+def _anthropic_system(instructions: Optional[str]) -> Dict[str, Any]:
+    """
+    Build the Anthropic ``system`` argument for a prompt template.
+
+    The template is identical across calls, so it is marked for prompt
+    caching and only the per-call context and images are billed in full.
+
+    Args:
+        instructions: Optional prompt template
+
+    Returns:
+        Keyword arguments for ``messages.create`` (empty without a template)
+    """
+    if not instructions:
+        return {}
+    return {'system': [{
+        'type': 'text',
+        'text': instructions,
+        'cache_control': {'type': 'ephemeral'}
+    }]}
+
+
+# Canned mock-provider responses; only the frame count varies
+@functools.lru_cache(maxsize=16)
+def _mock_vision_text(num_frames: int) -> str:
+    """
+    Build the mock vision response for a given number of frames.
+
+    Args:
+        num_frames: Number of frames passed to the mock call
+
+    Returns:
+        Canned analysis text
+    """
+    return f"""[MOCK ANALYSIS - Testing Mode]
+
+Analyzed {num_frames} frame(s).
+
+Frame observations:
+- Facial smoothing detected in central region
+- Slight lighting inconsistency between face and background
+- Minor texture artifacts around jawline
+- Resolution appears consistent
+
+Overall: Some artifacts detected that could indicate synthetic generation.
+"""
+
+
+_MOCK_SYNTHESIS_RESPONSE = """[MOCK SYNTHESIS - Testing Mode]
+
+Classification: LIKELY FAKE
+Confidence: 70%
+
+Key evidence:
+- Multiple frames show facial smoothing artifacts
+- Lighting inconsistencies observed
+- Temporal discontinuities in motion
+
+Reasoning: The combination of visual artifacts and temporal inconsistencies
+suggests this video may be synthetically generated. However, confidence is
+moderate due to limited artifact severity.
+"""
+
+
+# Prompt template files, keyed by prompt type
+_PROMPT_FILES = {
+    'frame_analysis': 'frame_analysis.txt',
+    'temporal_analysis': 'temporal_analysis.txt',
+    'synthesis': 'synthesis.txt'
+}
+
+
+def _read_prompt(path: Path) -> str:
+    """
+    Read a prompt file with a single raw read on its file descriptor.
+
+    Args:
+        path: Prompt file to read
+
+    Returns:
+        File contents decoded as UTF-8
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        return os.read(fd, size).decode('utf-8')
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_prompts_cached(prompts_dir: str) -> Mapping[str, str]:
+    """
+    Load prompt templates from a directory, once per directory.
+
+    Args:
+        prompts_dir: Resolved absolute path of the prompts directory
+
+    Returns:
+        Read-only mapping of prompt type to template text, using the
+        default inline prompt for any missing file
+    """
+    prompts = {}
+
+    for key, filename in _PROMPT_FILES.items():
+        try:
+            prompts[key] = _read_prompt(Path(prompts_dir) / filename)
+        except FileNotFoundError:
+            # Use default inline prompts if files don't exist
+            prompts[key] = LLMAnalyzer._get_default_prompt(key)
+
+    return MappingProxyType(prompts)
+
 
 class LLMAnalyzer:
     """
@@ -119,30 +330,12 @@ class LLMAnalyzer:
         else:
             raise ValueError(f"Unsupported API provider: {self.api_provider}")
 
-    def _load_prompts(self) -> Dict[str, str]:
-        """Load prompt templates from files."""
-        prompts = {}
-
-        # Define expected prompt files
-        prompt_files = {
-            'frame_analysis': 'frame_analysis.txt',
-            'temporal_analysis': 'temporal_analysis.txt',
-            'synthesis': 'synthesis.txt'
-        }
-
-        for key, filename in prompt_files.items():
-            filepath = self.prompts_dir / filename
-
-            if filepath.exists():
-                with open(filepath, 'r') as f:
-                    prompts[key] = f.read()
-            else:
-                # Use default inline prompts if files don't exist
-                prompts[key] = self._get_default_prompt(key)
+    def _load_prompts(self) -> Mapping[str, str]:
+        """Load prompt templates from files (cached per resolved directory)."""
+        return _load_prompts_cached(str(self.prompts_dir.resolve()))
 
-        return prompts
-
-    def _get_default_prompt(self, prompt_type: str) -> str:
+    @staticmethod
+    def _get_default_prompt(prompt_type: str) -> str:
         """Get default inline prompt if file not found."""
         defaults = {
             'frame_analysis': """Analyze this video frame for signs of deepfake manipulation.
@@ -204,21 +397,25 @@ Be specific and reference concrete observations from the analysis."""
         Encode numpy image array to base64 string.
 
         Args:
-            image: Image as numpy array (RGB format)
+            image: Image as numpy array (RGB format), or already-encoded JPEG
+                bytes (e.g. from VideoProcessor(store_as_jpeg=True))
 
         Returns:
             Base64 encoded image string
         """
+        if isinstance(image, (bytes, bytearray)):
+            # Already JPEG, skip the decode/re-encode round trip
+            return _base64.b64encode(image).decode('ascii')
+
         # Convert numpy array to PIL Image
-        pil_image = Image.fromarray(image.astype('uint8'), 'RGB')
+        pil_image = _to_pil_rgb(image)
 
         # Save to bytes buffer
         buffer = BytesIO()
         pil_image.save(buffer, format='JPEG', quality=85)
-        buffer.seek(0)
 
         # Encode to base64
-        image_base64 = base64.b64encode(buffer.read()).decode('utf-8')
+        image_base64 = _base64.b64encode(buffer.getbuffer()).decode('ascii')
 
         return image_base64
 
@@ -243,19 +440,18 @@ Be specific and reference concrete observations from the analysis."""
         if self.api_provider == 'local':
             return self.client.analyze_frame(frame, frame_index, metadata or {})
 
-        # Prepare the prompt for API-based analysis
-        prompt = self.prompts['frame_analysis']
-
         # Add metadata context if available
+        context = ""
         if metadata:
             context = f"\n\nVideo metadata:\n"
             context += f"- Resolution: {metadata.get('resolution', 'unknown')}\n"
             context += f"- Duration: {metadata.get('duration', 'unknown')}s\n"
             context += f"- Codec: {metadata.get('codec', 'unknown')}\n"
-            prompt = context + "\n" + prompt
 
-        # Call LLM with image
-        response = self._call_llm_vision(prompt, [frame])
+        # Call LLM with image, keeping the stable prompt template separate
+        response = self._call_llm_vision(
+            context, [frame], instructions=self.prompts['frame_analysis']
+        )
 
         return {
             'frame_index': frame_index,
@@ -282,18 +478,16 @@ Be specific and reference concrete observations from the analysis."""
         if self.api_provider == 'local':
             return self.client.analyze_temporal_sequence(frames, frame_indices or list(range(len(frames))))
 
-        # Prepare the prompt for API-based analysis
-        prompt = self.prompts['temporal_analysis']
-
         # Add frame count context
         context = f"\n\nAnalyzing {len(frames)} frames from the video.\n"
         if frame_indices:
             context += f"Frame indices: {frame_indices}\n"
 
-        prompt = context + "\n" + prompt
-
         # Call LLM with multiple frames
-        response = self._call_llm_vision(prompt, frames[:8])  # Limit to 8 frames for API constraints
+        response = self._call_llm_vision(
+            context, frames[:8],  # Limit to 8 frames for API constraints
+            instructions=self.prompts['temporal_analysis']
+        )
 
         return {
             'num_frames': len(frames),
@@ -326,9 +520,6 @@ Be specific and reference concrete observations from the analysis."""
         # Compile evidence from analyses (for API-based analysis)
         evidence = self._compile_evidence(frame_analyses, temporal_analysis)
 
-        # Prepare synthesis prompt
-        prompt = self.prompts['synthesis']
-
         # Add evidence context
         context = f"""
 Video: {metadata.get('filename', 'unknown')}
@@ -344,10 +535,8 @@ TEMPORAL OBSERVATIONS:
 
 """
 
-        full_prompt = context + "\n" + prompt
-
         # Call LLM for synthesis (text-only, no images needed)
-        response = self._call_llm_text(full_prompt)
+        response = self._call_llm_text(context, instructions=self.prompts['synthesis'])
 
         # Parse the response to extract classification and confidence
         verdict = self._parse_verdict(response)
@@ -367,12 +556,12 @@ TEMPORAL OBSERVATIONS:
     ) -> Dict[str, str]:
         """Compile evidence from analyses into structured format."""
 
-        # Summarize frame-level observations
-        frame_obs = []
-        for i, analysis in enumerate(frame_analyses):
-            frame_obs.append(f"Frame {analysis.get('frame_index', i)}: {analysis['analysis'][:200]}...")
-
-        frame_observations = "\n".join(frame_obs[:5])  # Limit to first 5 for brevity
+        # Summarize frame-level observations, formatting only the first 5
+        # (kept for brevity) rather than every frame before truncating
+        frame_observations = "\n".join(
+            f"Frame {analysis.get('frame_index', i)}: {analysis['analysis'][:200]}..."
+            for i, analysis in enumerate(frame_analyses[:5])
+        )
 
         # Temporal observations
         temporal_observations = temporal_analysis['analysis'][:500]  # Truncate if too long
@@ -392,74 +581,71 @@ TEMPORAL OBSERVATIONS:
         Returns:
             Parsed verdict dictionary
         """
-        # Default values
-        classification = "UNCERTAIN"
-        confidence = 50
-
-        # Simple keyword-based parsing
-        text_upper = synthesis_text.upper()
-
-        # Determine classification
-        if "CLASSIFICATION: FAKE" in text_upper or "VERDICT: FAKE" in text_upper:
-            classification = "FAKE"
-        elif "CLASSIFICATION: REAL" in text_upper or "VERDICT: REAL" in text_upper:
-            classification = "REAL"
-        elif "LIKELY FAKE" in text_upper or "PROBABLY FAKE" in text_upper:
-            classification = "LIKELY FAKE"
-        elif "LIKELY REAL" in text_upper or "PROBABLY REAL" in text_upper:
-            classification = "LIKELY REAL"
-
-        # Extract confidence (look for percentage)
-        import re
-        confidence_match = re.search(r'confidence:?\s*(\d+)%?', text_upper)
-        if confidence_match:
-            confidence = int(confidence_match.group(1))
+        classification, confidence = _parse_verdict_cached(synthesis_text)
 
         return {
             'classification': classification,
             'confidence': confidence
         }
 
-    def _call_llm_vision(self, prompt: str, images: List[np.ndarray]) -> str:
+    def _call_llm_vision(
+        self,
+        prompt: str,
+        images: List[np.ndarray],
+        instructions: Optional[str] = None
+    ) -> str:
         """
         Call LLM with vision capabilities.
 
         Args:
             prompt: Text prompt
             images: List of images as numpy arrays
+            instructions: Optional stable prompt template that follows the
+                prompt; sent as a cached system prefix where supported
 
         Returns:
             LLM response text
         """
         if self.api_provider == 'anthropic':
-            return self._call_anthropic_vision(prompt, images)
-        elif self.api_provider == 'openai':
+            return self._call_anthropic_vision(prompt, images, instructions)
+
+        prompt = _join_prompt(prompt, instructions)
+        if self.api_provider == 'openai':
             return self._call_openai_vision(prompt, images)
         elif self.api_provider == 'mock':
             return self._mock_vision_response(prompt, images)
         else:
             raise ValueError(f"Unsupported provider: {self.api_provider}")
 
-    def _call_llm_text(self, prompt: str) -> str:
+    def _call_llm_text(self, prompt: str, instructions: Optional[str] = None) -> str:
         """
         Call LLM for text-only analysis.
 
         Args:
             prompt: Text prompt
+            instructions: Optional stable prompt template that follows the
+                prompt; sent as a cached system prefix where supported
 
         Returns:
             LLM response text
         """
         if self.api_provider == 'anthropic':
-            return self._call_anthropic_text(prompt)
-        elif self.api_provider == 'openai':
+            return self._call_anthropic_text(prompt, instructions)
+
+        prompt = _join_prompt(prompt, instructions)
+        if self.api_provider == 'openai':
             return self._call_openai_text(prompt)
         elif self.api_provider == 'mock':
             return self._mock_text_response(prompt)
         else:
             raise ValueError(f"Unsupported provider: {self.api_provider}")
 
-    def _call_anthropic_vision(self, prompt: str, images: List[np.ndarray]) -> str:
+    def _call_anthropic_vision(
+        self,
+        prompt: str,
+        images: List[np.ndarray],
+        instructions: Optional[str] = None
+    ) -> str:
         """Call Anthropic Claude with vision."""
         # Prepare image content
         image_content = []
@@ -474,11 +660,12 @@ TEMPORAL OBSERVATIONS:
                 }
             })
 
-        # Add text prompt
-        image_content.append({
-            "type": "text",
-            "text": prompt
-        })
+        # Add text prompt (empty text blocks are rejected by the API)
+        if prompt.strip():
+            image_content.append({
+                "type": "text",
+                "text": prompt
+            })
 
         # Make API call
         response = self.client.messages.create(
@@ -487,12 +674,13 @@ TEMPORAL OBSERVATIONS:
             messages=[{
                 "role": "user",
                 "content": image_content
-            }]
+            }],
+            **_anthropic_system(instructions)
         )
 
         return response.content[0].text
 
-    def _call_anthropic_text(self, prompt: str) -> str:
+    def _call_anthropic_text(self, prompt: str, instructions: Optional[str] = None) -> str:
         """Call Anthropic Claude for text-only."""
         response = self.client.messages.create(
             model=self.model_name,
@@ -500,7 +688,8 @@ TEMPORAL OBSERVATIONS:
             messages=[{
                 "role": "user",
                 "content": prompt
-            }]
+            }],
+            **_anthropic_system(instructions)
         )
 
         return response.content[0].text
@@ -551,32 +740,8 @@ TEMPORAL OBSERVATIONS:
 
     def _mock_vision_response(self, prompt: str, images: List[np.ndarray]) -> str:
         """Generate mock response for testing without API calls."""
-        return f"""[MOCK ANALYSIS - Testing Mode]
-
-Analyzed {len(images)} frame(s).
-
-Frame observations:
-- Facial smoothing detected in central region
-- Slight lighting inconsistency between face and background
-- Minor texture artifacts around jawline
-- Resolution appears consistent
-
-Overall: Some artifacts detected that could indicate synthetic generation.
-"""
+        return _mock_vision_text(len(images))
 
     def _mock_text_response(self, prompt: str) -> str:
         """Generate mock text response for testing."""
-        return """[MOCK SYNTHESIS - Testing Mode]
-
-Classification: LIKELY FAKE
-Confidence: 70%
-
-Key evidence:
-- Multiple frames show facial smoothing artifacts
-- Lighting inconsistencies observed
-- Temporal discontinuities in motion
-
-Reasoning: The combination of visual artifacts and temporal inconsistencies
-suggests this video may be synthetically generated. However, confidence is
-moderate due to limited artifact severity.
-"""
+        return _MOCK_SYNTHESIS_RESPONSE
@@ -10,8 +10,9 @@ Building Blocks:
 """
 
 import multiprocessing as mp
+import os
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
-from typing import List, Dict, Any, Callable, Optional, Tuple
+from typing import List, Dict, Any, Callable, Optional, Sequence, Tuple
 import threading
 import queue
 import time
@@ -20,13 +21,45 @@ import numpy as np
 from pathlib import Path
 
 
+def _init_frame_worker(
+    threads_per_worker: int,
+    pin_counter=None
+) -> None:
+    """
+    Initialize a frame extraction worker process.
+
+    Caps OpenCV's internal thread pool so N workers do not each spawn
+    cpu_count() threads, optionally pins the worker to a single CPU, and
+    runs one tiny conversion so pool start-up cost is paid here rather
+    than on the first real frame.
+
+    Args:
+        threads_per_worker: Threads OpenCV may use inside this worker
+        pin_counter: Shared counter used to hand out CPU slots, or None
+            to leave scheduling to the OS
+    """
+    cv2.setNumThreads(threads_per_worker)
+
+    if pin_counter is not None and hasattr(os, 'sched_setaffinity'):
+        with pin_counter.get_lock():
+            worker_id = pin_counter.value
+            pin_counter.value += 1
+        try:
+            cpus = sorted(os.sched_getaffinity(0))
+            os.sched_setaffinity(0, {cpus[worker_id % len(cpus)]})
+        except OSError:
+            pass
+
+    cv2.cvtColor(np.zeros((8, 8, 3), dtype=np.uint8), cv2.COLOR_BGR2RGB)
+
+
 class ParallelFrameProcessor:
     """
     Building block for parallel frame extraction using multiprocessing.
 
     Input Data:
         - video_path: str, absolute path to MP4 video file
-        - frame_indices: List[int], frame indices to extract
+        - frame_indices: Sequence[int], frame indices to extract
         - num_workers: int, number of parallel processes
 
     Output Data:
@@ -37,6 +70,9 @@ class ParallelFrameProcessor:
         - max_workers: int, maximum parallel processes (default: cpu_count())
         - timeout: int, timeout in seconds for each frame (default: 30)
         - color_space: str, 'RGB' or 'BGR' (default: 'RGB')
+        - prefetch: bool, hint the kernel to read the whole video ahead (default: False)
+        - threads_per_worker: int, OpenCV threads per worker process (default: 1)
+        - pin_workers: bool, pin each worker to one CPU on Linux (default: False)
 
     Dependencies:
         - External: opencv-python, numpy
@@ -52,7 +88,10 @@ class ParallelFrameProcessor:
         self,
         max_workers: Optional[int] = None,
         timeout: int = 30,
-        color_space: str = 'RGB'
+        color_space: str = 'RGB',
+        prefetch: bool = False,
+        threads_per_worker: int = 1,
+        pin_workers: bool = False
     ):
         """
         Initialize parallel frame processor.
@@ -61,10 +100,25 @@ class ParallelFrameProcessor:
             max_workers: Maximum number of parallel workers (default: CPU count)
             timeout: Timeout for each frame extraction (default: 30 seconds)
             color_space: Output color space 'RGB' or 'BGR' (default: 'RGB')
+            prefetch: Issue a readahead hint for the whole video before
+                workers start seeking into it (default: False). Worth it only
+                for small files read many times; on a large video it pulls
+                the entire file into the page cache and evicts other data.
+            threads_per_worker: OpenCV threads per worker process (default: 1)
+            pin_workers: Pin each worker process to its own CPU (default: False)
         """
         self.max_workers = max_workers or mp.cpu_count()
         self.timeout = timeout
         self.color_space = color_space.upper()
+        self.prefetch = prefetch
+        self.threads_per_worker = threads_per_worker
+        self.pin_workers = pin_workers
+        self._pin_counter = None
+
+        if self.threads_per_worker < 1:
+            raise ValueError(
+                f"threads_per_worker must be >= 1, got: {threads_per_worker}"
+            )
 
         if self.color_space not in ['RGB', 'BGR']:
             raise ValueError(f"color_space must be 'RGB' or 'BGR', got: {color_space}")
@@ -72,7 +126,8 @@ class ParallelFrameProcessor:
     def extract_frames_parallel(
         self,
         video_path: str,
-        frame_indices: List[int]
+        frame_indices: Sequence[int],
+        resource_manager: Optional['ResourceManager'] = None
     ) -> Tuple[List[np.ndarray], Dict[str, Any]]:
         """
         Extract multiple frames in parallel using process pool.
@@ -80,6 +135,8 @@ class ParallelFrameProcessor:
         Args:
             video_path: Path to video file
             frame_indices: List of frame indices to extract
+            resource_manager: Optional ResourceManager whose long-lived process
+                pool is reused instead of starting a new pool for this call
 
         Returns:
             Tuple of (frames, metadata) where:
@@ -95,51 +152,125 @@ class ParallelFrameProcessor:
         if not Path(video_path).exists():
             raise FileNotFoundError(f"Video not found: {video_path}")
 
+        # Warm the page cache so worker seeks hit memory instead of disk
+        if self.prefetch and frame_indices:
+            self._prefetch_file(video_path)
+
+        # One counter per processor, so a manager's pool keyed on these
+        # options is found again on the next call
+        if self.pin_workers and self._pin_counter is None:
+            self._pin_counter = mp.Value('i', 0)
+        pool_options = {
+            'max_workers': self.max_workers,
+            'initializer': _init_frame_worker,
+            'initargs': (self.threads_per_worker, self._pin_counter)
+        }
+
         # Use process pool for CPU-bound frame extraction
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all extraction tasks
-            future_to_index = {
-                executor.submit(
-                    self._extract_single_frame,
-                    video_path,
-                    idx,
-                    self.color_space
-                ): idx for idx in frame_indices
-            }
+        if resource_manager is not None:
+            executor = resource_manager.get_process_pool(**pool_options)
+            frames, failed_indices = self._collect_frames(
+                executor, video_path, frame_indices
+            )
+        else:
+            with ProcessPoolExecutor(**pool_options) as executor:
+                frames, failed_indices = self._collect_frames(
+                    executor, video_path, frame_indices
+                )
 
-            # Collect results
-            frames_dict = {}
-            failed_indices = []
+        elapsed_time = time.time() - start_time
 
-            for future in as_completed(future_to_index, timeout=self.timeout * len(frame_indices)):
-                idx = future_to_index[future]
-                try:
-                    frame = future.result(timeout=self.timeout)
-                    if frame is not None:
-                        frames_dict[idx] = frame
-                    else:
-                        failed_indices.append(idx)
-                except Exception as e:
-                    print(f"Warning: Frame {idx} extraction failed: {e}")
+        metadata = {
+            'total_frames_requested': len(frame_indices),
+            'total_frames_extracted': len(frames),
+            'failed_frames': len(failed_indices),
+            'failed_indices': failed_indices,
+            'workers_used': self.max_workers,
+            'extraction_time_seconds': elapsed_time,
+            'frames_per_second': len(frames) / elapsed_time if elapsed_time > 0 else 0
+        }
+
+        return frames, metadata
+
+    def _collect_frames(
+        self,
+        executor: ProcessPoolExecutor,
+        video_path: str,
+        frame_indices: Sequence[int]
+    ) -> Tuple[List[np.ndarray], List[int]]:
+        """
+        Submit extraction tasks to an executor and gather results in index order.
+
+        Args:
+            executor: Process pool to run extraction tasks on
+            video_path: Path to video file
+            frame_indices: List of frame indices to extract
+
+        Returns:
+            Tuple of (frames sorted by index, failed frame indices)
+        """
+        # Submit all extraction tasks
+        future_to_index = {
+            executor.submit(
+                self._extract_single_frame,
+                video_path,
+                idx,
+                self.color_space
+            ): idx for idx in frame_indices
+        }
+
+        # Collect results
+        frames_dict = {}
+        failed_indices = []
+
+        for future in as_completed(future_to_index, timeout=self.timeout * len(frame_indices)):
+            idx = future_to_index[future]
+            try:
+                frame = future.result(timeout=self.timeout)
+                if frame is not None:
+                    frames_dict[idx] = frame
+                else:
                     failed_indices.append(idx)
+            except Exception as e:
+                print(f"Warning: Frame {idx} extraction failed: {e}")
+                failed_indices.append(idx)
 
-            # Sort frames by index to maintain order
-            sorted_indices = sorted(frames_dict.keys())
-            frames = [frames_dict[i] for i in sorted_indices]
+        # Sort frames by index to maintain order
+        sorted_indices = sorted(frames_dict.keys())
+        frames = [frames_dict[i] for i in sorted_indices]
 
-            elapsed_time = time.time() - start_time
+        return frames, failed_indices
 
-            metadata = {
-                'total_frames_requested': len(frame_indices),
-                'total_frames_extracted': len(frames),
-                'failed_frames': len(failed_indices),
-                'failed_indices': failed_indices,
-                'workers_used': self.max_workers,
-                'extraction_time_seconds': elapsed_time,
-                'frames_per_second': len(frames) / elapsed_time if elapsed_time > 0 else 0
-            }
+    @staticmethod
+    def _prefetch_file(video_path: str) -> bool:
+        """
+        Ask the kernel to start reading the whole video file into the page cache.
+
+        Workers each open the file and seek to scattered offsets; a single
+        POSIX_FADV_WILLNEED lets the kernel batch those reads up front instead
+        of serving many small random reads on demand.
+
+        Args:
+            video_path: Path to video file
+
+        Returns:
+            True if the hint was issued, False if unsupported or it failed
+        """
+        if not hasattr(os, 'posix_fadvise'):
+            return False
 
-            return frames, metadata
+        try:
+            fd = os.open(video_path, os.O_RDONLY)
+        except OSError:
+            return False
+
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            return True
+        except OSError:
+            return False
+        finally:
+            os.close(fd)
 
     @staticmethod
     def _extract_single_frame(
@@ -185,7 +316,7 @@ class ParallelFrameProcessor:
     def benchmark_speedup(
         self,
         video_path: str,
-        frame_indices: List[int]
+        frame_indices: Sequence[int]
     ) -> Dict[str, Any]:
         """
         Benchmark parallel vs sequential extraction.
@@ -229,7 +360,7 @@ class ParallelLLMAnalyzer:
     Input Data:
         - frames: List[np.ndarray], frames to analyze
         - analysis_function: Callable, function to call for each frame
-        - frame_indices: Optional[List[int]], frame indices for context
+        - frame_indices: Optional[Sequence[int]], frame indices for context
 
     Output Data:
         - analyses: List[Dict], analysis results for each frame
@@ -274,7 +405,7 @@ class ParallelLLMAnalyzer:
         self,
         frames: List[np.ndarray],
         analysis_function: Callable,
-        frame_indices: Optional[List[int]] = None,
+        frame_indices: Optional[Sequence[int]] = None,
         **kwargs
     ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """
@@ -382,16 +513,77 @@ class ParallelLLMAnalyzer:
 
 class ResourceManager:
     """
-    Context manager for cleaning up multiprocessing resources.
+    Context manager that owns long-lived executors and cleans them up.
 
-    Ensures all processes and threads are properly terminated even if
+    Pools are created lazily on first request and reused across calls, so
+    batch pipelines pay worker start-up once instead of once per video.
+    All processes and threads are properly terminated on exit, even if
     exceptions occur.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_threads: Optional[int] = None
+    ):
+        """
+        Initialize resource manager.
+
+        Args:
+            max_workers: Default size of the process pool (default: CPU count)
+            max_threads: Default size of the thread pool (default: executor default)
+        """
+        self.max_workers = max_workers
+        self.max_threads = max_threads
+        self.process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pools: List[Tuple[Dict[str, Any], ProcessPoolExecutor]] = []
+        self.thread_pool: Optional[ThreadPoolExecutor] = None
         self.active_pools = []
         self.active_executors = []
 
+    def get_process_pool(self, **kwargs) -> ProcessPoolExecutor:
+        """
+        Get a shared process pool, creating it on first use.
+
+        Pools are keyed on their creation options, so callers asking for a
+        different initializer or worker count get their own pool rather than
+        one configured for someone else.
+
+        Args:
+            **kwargs: ProcessPoolExecutor options for the pool
+
+        Returns:
+            Shared ProcessPoolExecutor instance for these options
+        """
+        kwargs.setdefault('max_workers', self.max_workers)
+        for options, pool in self._process_pools:
+            if options == kwargs:
+                return pool
+
+        pool = ProcessPoolExecutor(**kwargs)
+        self._process_pools.append((kwargs, pool))
+        self.active_executors.append(pool)
+        if self.process_pool is None:
+            self.process_pool = pool
+        return pool
+
+    def get_thread_pool(self, **kwargs) -> ThreadPoolExecutor:
+        """
+        Get the shared thread pool, creating it on first use.
+
+        Args:
+            **kwargs: ThreadPoolExecutor options used when the pool is created
+                (ignored once the pool exists)
+
+        Returns:
+            Shared ThreadPoolExecutor instance
+        """
+        if self.thread_pool is None:
+            kwargs.setdefault('max_workers', self.max_threads)
+            self.thread_pool = ThreadPoolExecutor(**kwargs)
+            self.active_executors.append(self.thread_pool)
+        return self.thread_pool
+
     def __enter__(self):
         return self
 
@@ -402,7 +594,13 @@ class ResourceManager:
             pool.join()
 
         for executor in self.active_executors:
-            executor.shutdown(wait=True)
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        self.active_pools = []
+        self.active_executors = []
+        self.process_pool = None
+        self._process_pools = []
+        self.thread_pool = None
 
         return False  # Don't suppress exceptions
 
@@ -7,7 +7,8 @@ Provides extensibility through a plugin architecture that allows users to:
 - Extend the detection pipeline
 """
 
-from typing import Dict, List, Any, Callable, Protocol, Optional
+from typing import Dict, List, Any, Callable, ClassVar, Iterable, Protocol, Optional, Mapping, Tuple
+from types import ModuleType
 from pathlib import Path
 import importlib.util
 import inspect
@@ -90,6 +91,19 @@ class PluginManager:
     Manages plugin registration, discovery, and execution.
     """
 
+    __slots__ = (
+        'plugins_dir',
+        'frame_samplers',
+        'analysis_hooks',
+        'logger',
+        '_plugin_info_cache',
+        '_pre_hooks',
+        '_post_hooks',
+    )
+
+    # Imported plugin modules: path -> (mtime_ns, module), shared by all managers
+    _module_cache: ClassVar[Dict[str, Tuple[int, ModuleType]]] = {}
+
     def __init__(self, plugins_dir: str = "plugins"):
         """
         Initialize plugin manager.
@@ -101,6 +115,9 @@ class PluginManager:
         self.frame_samplers: Dict[str, FrameSamplerPlugin] = {}
         self.analysis_hooks: Dict[str, AnalysisHookPlugin] = {}
         self.logger = logging.getLogger('PluginManager')
+        self._plugin_info_cache: Optional[Dict[str, Any]] = None
+        self._pre_hooks: Tuple[Tuple[str, Callable], ...] = ()
+        self._post_hooks: Tuple[Tuple[str, Callable], ...] = ()
 
         # Register built-in plugins
         self._register_builtin_plugins()
@@ -126,20 +143,60 @@ class PluginManager:
         Raises:
             ValueError: If plugin name already exists and overwrite=False
         """
+        self.register_frame_samplers((plugin,), overwrite=overwrite)
+
+    def register_frame_samplers(
+        self,
+        plugins: Iterable[FrameSamplerPlugin],
+        overwrite: bool = False
+    ) -> None:
+        """
+        Register several frame sampler plugins at once.
+
+        Every plugin is validated before any is added, so a bad plugin leaves
+        the registry untouched.
+
+        Args:
+            plugins: Plugin instances implementing FrameSamplerPlugin protocol
+            overwrite: Allow overwriting existing plugins with the same names
+
+        Raises:
+            ValueError: If a plugin is invalid, or a name is already registered
+                (or repeated in plugins) and overwrite=False
+        """
+        new = {}
+        for plugin in plugins:
+            self._check_frame_sampler(plugin, overwrite, new)
+            new[plugin.name] = plugin
+
+        self.frame_samplers.update(new)
+        self._plugin_info_cache = None
+        for name in new:
+            self.logger.info(f"Registered frame sampler plugin: {name}")
+
+    def _check_frame_sampler(
+        self,
+        plugin: FrameSamplerPlugin,
+        overwrite: bool,
+        pending: Mapping[str, Any]
+    ) -> None:
+        """
+        Validate a frame sampler against the registry and a pending batch.
+
+        Raises:
+            ValueError: If the plugin is invalid or its name is taken
+        """
         if not hasattr(plugin, 'name') or not hasattr(plugin, 'sample_frames'):
             raise ValueError(
                 "Plugin must have 'name' attribute and 'sample_frames' method"
             )
 
-        if plugin.name in self.frame_samplers and not overwrite:
+        if not overwrite and (plugin.name in self.frame_samplers or plugin.name in pending):
             raise ValueError(
                 f"Frame sampler plugin '{plugin.name}' already registered. "
                 f"Use overwrite=True to replace."
             )
 
-        self.frame_samplers[plugin.name] = plugin
-        self.logger.info(f"Registered frame sampler plugin: {plugin.name}")
-
     def register_analysis_hook(
         self,
         plugin: AnalysisHookPlugin,
@@ -155,17 +212,76 @@ class PluginManager:
         Raises:
             ValueError: If plugin name already exists and overwrite=False
         """
+        self.register_analysis_hooks((plugin,), overwrite=overwrite)
+
+    def register_analysis_hooks(
+        self,
+        plugins: Iterable[AnalysisHookPlugin],
+        overwrite: bool = False
+    ) -> None:
+        """
+        Register several analysis hook plugins at once.
+
+        Every plugin is validated before any is added, and the cached hook
+        lists are rebuilt once for the whole batch.
+
+        Args:
+            plugins: Plugin instances implementing AnalysisHookPlugin protocol
+            overwrite: Allow overwriting existing plugins with the same names
+
+        Raises:
+            ValueError: If a plugin is invalid, or a name is already registered
+                (or repeated in plugins) and overwrite=False
+        """
+        new = {}
+        for plugin in plugins:
+            self._check_analysis_hook(plugin, overwrite, new)
+            new[plugin.name] = plugin
+
+        self.analysis_hooks.update(new)
+        self._plugin_info_cache = None
+        self._rebuild_hook_lists()
+        for name in new:
+            self.logger.info(f"Registered analysis hook plugin: {name}")
+
+    def _check_analysis_hook(
+        self,
+        plugin: AnalysisHookPlugin,
+        overwrite: bool,
+        pending: Mapping[str, Any]
+    ) -> None:
+        """
+        Validate an analysis hook against the registry and a pending batch.
+
+        Raises:
+            ValueError: If the plugin is invalid or its name is taken
+        """
         if not hasattr(plugin, 'name'):
             raise ValueError("Plugin must have 'name' attribute")
 
-        if plugin.name in self.analysis_hooks and not overwrite:
+        if not overwrite and (plugin.name in self.analysis_hooks or plugin.name in pending):
             raise ValueError(
                 f"Analysis hook plugin '{plugin.name}' already registered. "
                 f"Use overwrite=True to replace."
             )
 
-        self.analysis_hooks[plugin.name] = plugin
-        self.logger.info(f"Registered analysis hook plugin: {plugin.name}")
+    def _rebuild_hook_lists(self) -> None:
+        """
+        Snapshot the bound pre/post hook methods of registered analysis hooks.
+
+        The execute_* methods run once per analyzed video, so the hasattr
+        checks and attribute lookups are paid here, at registration time.
+        """
+        self._pre_hooks = tuple(
+            (name, plugin.pre_analysis_hook)
+            for name, plugin in self.analysis_hooks.items()
+            if hasattr(plugin, 'pre_analysis_hook')
+        )
+        self._post_hooks = tuple(
+            (name, plugin.post_analysis_hook)
+            for name, plugin in self.analysis_hooks.items()
+            if hasattr(plugin, 'post_analysis_hook')
+        )
 
     def get_frame_sampler(self, name: str) -> Optional[FrameSamplerPlugin]:
         """
@@ -209,10 +325,9 @@ class PluginManager:
             frames: List of extracted frames
             metadata: Video metadata
         """
-        for name, plugin in self.analysis_hooks.items():
+        for name, hook in self._pre_hooks:
             try:
-                if hasattr(plugin, 'pre_analysis_hook'):
-                    plugin.pre_analysis_hook(frames, metadata)
+                hook(frames, metadata)
             except Exception as e:
                 self.logger.warning(
                     f"Pre-analysis hook '{name}' failed: {e}"
@@ -230,10 +345,9 @@ class PluginManager:
             analyses: List of analysis results
             metadata: Video metadata
         """
-        for name, plugin in self.analysis_hooks.items():
+        for name, hook in self._post_hooks:
             try:
-                if hasattr(plugin, 'post_analysis_hook'):
-                    plugin.post_analysis_hook(analyses, metadata)
+                hook(analyses, metadata)
             except Exception as e:
                 self.logger.warning(
                     f"Post-analysis hook '{name}' failed: {e}"
@@ -258,7 +372,8 @@ class PluginManager:
             self.logger.warning(f"Plugins directory not found: {search_dir}")
             return 0
 
-        loaded_count = 0
+        samplers: Dict[str, FrameSamplerPlugin] = {}
+        hooks: Dict[str, AnalysisHookPlugin] = {}
 
         # Find all .py files in plugins directory
         for plugin_file in search_dir.glob("*.py"):
@@ -266,23 +381,16 @@ class PluginManager:
                 continue  # Skip private files
 
             try:
-                # Load module dynamically
-                spec = importlib.util.spec_from_file_location(
-                    plugin_file.stem,
-                    plugin_file
-                )
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-
+                module = self._import_plugin_module(plugin_file)
+                if module is not None:
                     # Find plugin classes
                     for name, obj in inspect.getmembers(module, inspect.isclass):
                         # Try to register as frame sampler
                         if hasattr(obj, 'sample_frames'):
                             try:
                                 instance = obj()
-                                self.register_frame_sampler(instance)
-                                loaded_count += 1
+                                self._check_frame_sampler(instance, False, samplers)
+                                samplers[instance.name] = instance
                             except Exception as e:
                                 self.logger.warning(
                                     f"Failed to register {name} from {plugin_file.name}: {e}"
@@ -292,8 +400,8 @@ class PluginManager:
                         elif hasattr(obj, 'pre_analysis_hook') or hasattr(obj, 'post_analysis_hook'):
                             try:
                                 instance = obj()
-                                self.register_analysis_hook(instance)
-                                loaded_count += 1
+                                self._check_analysis_hook(instance, False, hooks)
+                                hooks[instance.name] = instance
                             except Exception as e:
                                 self.logger.warning(
                                     f"Failed to register {name} from {plugin_file.name}: {e}"
@@ -302,31 +410,72 @@ class PluginManager:
             except Exception as e:
                 self.logger.error(f"Failed to load plugin file {plugin_file.name}: {e}")
 
+        # Already validated one by one above; register each kind in one batch
+        self.register_frame_samplers(samplers.values())
+        self.register_analysis_hooks(hooks.values())
+
+        loaded_count = len(samplers) + len(hooks)
         self.logger.info(f"Loaded {loaded_count} plugins from {search_dir}")
         return loaded_count
 
+    @classmethod
+    def _import_plugin_module(cls, plugin_file: Path) -> Optional[ModuleType]:
+        """
+        Import a plugin file, reusing the module while the file is unchanged.
+
+        Repeat loads (e.g. reload loops) skip re-executing unchanged plugin
+        files; editing a file changes its mtime and triggers a fresh import.
+
+        Args:
+            plugin_file: Path to the plugin's .py file
+
+        Returns:
+            Imported module, or None if no loader is available for the file
+        """
+        path = str(plugin_file.resolve())
+        mtime_ns = plugin_file.stat().st_mtime_ns
+        cached = cls._module_cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        spec = importlib.util.spec_from_file_location(plugin_file.stem, plugin_file)
+        if not spec or not spec.loader:
+            return None
+
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        cls._module_cache[path] = (mtime_ns, module)
+        return module
+
     def get_plugin_info(self) -> Dict[str, Any]:
         """
         Get information about all registered plugins.
 
+        The info is built once per registration change and cached internally;
+        each call returns a fresh copy that the caller may mutate or serialize.
+
         Returns:
             Dictionary with plugin information
         """
+        if self._plugin_info_cache is None:
+            self._plugin_info_cache = {
+                'frame_samplers': self._describe_plugins(self.frame_samplers),
+                'analysis_hooks': self._describe_plugins(self.analysis_hooks)
+            }
+        return {
+            kind: {name: dict(info) for name, info in plugins.items()}
+            for kind, plugins in self._plugin_info_cache.items()
+        }
+
+    @staticmethod
+    def _describe_plugins(plugins: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+        """Build a name -> info dictionary for a plugin registry."""
         return {
-            'frame_samplers': {
-                name: {
-                    'name': plugin.name,
-                    'description': getattr(plugin, 'description', 'No description')
-                }
-                for name, plugin in self.frame_samplers.items()
-            },
-            'analysis_hooks': {
-                name: {
-                    'name': plugin.name,
-                    'description': getattr(plugin, 'description', 'No description')
-                }
-                for name, plugin in self.analysis_hooks.items()
+            name: {
+                'name': plugin.name,
+                'description': getattr(plugin, 'description', 'No description')
             }
+            for name, plugin in plugins.items()
         }
 
 
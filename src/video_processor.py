@@ -5,14 +5,330 @@ Handles video loading, frame extraction, and metadata extraction
 for deepfake detection analysis.
 """
 
-import cv2
+import functools
 import json
+import math
+import mmap
+import os
+import queue
+import shutil
+import stat
+import struct
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
 import numpy as np
 
 
+_cv2 = None
+
+
+def _get_cv2():
+    """Import OpenCV on first use, keeping module import cheap."""
+    global _cv2
+    if _cv2 is None:
+        import cv2
+        _cv2 = cv2
+    return _cv2
+
+
+@functools.lru_cache(maxsize=None)
+def _pyav():
+    """Import PyAV once, returning None when it is not installed."""
+    try:
+        import av
+        return av
+    except ImportError:
+        return None
+
+
+@functools.lru_cache(maxsize=128)
+def _run_ffprobe(path: str, mtime_ns: int, size: int) -> str:
+    """
+    Run ffprobe on a file and return its JSON output (memoized).
+
+    The modification time and size are part of the cache key so that a file
+    rewritten in place is probed again.
+
+    Args:
+        path: Path to video file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Raw ffprobe JSON output
+    """
+    return _ffprobe_output(path)
+
+
+def _ffprobe_output(path: str) -> str:
+    """
+    Run ffprobe on a file and return its JSON output.
+
+    Args:
+        path: Path to video file
+
+    Returns:
+        Raw ffprobe JSON output
+
+    Raises:
+        subprocess.CalledProcessError: If ffprobe fails
+    """
+    # Ask only for the first video stream and the fields extract_metadata reads
+    cmd = [
+        'ffprobe',
+        '-v', 'quiet',
+        '-print_format', 'json',
+        '-select_streams', 'v:0',
+        '-show_entries',
+        'stream=codec_type,codec_name,width,height,r_frame_rate,nb_frames'
+        ':stream_tags=rotate:stream_side_data=rotation'
+        ':format=duration,size,bit_rate',
+        path
+    ]
+
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    return result.stdout
+
+
+# MP4 sample entry fourcc -> ffprobe codec_name
+_MP4_CODECS = {
+    b'avc1': 'h264',
+    b'avc3': 'h264',
+    b'hvc1': 'hevc',
+    b'hev1': 'hevc',
+    b'av01': 'av1',
+    b'vp09': 'vp9',
+    b'mp4v': 'mpeg4',
+}
+
+
+def _iter_mp4_boxes(buf, start: int, end: int):
+    """
+    Yield (type, payload_start, box_end) for the boxes in buf[start:end].
+
+    Raises:
+        ValueError: If a box header is malformed or runs past the parent box
+    """
+    pos = start
+    while pos + 8 <= end:
+        size, kind = struct.unpack_from('>I4s', buf, pos)
+        header = 8
+        if size == 1:
+            size, = struct.unpack_from('>Q', buf, pos + 8)
+            header = 16
+        elif size == 0:
+            size = end - pos
+
+        if size < header or pos + size > end:
+            raise ValueError(f"Malformed MP4 box {kind!r} at offset {pos}")
+
+        yield kind, pos + header, pos + size
+        pos += size
+
+
+def _find_mp4_box(buf, start: int, end: int, *path: bytes) -> Optional[Tuple[int, int]]:
+    """Find a nested box by type path, returning its (payload_start, box_end)."""
+    for kind, payload, box_end in _iter_mp4_boxes(buf, start, end):
+        if kind == path[0]:
+            if len(path) == 1:
+                return payload, box_end
+            return _find_mp4_box(buf, payload, box_end, *path[1:])
+    return None
+
+
+def _mp4_timing(buf, payload: int) -> Tuple[int, int]:
+    """Read (timescale, duration) from an mvhd or mdhd box payload."""
+    if buf[payload] == 1:
+        return struct.unpack_from('>IQ', buf, payload + 20)
+    return struct.unpack_from('>II', buf, payload + 12)
+
+
+def _mp4_rotation(buf, payload: int) -> int:
+    """Read the clockwise display rotation (0/90/180/270) from a tkhd box payload."""
+    # The matrix follows the version-dependent times and 16 bytes of fields
+    matrix = payload + (36 if buf[payload] == 1 else 24) + 16
+    a, b = struct.unpack_from('>ii', buf, matrix)
+    return _round_rotation(math.degrees(math.atan2(b, a)))
+
+
+def _round_rotation(degrees: float) -> int:
+    """Snap an angle to the nearest multiple of 90 in [0, 360)."""
+    return int(round(degrees / 90.0)) * 90 % 360
+
+
+def _ffprobe_rotation(stream: Dict) -> int:
+    """
+    Get the clockwise display rotation of an ffprobe video stream.
+
+    Newer FFmpeg reports a display matrix side data entry (counterclockwise
+    degrees); older versions a 'rotate' tag (clockwise degrees).
+    """
+    for side_data in stream.get('side_data_list', []):
+        if 'rotation' in side_data:
+            return _round_rotation(-float(side_data['rotation']))
+    try:
+        return _round_rotation(float(stream.get('tags', {}).get('rotate', 0)))
+    except ValueError:
+        return 0
+
+
+def _read_mp4_metadata(path: str) -> Optional[Dict]:
+    """
+    Read basic video metadata straight from a memory-mapped MP4 moov box.
+
+    Walks moov/mvhd for the duration and the first video trak for the frame
+    count (stsz), frame rate (stts), dimensions and codec (stsd) and display
+    rotation (tkhd), so the common case needs no ffprobe process.
+
+    Args:
+        path: Path to video file
+
+    Returns:
+        Dictionary with duration, size_bytes, bitrate, width, height, codec,
+        fps, total_frames and rotation, or None if the file cannot be handled (no moov,
+        fragmented MP4, no video track, unknown codec)
+
+    Raises:
+        OSError: If the file cannot be opened or mapped
+        ValueError: If the container structure is malformed
+    """
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        size = len(buf)
+        moov = _find_mp4_box(buf, 0, size, b'moov')
+        if moov is None:
+            return None
+
+        mvhd = _find_mp4_box(buf, *moov, b'mvhd')
+        if mvhd is None:
+            return None
+        timescale, duration = _mp4_timing(buf, mvhd[0])
+        if not timescale or not duration:
+            return None
+        duration_s = duration / timescale
+
+        for kind, trak_start, trak_end in _iter_mp4_boxes(buf, *moov):
+            if kind != b'trak':
+                continue
+
+            hdlr = _find_mp4_box(buf, trak_start, trak_end, b'mdia', b'hdlr')
+            if hdlr is None or buf[hdlr[0] + 8:hdlr[0] + 12] != b'vide':
+                continue
+
+            tkhd = _find_mp4_box(buf, trak_start, trak_end, b'tkhd')
+            mdhd = _find_mp4_box(buf, trak_start, trak_end, b'mdia', b'mdhd')
+            stbl = _find_mp4_box(buf, trak_start, trak_end, b'mdia', b'minf', b'stbl')
+            if tkhd is None or mdhd is None or stbl is None:
+                return None
+            track_timescale, _ = _mp4_timing(buf, mdhd[0])
+
+            stsd = _find_mp4_box(buf, *stbl, b'stsd')
+            stts = _find_mp4_box(buf, *stbl, b'stts')
+            stsz = _find_mp4_box(buf, *stbl, b'stsz')
+            if stsd is None or stts is None or stsz is None:
+                return None
+
+            # First sample entry: fourcc, then width/height 24 bytes into it
+            codec = _MP4_CODECS.get(buf[stsd[0] + 12:stsd[0] + 16])
+            width, height = struct.unpack_from('>HH', buf, stsd[0] + 40)
+
+            _, total_frames = struct.unpack_from('>II', buf, stsz[0] + 4)
+
+            # Nominal rate from the most common sample duration
+            entry_count, = struct.unpack_from('>I', buf, stts[0] + 4)
+            entries = [
+                struct.unpack_from('>II', buf, stts[0] + 8 + 8 * i)
+                for i in range(entry_count)
+            ]
+            delta = max(entries)[1] if entries else 0
+
+            # Fragmented files keep samples outside moov; let ffprobe handle them
+            if not codec or not total_frames or not delta or not track_timescale:
+                return None
+
+            return {
+                'duration': duration_s,
+                'size_bytes': size,
+                'bitrate': int(size * 8 / duration_s),
+                'width': width,
+                'height': height,
+                'codec': codec,
+                'fps': track_timescale / delta,
+                'total_frames': total_frames,
+                'rotation': _mp4_rotation(buf, tkhd[0]),
+            }
+
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _uniform_indices(total_frames: int, num_frames: int) -> Tuple[int, ...]:
+    """
+    Evenly spaced frame indices.
+
+    Pure function of its integer arguments, cached because batch runs see the
+    same (frame count, sample count) pairs over and over.
+
+    Args:
+        total_frames: Total number of frames in video
+        num_frames: Number of frames to sample
+
+    Returns:
+        Tuple of frame indices
+    """
+    if total_frames <= num_frames:
+        # If video has fewer frames than requested, take all
+        return tuple(range(total_frames))
+
+    # Calculate evenly spaced indices
+    step = total_frames / num_frames
+    indices = (np.arange(num_frames) * step).astype(np.int64)
+
+    return tuple(indices.tolist())
+
+
+@functools.lru_cache(maxsize=256)
+def _adaptive_indices(total_frames: int, num_frames: int) -> Tuple[int, ...]:
+    """
+    Frame indices weighted towards the start and end of the video.
+
+    Args:
+        total_frames: Total number of frames in video
+        num_frames: Number of frames to sample
+
+    Returns:
+        Tuple of sorted, unique frame indices
+    """
+    # Simplified adaptive sampling - includes more frames from beginning/end
+    # where artifacts are often more visible
+
+    # Take more samples from first and last 20% of video
+    first_20_percent = int(total_frames * 0.2)
+    last_20_percent = int(total_frames * 0.8)
+
+    # First 20%: 40% of frames
+    num_first = int(num_frames * 0.4)
+    step = max(1, first_20_percent // num_first)
+    first = np.arange(0, first_20_percent, step)[:num_first]
+
+    # Middle 60%: 20% of frames
+    num_middle = int(num_frames * 0.2)
+    step = max(1, (last_20_percent - first_20_percent) // num_middle)
+    middle = np.arange(first_20_percent, last_20_percent, step)[:num_middle]
+
+    # Last 20%: 40% of frames
+    num_last = num_frames - len(first) - len(middle)
+    step = max(1, (total_frames - last_20_percent) // num_last)
+    last = np.arange(last_20_percent, total_frames, step)[:num_last]
+
+    # Dedup and sort in one pass
+    indices = np.unique(np.concatenate([first, middle, last]).astype(np.int64))
+
+    return tuple(indices[:num_frames].tolist())
+
+
 class VideoProcessor:
     """
     Processes MP4 videos for deepfake detection analysis.
@@ -23,46 +339,131 @@ class VideoProcessor:
     - Preprocessing and normalization
     """
 
-    def __init__(self, video_path: str, num_frames: int = 10):
+    # Average gap between sampled frames above which seeking to each index
+    # beats decoding every frame in between
+    SEEK_GAP_THRESHOLD = 500
+
+    # Decoded frames buffered between the decode thread and RGB conversion
+    PIPELINE_DEPTH = 4
+
+    def __init__(
+        self,
+        video_path: str,
+        num_frames: int = 10,
+        use_ffmpeg: bool = True,
+        zero_copy_rgb: bool = False,
+        target_size: Optional[Tuple[int, int]] = None,
+        hw_accel: bool = True,
+        store_as_jpeg: bool = False,
+        use_pyav: bool = False,
+        *,
+        _skip_validate: bool = False
+    ):
         """
         Initialize video processor.
 
+        Frames are decoded by the first available of: PyAV (only with
+        use_pyav=True), the ffmpeg binary (with use_ffmpeg=True), then OpenCV.
+        hw_accel and zero_copy_rgb apply to the OpenCV path only.
+
         Args:
             video_path: Path to MP4 video file
             num_frames: Number of frames to extract (default: 10)
+            use_ffmpeg: Extract frames in a single pass of the ffmpeg binary
+                when it is on PATH, falling back to OpenCV (default: True)
+            zero_copy_rgb: On the OpenCV path, return RGB frames as reversed
+                channel views of the decoded BGR buffers instead of converting
+                them (default: False). The views are not C-contiguous, so
+                OpenCV calls on them copy internally; enable only when the
+                consumer is NumPy/PIL-based or makes its own contiguous copy.
+            target_size: Optional (width, height) to downscale frames to while
+                decoding, so later conversion and storage touch fewer pixels
+                (default: None, keep the source resolution)
+            hw_accel: Ask OpenCV's FFmpeg backend for any available hardware
+                decoder (VA-API, NVDEC, ...), falling back to software decode
+                (default: True)
+            store_as_jpeg: Keep extracted frames as in-memory JPEG bytes
+                (quality 90) instead of raw RGB arrays, decoding them only on
+                access via get_frame() (default: False)
+            use_pyav: Try decoding in-process with PyAV, when installed, before
+                any other path; skipped for rotated videos (default: False)
+            _skip_validate: Skip the file existence check, for callers that
+                mock out all file access (default: False)
         """
         self.video_path = Path(video_path)
         self.num_frames = num_frames
+        self.use_ffmpeg = use_ffmpeg
+        self.zero_copy_rgb = zero_copy_rgb
+        self.target_size = tuple(target_size) if target_size else None
+        self.hw_accel = hw_accel
+        self.store_as_jpeg = store_as_jpeg
+        self.use_pyav = use_pyav
+        self.frame_jpegs = []
         self.metadata = None
-        self.frames = []
+        self._frame_list = []
+        self._cap = None
 
         # Validate video exists
-        if not self.video_path.exists():
+        if not _skip_validate and not self.video_path.exists():
             raise FileNotFoundError(f"Video file not found: {video_path}")
 
         if not self.video_path.suffix.lower() == '.mp4':
             raise ValueError(f"Only MP4 files supported, got: {self.video_path.suffix}")
 
+        if self.target_size is not None and (
+            len(self.target_size) != 2 or min(self.target_size) <= 0
+        ):
+            raise ValueError(f"target_size must be (width, height), got: {target_size}")
+
+    @classmethod
+    def from_cached_metadata(
+        cls,
+        video_path: str,
+        metadata: Dict,
+        num_frames: int = 10,
+        **kwargs
+    ) -> 'VideoProcessor':
+        """
+        Create a processor with already-known metadata, skipping ffprobe.
+
+        Args:
+            video_path: Path to MP4 video file
+            metadata: Metadata dictionary as returned by extract_metadata()
+            num_frames: Number of frames to extract (default: 10)
+            **kwargs: Additional VideoProcessor options
+
+        Returns:
+            VideoProcessor with metadata pre-populated
+        """
+        processor = cls(video_path, num_frames=num_frames, **kwargs)
+        processor.metadata = dict(metadata)
+        return processor
+
     def extract_metadata(self) -> Dict:
         """
-        Extract video metadata using ffprobe.
+        Extract video metadata, reading the MP4 container directly when possible.
+
+        Falls back to ffprobe for files the container parser cannot handle
+        (fragmented MP4, unknown codecs, malformed boxes).
 
         Returns:
             Dictionary containing video metadata (resolution, duration, fps, codec, etc.)
         """
+        fast_metadata = self._fast_metadata()
+        if fast_metadata is not None:
+            self.metadata = fast_metadata
+            return self.metadata
+
         try:
-            # Use ffprobe to extract metadata
-            cmd = [
-                'ffprobe',
-                '-v', 'quiet',
-                '-print_format', 'json',
-                '-show_format',
-                '-show_streams',
-                str(self.video_path)
-            ]
+            # Use ffprobe to extract metadata (memoized per file version)
+            try:
+                st = self.video_path.stat()
+            except OSError:
+                output = _ffprobe_output(str(self.video_path))
+            else:
+                output = _run_ffprobe(str(self.video_path), st.st_mtime_ns, st.st_size)
 
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            probe_data = json.loads(result.stdout)
+            probe_data = json.loads(output)
 
             # Extract video stream info
             video_stream = None
@@ -89,6 +490,7 @@ class VideoProcessor:
                 'codec': video_stream.get('codec_name', 'unknown'),
                 'fps': self._parse_fps(video_stream.get('r_frame_rate', '0/1')),
                 'total_frames': int(video_stream.get('nb_frames', 0)),
+                'rotation': _ffprobe_rotation(video_stream),
             }
 
             return self.metadata
@@ -98,10 +500,44 @@ class VideoProcessor:
         except json.JSONDecodeError as e:
             raise RuntimeError(f"Failed to parse ffprobe output: {e}")
 
-    def _parse_fps(self, fps_string: str) -> float:
+    def _fast_metadata(self) -> Optional[Dict]:
+        """
+        Build the metadata dictionary from the MP4 moov box, without ffprobe.
+
+        Returns:
+            Metadata dictionary, or None if the caller should use ffprobe
+        """
+        try:
+            info = _read_mp4_metadata(str(self.video_path))
+        except (OSError, ValueError, struct.error):
+            return None
+
+        if info is None:
+            return None
+
+        return {
+            'filename': self.video_path.name,
+            'path': str(self.video_path),
+            'duration': info['duration'],
+            'size_bytes': info['size_bytes'],
+            'bitrate': info['bitrate'],
+            'width': info['width'],
+            'height': info['height'],
+            'resolution': f"{info['width']}x{info['height']}",
+            'codec': info['codec'],
+            'fps': info['fps'],
+            'total_frames': info['total_frames'],
+            'rotation': info['rotation'],
+        }
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_fps(fps_string: str) -> float:
         """
         Parse FPS from fraction string (e.g., '30000/1001').
 
+        Memoized, since a dataset from one encoder repeats the same few rates.
+
         Args:
             fps_string: FPS as fraction string
 
@@ -118,13 +554,118 @@ class VideoProcessor:
         """
         Extract frames from video using specified sampling strategy.
 
+        Decoded frames are kept as-is (no per-frame copy); self.frames_tensor
+        stacks them into one (N, H, W, 3) array on demand. With store_as_jpeg,
+        frames are instead compressed into self.frame_jpegs as they are decoded.
+
         Args:
             sampling_strategy: Frame sampling strategy ('uniform', 'keyframes', or 'adaptive')
 
         Returns:
-            List of frame images as numpy arrays (RGB format)
+            List of frame images as numpy arrays (RGB format); with
+            store_as_jpeg, the list of JPEG bytes
         """
-        cap = cv2.VideoCapture(str(self.video_path))
+        if self.store_as_jpeg:
+            self._frame_list = []
+            self.frame_jpegs = [
+                self._encode_jpeg(frame)
+                for frame in self.extract_frames_iter(sampling_strategy)
+            ]
+            return self.frame_jpegs
+
+        self.frame_jpegs = []
+        self._frame_list = list(self.extract_frames_iter(sampling_strategy))
+        return self._frame_list
+
+    @property
+    def frames(self) -> List[np.ndarray]:
+        """Extracted frames (RGB); decoded from frame_jpegs when stored as JPEG."""
+        if self._frame_list or not getattr(self, 'frame_jpegs', None):
+            return self._frame_list
+        return [self.get_frame(i) for i in range(len(self.frame_jpegs))]
+
+    @frames.setter
+    def frames(self, frames: List[np.ndarray]) -> None:
+        self.frame_jpegs = []
+        self._frame_list = list(frames)
+
+    @property
+    def frames_tensor(self) -> Optional[np.ndarray]:
+        """
+        Extracted frames stacked into one (N, H, W, 3) array, or None if there
+        are none. This is a copy built on each access, not a view of the
+        stored frames, so keep a reference if reusing it.
+        """
+        if not self._frame_list:
+            return None
+        return np.stack(self._frame_list)
+
+    def get_frame(self, index: int) -> np.ndarray:
+        """
+        Get one extracted frame, decoding it if frames are stored as JPEG.
+
+        Args:
+            index: Position of the frame in extraction order
+
+        Returns:
+            Frame image as numpy array (RGB format)
+        """
+        cv2 = _get_cv2()
+        if not self.frame_jpegs:
+            return self.frames[index]
+
+        encoded = np.frombuffer(self.frame_jpegs[index], dtype=np.uint8)
+        frame = cv2.imdecode(encoded, cv2.IMREAD_COLOR)
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
+
+    def _frame_count(self) -> int:
+        """Number of extracted frames, without decoding JPEG-stored ones."""
+        if getattr(self, 'frame_jpegs', None):
+            return len(self.frame_jpegs)
+        return len(self.frames)
+
+    @staticmethod
+    def _encode_jpeg(frame: np.ndarray) -> bytes:
+        """Compress an RGB frame to JPEG bytes (quality 90)."""
+        cv2 = _get_cv2()
+        frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+        ok, encoded = cv2.imencode('.jpg', frame_bgr, [cv2.IMWRITE_JPEG_QUALITY, 90])
+        if not ok:
+            raise RuntimeError("Failed to encode frame as JPEG")
+        return encoded.tobytes()
+
+    def extract_frames_iter(self, sampling_strategy: str = 'uniform') -> Iterator[np.ndarray]:
+        """
+        Lazily extract frames, yielding each one as soon as it is decoded.
+
+        Only the frame being consumed needs to be resident, and closing the
+        generator early stops decoding (including any ffmpeg subprocess).
+        Unlike extract_frames(), this does not populate self.frames.
+
+        Args:
+            sampling_strategy: Frame sampling strategy ('uniform', 'keyframes', or 'adaptive')
+
+        Yields:
+            Frame images as numpy arrays (RGB format), in frame order
+        """
+        ffmpeg_available = (
+            (self.use_pyav and _pyav() is not None)
+            or (self.use_ffmpeg and shutil.which('ffmpeg') is not None)
+        )
+
+        # With known metadata the FFmpeg paths need no OpenCV open at all
+        if ffmpeg_available and self._has_frame_geometry():
+            frame_indices = self._select_frame_indices(
+                sampling_strategy, None, self.metadata['total_frames']
+            )
+            produced = yield from self._iter_frames_single_pass(
+                frame_indices, *self._display_size()
+            )
+            if produced:
+                return
+
+        cv2 = _get_cv2()
+        cap = self._take_capture()
 
         if not cap.isOpened():
             raise RuntimeError(f"Failed to open video: {self.video_path}")
@@ -136,51 +677,460 @@ class VideoProcessor:
                 raise ValueError("Video has no frames")
 
             # Determine frame indices to extract
-            if sampling_strategy == 'uniform':
-                frame_indices = self._uniform_sampling(total_frames)
-            elif sampling_strategy == 'keyframes':
-                frame_indices = self._keyframe_sampling(cap, total_frames)
-            elif sampling_strategy == 'adaptive':
-                frame_indices = self._adaptive_sampling(cap, total_frames)
-            else:
-                raise ValueError(f"Unknown sampling strategy: {sampling_strategy}")
+            frame_indices = self._select_frame_indices(sampling_strategy, cap, total_frames)
 
-            # Extract frames
-            frames = []
-            for idx in frame_indices:
-                cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
-                ret, frame = cap.read()
+            # Extract frames, preferring one FFmpeg pass that emits RGB directly
+            if ffmpeg_available:
+                produced = yield from self._iter_frames_single_pass(
+                    frame_indices,
+                    int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                    int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+                )
+                if produced:
+                    return
 
-                if ret:
-                    # Convert BGR to RGB
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    frames.append(frame_rgb)
-
-            self.frames = frames
-            return frames
+            for _, frame in self._iter_converted(cap, frame_indices):
+                yield frame
 
         finally:
             cap.release()
 
-    def _uniform_sampling(self, total_frames: int) -> List[int]:
+    def _take_capture(self):
         """
-        Uniform frame sampling - evenly spaced frames.
+        Hand over the capture left open by get_frame_indices(), or open one.
+
+        The caller owns the returned capture and must release it.
+
+        Returns:
+            OpenCV video capture object (check isOpened() before use)
+        """
+        cap, self._cap = getattr(self, '_cap', None), None
+        if cap is not None:
+            return cap
+        return self._open_capture()
+
+    def close(self) -> None:
+        """Release any video capture kept open for reuse."""
+        cap, self._cap = getattr(self, '_cap', None), None
+        if cap is not None:
+            cap.release()
+
+    def __enter__(self) -> 'VideoProcessor':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def _open_capture(self):
+        """
+        Open the video for decoding, preferring hardware acceleration.
+
+        Returns:
+            OpenCV video capture object (check isOpened() before use)
+        """
+        cv2 = _get_cv2()
+        if self.hw_accel and hasattr(cv2, 'CAP_PROP_HW_ACCELERATION'):
+            cap = cv2.VideoCapture(
+                str(self.video_path),
+                cv2.CAP_FFMPEG,
+                [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+            )
+            if cap.isOpened():
+                return cap
+            cap.release()
+
+        return cv2.VideoCapture(str(self.video_path))
+
+    def _has_frame_geometry(self) -> bool:
+        """Check whether cached metadata has frame count, dimensions and rotation."""
+        return bool(
+            self.metadata
+            and self.metadata.get('total_frames', 0) > 0
+            and self.metadata.get('width', 0) > 0
+            and self.metadata.get('height', 0) > 0
+            and 'rotation' in self.metadata
+        )
+
+    def _rotation(self) -> Optional[int]:
+        """
+        Get the clockwise display rotation in degrees, or None if unknown.
+
+        Uses cached metadata when it has one, otherwise the MP4 header.
+        """
+        if self.metadata and 'rotation' in self.metadata:
+            return self.metadata['rotation']
+        try:
+            info = _read_mp4_metadata(str(self.video_path))
+        except (OSError, ValueError, struct.error):
+            return None
+        return info['rotation'] if info else None
+
+    def _display_size(self) -> Tuple[int, int]:
+        """
+        Get the (width, height) of decoded frames from cached metadata.
+
+        The stored dimensions are the coded ones; ffmpeg (like OpenCV) applies
+        the display rotation, so 90/270 degree clips come out transposed.
+        """
+        width, height = self.metadata['width'], self.metadata['height']
+        if self.metadata['rotation'] in (90, 270):
+            return height, width
+        return width, height
+
+    def _select_frame_indices(
+        self,
+        sampling_strategy: str,
+        cap,
+        total_frames: int
+    ) -> List[int]:
+        """
+        Dispatch to the requested sampling strategy.
 
         Args:
+            sampling_strategy: Frame sampling strategy ('uniform', 'keyframes', 'adaptive')
+            cap: OpenCV video capture object (may be None)
             total_frames: Total number of frames in video
 
         Returns:
             List of frame indices to extract
+
+        Raises:
+            ValueError: If the sampling strategy is unknown
+        """
+        if sampling_strategy == 'uniform':
+            return self._uniform_sampling(total_frames)
+        elif sampling_strategy == 'keyframes':
+            return self._keyframe_sampling(cap, total_frames)
+        elif sampling_strategy == 'adaptive':
+            return self._adaptive_sampling(cap, total_frames)
+        else:
+            raise ValueError(f"Unknown sampling strategy: {sampling_strategy}")
+
+    def _iter_frames_single_pass(
+        self,
+        frame_indices: List[int],
+        width: int,
+        height: int
+    ):
+        """
+        Stream frames from PyAV if enabled, otherwise from the ffmpeg binary.
+
+        Args:
+            frame_indices: Frame indices to extract
+            width: Source frame width in pixels
+            height: Source frame height in pixels
+
+        Yields:
+            RGB frames in ascending frame index order
+
+        Returns:
+            Number of frames yielded (0 means the caller should fall back)
+        """
+        if self.use_pyav:
+            produced = yield from self._iter_frames_pyav(frame_indices)
+            if produced:
+                return produced
+
+        if not self.use_ffmpeg or shutil.which('ffmpeg') is None:
+            return 0
+
+        return (yield from self._iter_frames_ffmpeg(frame_indices, width, height))
+
+    def _iter_frames_pyav(self, frame_indices: List[int]):
+        """
+        Stream frames by decoding once in-process with PyAV.
+
+        Frames come straight from FFmpeg's decoder as RGB arrays, so there is
+        no per-frame seek, no BGR->RGB conversion and no subprocess. Decoding
+        stops after the last wanted frame. Nothing is yielded if PyAV is not
+        installed or cannot open the video, or if the video is (or may be)
+        rotated: to_ndarray() ignores the display rotation that the ffmpeg
+        and OpenCV paths apply, so frames would come out in another
+        orientation.
+
+        Args:
+            frame_indices: Frame indices to extract
+
+        Yields:
+            RGB frames in ascending frame index order
+
+        Returns:
+            Number of frames yielded (0 means the caller should fall back)
+        """
+        av = _pyav()
+        wanted = sorted(set(frame_indices))
+        if av is None or not wanted or self._rotation() != 0:
+            return 0
+
+        try:
+            container = av.open(str(self.video_path))
+        except (OSError, av.FFmpegError):
+            return 0
+
+        size = {}
+        if self.target_size:
+            size = {'width': self.target_size[0], 'height': self.target_size[1]}
+
+        produced = 0
+        try:
+            stream = container.streams.video[0]
+            stream.thread_type = 'AUTO'
+
+            wanted_iter = iter(wanted)
+            next_wanted = next(wanted_iter)
+            for i, frame in enumerate(container.decode(stream)):
+                if i != next_wanted:
+                    continue
+
+                yield frame.to_ndarray(format='rgb24', **size)
+                produced += 1
+
+                next_wanted = next(wanted_iter, None)
+                if next_wanted is None:
+                    break
+        except av.FFmpegError:
+            pass
+        finally:
+            container.close()
+
+        return produced
+
+    def _iter_frames_ffmpeg(
+        self,
+        frame_indices: List[int],
+        width: int,
+        height: int
+    ):
+        """
+        Stream frames from a single ffmpeg `select` filter emitting raw RGB.
+
+        FFmpeg demuxes, decodes, scales (when target_size is set) and converts to
+        RGB in one process with its own threading, so no per-frame seeks or
+        BGR->RGB conversions happen in Python.
+        If ffmpeg cannot produce the first frame nothing is yielded, letting the
+        caller fall back to OpenCV. The subprocess is terminated if the consumer
+        stops early.
+
+        Args:
+            frame_indices: Frame indices to extract
+            width: Source frame width in pixels
+            height: Source frame height in pixels
+
+        Yields:
+            RGB frames in ascending frame index order
+
+        Returns:
+            Number of frames yielded (0 means the caller should fall back)
+        """
+        wanted = sorted(set(frame_indices))
+        if not wanted or width <= 0 or height <= 0:
+            return 0
+
+        select_expr = "+".join(f"eq(n,{i})" for i in wanted)
+        video_filter = f"select='{select_expr}'"
+        if self.target_size:
+            # Select first so only the kept frames go through libswscale
+            width, height = self.target_size
+            video_filter += f",scale={width}:{height}:flags=bilinear"
+
+        cmd = [
+            'ffmpeg',
+            '-v', 'error',
+            '-i', str(self.video_path),
+            '-vf', video_filter,
+            '-vsync', '0',
+            '-f', 'rawvideo',
+            '-pix_fmt', 'rgb24',
+            'pipe:1'
+        ]
+
+        try:
+            proc = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            return 0
+
+        frame_size = width * height * 3
+        produced = 0
+
+        try:
+            for _ in wanted:
+                buffer = bytearray(frame_size)
+                view = memoryview(buffer)
+                received = 0
+                while received < frame_size:
+                    n = proc.stdout.readinto(view[received:])
+                    if not n:
+                        break
+                    received += n
+
+                if received != frame_size:
+                    break
+
+                yield np.frombuffer(buffer, dtype=np.uint8).reshape(height, width, 3)
+                produced += 1
+        finally:
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+
+        return produced
+
+    def _decode_and_convert(self, cap, frame_indices: List[int]) -> List[np.ndarray]:
+        """
+        Decode and convert the requested frames to RGB, in index order.
+
+        Args:
+            cap: Opened OpenCV video capture object
+            frame_indices: Frame indices to extract
+
+        Returns:
+            List of RGB frames ordered like frame_indices
+        """
+        converted = dict(self._iter_converted(cap, frame_indices))
+        return [converted[idx] for idx in frame_indices if idx in converted]
+
+    def _iter_converted(self, cap, frame_indices: List[int]):
         """
-        if total_frames <= self.num_frames:
-            # If video has fewer frames than requested, take all
-            return list(range(total_frames))
+        Decode frames on a background thread while converting them to RGB.
 
-        # Calculate evenly spaced indices
-        step = total_frames / self.num_frames
-        indices = [int(i * step) for i in range(self.num_frames)]
+        A reader thread decodes into a bounded queue and the calling thread
+        converts, so decode and color conversion overlap instead of running
+        back to back. The queue bound provides back-pressure. Downscaling to
+        target_size happens on the reader thread, before conversion.
 
-        return indices
+        Args:
+            cap: Opened OpenCV video capture object
+            frame_indices: Frame indices to extract
+
+        Yields:
+            Tuples of (frame index, RGB frame) in decode order
+        """
+        cv2 = _get_cv2()
+        frame_queue = queue.Queue(maxsize=self.PIPELINE_DEPTH)
+        stop = threading.Event()
+        done = object()
+        errors = []
+
+        def reader():
+            try:
+                for idx, frame in self._iter_decoded(cap, frame_indices):
+                    if stop.is_set():
+                        break
+                    if self.target_size:
+                        frame = cv2.resize(
+                            frame, self.target_size, interpolation=cv2.INTER_AREA
+                        )
+                    frame_queue.put((idx, frame))
+            except Exception as e:
+                errors.append(e)
+            finally:
+                frame_queue.put(done)
+
+        thread = threading.Thread(target=reader, name='frame-decoder', daemon=True)
+        thread.start()
+
+        item = None
+        try:
+            while True:
+                item = frame_queue.get()
+                if item is done:
+                    break
+                idx, frame = item
+                if self.zero_copy_rgb:
+                    # Reversed channel view: RGB without touching the pixels
+                    yield idx, frame[..., ::-1]
+                else:
+                    # Convert BGR to RGB in place: each decoded frame is a fresh
+                    # buffer owned by us, so no second HxWx3 allocation is needed
+                    yield idx, cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
+        finally:
+            # Let the reader finish before the capture is released
+            stop.set()
+            while item is not done:
+                item = frame_queue.get()
+            thread.join()
+
+        if errors:
+            raise errors[0]
+
+    def _read_frames(self, cap, frame_indices: List[int]) -> List[np.ndarray]:
+        """
+        Read the requested frames (BGR) from an open capture, in index order.
+
+        Args:
+            cap: Opened OpenCV video capture object
+            frame_indices: Frame indices to read
+
+        Returns:
+            List of successfully read frames (BGR), ordered like frame_indices
+        """
+        decoded = dict(self._iter_decoded(cap, frame_indices))
+        return [decoded[idx] for idx in frame_indices if idx in decoded]
+
+    def _iter_decoded(self, cap, frame_indices: List[int]):
+        """
+        Yield (index, BGR frame) pairs for the requested frames in decode order.
+
+        Seeking to a non-keyframe makes the decoder re-decode from the previous
+        keyframe, so for typical sampling densities it is cheaper to decode
+        sequentially once and keep only the wanted frames. Skipped frames are
+        grabbed without being retrieved. Very sparse samples fall back to
+        per-index seeking.
+
+        Args:
+            cap: Opened OpenCV video capture object
+            frame_indices: Frame indices to read
+
+        Yields:
+            Tuples of (frame index, frame) for each successfully read frame
+        """
+        cv2 = _get_cv2()
+        if not frame_indices:
+            return
+
+        wanted = sorted(set(frame_indices))
+        last_index = wanted[-1]
+
+        if last_index / len(wanted) > self.SEEK_GAP_THRESHOLD:
+            position = None
+            for idx in wanted:
+                # Consecutive indices continue from the current position
+                if idx != position:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
+                ret, frame = cap.read()
+                position = idx + 1
+
+                if ret:
+                    yield idx, frame
+            return
+
+        wanted_set = set(wanted)
+        for i in range(last_index + 1):
+            if i in wanted_set:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                yield i, frame
+            elif not cap.grab():
+                break
+
+    def _uniform_sampling(self, total_frames: int) -> List[int]:
+        """
+        Uniform frame sampling - evenly spaced frames.
+
+        Args:
+            total_frames: Total number of frames in video
+
+        Returns:
+            List of frame indices to extract
+        """
+        return list(_uniform_indices(total_frames, self.num_frames))
 
     def _keyframe_sampling(self, cap, total_frames: int) -> List[int]:
         """
@@ -211,31 +1161,7 @@ class VideoProcessor:
         Returns:
             List of frame indices
         """
-        # Simplified adaptive sampling - includes more frames from beginning/end
-        # where artifacts are often more visible
-
-        indices = []
-
-        # Take more samples from first and last 20% of video
-        first_20_percent = int(total_frames * 0.2)
-        last_20_percent = int(total_frames * 0.8)
-
-        # First 20%: 40% of frames
-        num_first = int(self.num_frames * 0.4)
-        step = max(1, first_20_percent // num_first)
-        indices.extend(range(0, first_20_percent, step)[:num_first])
-
-        # Middle 60%: 20% of frames
-        num_middle = int(self.num_frames * 0.2)
-        step = max(1, (last_20_percent - first_20_percent) // num_middle)
-        indices.extend(range(first_20_percent, last_20_percent, step)[:num_middle])
-
-        # Last 20%: 40% of frames
-        num_last = self.num_frames - len(indices)
-        step = max(1, (total_frames - last_20_percent) // num_last)
-        indices.extend(range(last_20_percent, total_frames, step)[:num_last])
-
-        return sorted(list(set(indices)))[:self.num_frames]
+        return list(_adaptive_indices(total_frames, self.num_frames))
 
     def get_frame_timestamps(self) -> List[float]:
         """
@@ -247,17 +1173,21 @@ class VideoProcessor:
         if not self.metadata:
             self.extract_metadata()
 
-        if not self.frames:
+        num_extracted = self._frame_count()
+        if not num_extracted:
             raise ValueError("No frames extracted yet. Call extract_frames() first.")
 
         fps = self.metadata.get('fps', 30.0)
-        total_frames = self.metadata.get('total_frames', len(self.frames))
+        if not fps or fps <= 0:
+            # Unparsable frame rates come back as 0.0
+            fps = 30.0
+        total_frames = self.metadata.get('total_frames', num_extracted)
 
         # Calculate timestamps based on uniform distribution
-        step = total_frames / len(self.frames)
-        timestamps = [i * step / fps for i in range(len(self.frames))]
+        step = total_frames / num_extracted
+        timestamps = np.arange(num_extracted) * step / fps
 
-        return timestamps
+        return timestamps.tolist()
 
     def save_frames(self, output_dir: str, prefix: str = "frame") -> List[Path]:
         """
@@ -270,17 +1200,30 @@ class VideoProcessor:
         Returns:
             List of paths to saved frame files
         """
+        cv2 = _get_cv2()
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        saved_paths = []
-        for i, frame in enumerate(self.frames):
+        frames = None if self.frame_jpegs else self.frames
+        saved_paths = [
+            output_path / f"{prefix}_{i:03d}.jpg" for i in range(self._frame_count())
+        ]
+
+        def write_frame(i: int) -> None:
+            if frames is None:
+                # Already encoded, write the bytes as-is
+                saved_paths[i].write_bytes(self.frame_jpegs[i])
+                return
+
             # Convert RGB back to BGR for saving with OpenCV
-            frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+            frame_bgr = cv2.cvtColor(frames[i], cv2.COLOR_RGB2BGR)
+            cv2.imwrite(str(saved_paths[i]), frame_bgr)
 
-            filename = output_path / f"{prefix}_{i:03d}.jpg"
-            cv2.imwrite(str(filename), frame_bgr)
-            saved_paths.append(filename)
+        # JPEG encoding releases the GIL, so frames encode concurrently
+        if saved_paths:
+            max_workers = min(len(saved_paths), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(write_frame, range(len(saved_paths))))
 
         return saved_paths
 
@@ -294,8 +1237,8 @@ class VideoProcessor:
         Returns:
             Dictionary with metadata and frame information
         """
-        # Extract metadata
-        metadata = self.extract_metadata()
+        # Extract metadata (reuses metadata supplied up front, if any)
+        metadata = self.get_metadata()
 
         # Extract frames
         frames = self.extract_frames(sampling_strategy)
@@ -330,6 +1273,11 @@ class VideoProcessor:
         """
         Calculate frame indices to extract without actually extracting frames.
 
+        Uses the frame count from already-known metadata when available.
+        Otherwise the video is opened, and the capture is kept for the next
+        extraction instead of being opened twice; call close() (or use the
+        processor as a context manager) if no extraction follows.
+
         Args:
             sampling_strategy: Frame sampling strategy ('uniform', 'keyframes', 'adaptive')
             num_frames: Number of frames (default: use self.num_frames)
@@ -337,14 +1285,23 @@ class VideoProcessor:
         Returns:
             List of frame indices to extract
         """
+        cv2 = _get_cv2()
         if num_frames is not None:
             # Temporarily override num_frames
             original_num_frames = self.num_frames
             self.num_frames = num_frames
 
         try:
-            cap = cv2.VideoCapture(str(self.video_path))
+            if self.metadata and self.metadata.get('total_frames', 0) > 0:
+                return self._select_frame_indices(
+                    sampling_strategy, None, self.metadata['total_frames']
+                )
+
+            # Opened like extraction's own capture, since extraction reuses it
+            self.close()
+            cap = self._open_capture()
             if not cap.isOpened():
+                cap.release()
                 raise RuntimeError(f"Failed to open video: {self.video_path}")
 
             try:
@@ -354,19 +1311,14 @@ class VideoProcessor:
                     raise ValueError("Video has no frames")
 
                 # Determine frame indices based on strategy
-                if sampling_strategy == 'uniform':
-                    frame_indices = self._uniform_sampling(total_frames)
-                elif sampling_strategy == 'keyframes':
-                    frame_indices = self._keyframe_sampling(cap, total_frames)
-                elif sampling_strategy == 'adaptive':
-                    frame_indices = self._adaptive_sampling(cap, total_frames)
-                else:
-                    raise ValueError(f"Unknown sampling strategy: {sampling_strategy}")
-
-                return frame_indices
-
-            finally:
+                indices = self._select_frame_indices(sampling_strategy, cap, total_frames)
+            except Exception:
                 cap.release()
+                raise
+
+            # Nothing has been decoded yet, so extraction can start from here
+            self._cap = cap
+            return indices
         finally:
             # Restore original num_frames if it was temporarily overridden
             if num_frames is not None:
@@ -377,6 +1329,9 @@ def validate_video_file(video_path: str) -> Tuple[bool, Optional[str]]:
     """
     Validate that a video file exists and is a valid MP4.
 
+    The OpenCV open-and-read check is memoized on (path, mtime, size), so
+    re-validating an unchanged file costs a single stat call.
+
     Args:
         video_path: Path to video file
 
@@ -385,29 +1340,53 @@ def validate_video_file(video_path: str) -> Tuple[bool, Optional[str]]:
     """
     path = Path(video_path)
 
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:
         return False, f"File not found: {video_path}"
 
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         return False, f"Not a file: {video_path}"
 
     if path.suffix.lower() != '.mp4':
         return False, f"Not an MP4 file: {video_path}"
 
-    # Try to open with OpenCV
     try:
-        cap = cv2.VideoCapture(str(path))
-        if not cap.isOpened():
-            return False, f"Cannot open video file: {video_path}"
+        return _validate_video_contents(str(video_path), st.st_mtime_ns, st.st_size)
+    except Exception as e:
+        return False, f"Error validating video: {str(e)}"
 
-        # Check if video has frames
-        ret, _ = cap.read()
-        cap.release()
 
-        if not ret:
-            return False, f"Video has no readable frames: {video_path}"
+@functools.lru_cache(maxsize=256)
+def _validate_video_contents(
+    video_path: str,
+    mtime_ns: int,
+    size: int
+) -> Tuple[bool, Optional[str]]:
+    """
+    Check that OpenCV can open a video file and read its first frame.
 
-        return True, None
+    mtime_ns and size only key the cache, so a rewritten file is checked
+    again. Exceptions propagate and are therefore never cached.
 
-    except Exception as e:
-        return False, f"Error validating video: {str(e)}"
+    Args:
+        video_path: Path to an existing regular .mp4 file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    cv2 = _get_cv2()
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        return False, f"Cannot open video file: {video_path}"
+
+    # Check if video has frames
+    ret, _ = cap.read()
+    cap.release()
+
+    if not ret:
+        return False, f"Video has no readable frames: {video_path}"
+
+    return True, None
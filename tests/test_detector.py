@@ -5,7 +5,9 @@ Tests detection pipeline orchestration with mocked components.
 Tests classification logic and result aggregation.
 """
 
+import time
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, MagicMock
 import numpy as np
 from datetime import datetime
@@ -102,7 +104,7 @@ class TestDetectionPipeline:
                 'duration': 5.0,
                 'resolution': '1920x1080'
             },
-            'frames': [np.zeros((480, 640, 3)) for _ in range(10)],
+            'frames': [np.zeros((480, 640, 3))] * 10,
             'num_frames': 10,
             'timestamps': [0.0, 0.5, 1.0, 1.5, 2.0],
             'sampling_strategy': 'uniform'
@@ -191,7 +193,7 @@ class TestBatchProcessing:
         mock_processor = MagicMock()
         mock_processor.process.return_value = {
             'metadata': {'filename': 'test.mp4', 'duration': 5.0},
-            'frames': [np.zeros((100, 100, 3)) for _ in range(5)],
+            'frames': [np.zeros((100, 100, 3))] * 5,
             'num_frames': 5,
             'timestamps': [0, 1, 2, 3, 4],
             'sampling_strategy': 'uniform'
@@ -221,7 +223,7 @@ class TestBatchProcessing:
         mock_processor = MagicMock()
         mock_processor.process.return_value = {
             'metadata': {'filename': 'test.mp4', 'duration': 5.0},
-            'frames': [np.zeros((100, 100, 3)) for _ in range(5)],
+            'frames': [np.zeros((100, 100, 3))] * 5,
             'num_frames': 5,
             'timestamps': [0, 1, 2, 3, 4],
             'sampling_strategy': 'uniform'
@@ -238,6 +240,47 @@ class TestBatchProcessing:
         assert 'error' in results['/invalid.mp4']
         assert 'classification' in results['/video1.mp4']
 
+    def test_batch_detect_in_worker_processes(self):
+        """Test process-parallel batch keeps input order and reports errors."""
+        detector = DeepfakeDetector(api_provider='mock')
+
+        video_paths = ['/missing/first.mp4', '/missing/second.mp4']
+        results = detector.batch_detect(video_paths, video_workers=2)
+
+        assert list(results) == video_paths
+        assert all(r['classification'] == 'ERROR' for r in results.values())
+        assert 'not found' in results['/missing/first.mp4']['error'].lower()
+
+    def test_worker_config_disables_nested_parallelism(self):
+        """Test worker detectors are rebuilt without parallel frame extraction."""
+        detector = DeepfakeDetector(api_provider='mock', use_parallel=True, num_frames=7)
+
+        config = detector._worker_config()
+
+        assert config['use_parallel'] is False
+        assert config['num_frames'] == 7
+        assert config['api_provider'] == 'mock'
+
+    @patch('src.detector.OutputFormatter')
+    @patch('src.detector._init_batch_worker')
+    @patch('src.detector.ProcessPoolExecutor', ThreadPoolExecutor)
+    def test_batch_detect_workers_keep_input_order(self, mock_init, mock_formatter):
+        """Test video_workers > 1 returns results in input order, not completion order."""
+        video_paths = ['/slow.mp4', '/medium.mp4', '/fast.mp4']
+        delays = {'/slow.mp4': 0.2, '/medium.mp4': 0.1, '/fast.mp4': 0.0}
+
+        def fake_detect(path):
+            time.sleep(delays[path])
+            return {'video': path, 'classification': 'REAL'}
+
+        detector = DeepfakeDetector(api_provider='mock')
+        with patch('src.detector._detect_in_worker', side_effect=fake_detect):
+            results = detector.batch_detect(video_paths, video_workers=3)
+
+        assert list(results) == video_paths
+        assert [r['video'] for r in results.values()] == video_paths
+        mock_init.assert_called()
+
 
 class TestDetectAndReport:
     """Test detection with reporting functionality."""
@@ -252,7 +295,7 @@ class TestDetectAndReport:
         mock_processor = MagicMock()
         mock_processor.process.return_value = {
             'metadata': {'filename': 'test.mp4', 'duration': 5.0},
-            'frames': [np.zeros((100, 100, 3)) for _ in range(5)],
+            'frames': [np.zeros((100, 100, 3))] * 5,
             'num_frames': 5,
             'timestamps': [0, 1, 2, 3, 4],
             'sampling_strategy': 'uniform'
@@ -276,7 +319,7 @@ class TestDetectAndReport:
         mock_processor = MagicMock()
         mock_processor.process.return_value = {
             'metadata': {'filename': 'test.mp4', 'duration': 5.0},
-            'frames': [np.zeros((100, 100, 3)) for _ in range(5)],
+            'frames': [np.zeros((100, 100, 3))] * 5,
             'num_frames': 5,
             'timestamps': [0, 1, 2, 3, 4],
             'sampling_strategy': 'uniform'
@@ -312,7 +355,7 @@ class TestResultStructure:
                 'resolution': '1920x1080',
                 'fps': 30.0
             },
-            'frames': [np.zeros((100, 100, 3)) for _ in range(10)],
+            'frames': [np.zeros((100, 100, 3))] * 10,
             'num_frames': 10,
             'timestamps': list(range(10)),
             'sampling_strategy': 'uniform'
@@ -347,7 +390,7 @@ class TestResultStructure:
         mock_processor = MagicMock()
         mock_processor.process.return_value = {
             'metadata': {'filename': 'test.mp4', 'duration': 5.0},
-            'frames': [np.zeros((100, 100, 3)) for _ in range(5)],
+            'frames': [np.zeros((100, 100, 3))] * 5,
             'num_frames': 5,
             'timestamps': [0, 1, 2, 3, 4],
             'sampling_strategy': 'uniform'
@@ -371,7 +414,7 @@ class TestResultStructure:
         mock_processor = MagicMock()
         mock_processor.process.return_value = {
             'metadata': {'filename': 'test.mp4', 'duration': 5.0},
-            'frames': [np.zeros((100, 100, 3)) for _ in range(5)],
+            'frames': [np.zeros((100, 100, 3))] * 5,
             'num_frames': 5,
             'timestamps': [0, 1, 2, 3, 4],
             'sampling_strategy': 'uniform'
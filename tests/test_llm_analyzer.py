@@ -7,30 +7,73 @@ LLM API calls are mocked to avoid external dependencies and costs.
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-import numpy as np
 from pathlib import Path
+from types import MappingProxyType
 
 from src.llm_analyzer import LLMAnalyzer
 
+# Characters that may appear in standard base64 output
+_B64_ALPHABET = (b'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+                 b'abcdefghijklmnopqrstuvwxyz0123456789+/=')
 
+
+@pytest.fixture(scope='session')
+def mock_analyzer():
+    """Shared mock-provider analyzer for read-only tests."""
+    return LLMAnalyzer(api_provider='mock')
+
+
+@pytest.fixture(scope='session')
+def fake_small_image():
+    """Deterministic 100x100 RGB noise image, shared read-only."""
+    import numpy as np
+
+    image = np.random.default_rng(0).integers(0, 256, (100, 100, 3), dtype=np.uint8)
+    image.setflags(write=False)
+    return image
+
+
+@pytest.fixture(scope='session')
+def fake_frame_480p():
+    """Black 640x480 RGB frame, shared read-only."""
+    import numpy as np
+
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    frame.setflags(write=False)
+    return frame
+
+
+@pytest.fixture(scope='session')
+def fake_frame_sequence(fake_frame_480p):
+    """Five-frame sequence backed by a single shared frame."""
+    return [fake_frame_480p] * 5
+
+
+@pytest.fixture(scope='session')
+def sample_metadata():
+    """Video metadata shared read-only; the analyzer never mutates it."""
+    return MappingProxyType({
+        'filename': 'test.mp4',
+        'duration': 5.0,
+        'resolution': '1920x1080'
+    })
+
+
+@pytest.mark.initialization
 class TestLLMInitialization:
     """Test LLM analyzer initialization."""
 
-    def test_init_with_mock_provider(self):
+    def test_init_with_mock_provider(self, mock_analyzer):
         """Test initialization with mock provider."""
-        analyzer = LLMAnalyzer(api_provider='mock')
-
-        assert analyzer.api_provider == 'mock'
-        assert analyzer.client is None  # Mock doesn't need client
+        assert mock_analyzer.api_provider == 'mock'
+        assert mock_analyzer.client is None  # Mock doesn't need client
 
-    def test_init_loads_prompts(self):
+    def test_init_loads_prompts(self, mock_analyzer):
         """Test that prompts are loaded on initialization."""
-        analyzer = LLMAnalyzer(api_provider='mock')
-
-        assert 'frame_analysis' in analyzer.prompts
-        assert 'temporal_analysis' in analyzer.prompts
-        assert 'synthesis' in analyzer.prompts
-        assert len(analyzer.prompts['frame_analysis']) > 0
+        assert 'frame_analysis' in mock_analyzer.prompts
+        assert 'temporal_analysis' in mock_analyzer.prompts
+        assert 'synthesis' in mock_analyzer.prompts
+        assert len(mock_analyzer.prompts['frame_analysis']) > 0
 
     def test_default_model_selection(self):
         """Test default model is selected based on provider."""
@@ -41,139 +84,144 @@ class TestLLMInitialization:
         assert 'claude' in analyzer.model_name.lower()
 
 
+@pytest.mark.prompts
 class TestPromptConstruction:
     """Test prompt construction and context injection."""
 
-    def test_frame_analysis_prompt_loaded(self):
-        """Test frame analysis prompt is properly loaded."""
-        analyzer = LLMAnalyzer(api_provider='mock')
-
-        prompt = analyzer.prompts['frame_analysis']
-
-        assert 'facial features' in prompt.lower()
-        assert 'deepfake' in prompt.lower()
-
-    def test_temporal_analysis_prompt_loaded(self):
-        """Test temporal analysis prompt is properly loaded."""
-        analyzer = LLMAnalyzer(api_provider='mock')
-
-        prompt = analyzer.prompts['temporal_analysis']
+    @pytest.mark.parametrize('key,needles', [
+        ('frame_analysis', ['facial features', 'deepfake']),
+        # A tuple means any one of its phrases is enough
+        ('temporal_analysis', [('temporal', 'motion'), 'frames']),
+        ('synthesis', ['classification', 'confidence']),
+    ])
+    def test_prompt_loaded(self, mock_analyzer, key, needles):
+        """Test each prompt is properly loaded with its expected content."""
+        prompt = mock_analyzer.prompts[key].lower()
 
-        assert 'temporal' in prompt.lower() or 'motion' in prompt.lower()
-        assert 'frames' in prompt.lower()
-
-    def test_synthesis_prompt_loaded(self):
-        """Test synthesis prompt is properly loaded."""
-        analyzer = LLMAnalyzer(api_provider='mock')
-
-        prompt = analyzer.prompts['synthesis']
-
-        assert 'classification' in prompt.lower()
-        assert 'confidence' in prompt.lower()
+        for needle in needles:
+            if isinstance(needle, tuple):
+                assert any(phrase in prompt for phrase in needle)
+            else:
+                assert needle in prompt
 
 
+@pytest.mark.parsing
 class TestResponseParsing:
     """Test parsing of LLM responses."""
 
-    def test_parse_verdict_fake(self):
-        """Test parsing FAKE classification from response."""
-        analyzer = LLMAnalyzer(api_provider='mock')
-
-        response = """
-        Classification: FAKE
-        Confidence: 85%
-
-        The video shows clear signs of manipulation.
-        """
+    @pytest.mark.parametrize('response,expected', [
+        ("Classification: FAKE\nConfidence: 85%\n\n"
+         "The video shows clear signs of manipulation.", 'FAKE'),
+        ("Classification: REAL\nConfidence: 90%\n\n"
+         "The video appears authentic.", 'REAL'),
+        ("This is LIKELY FAKE with some artifacts visible.", 'LIKELY FAKE'),
+        ("Classification: UNCERTAIN due to insufficient evidence.", 'UNCERTAIN'),
+        # No recognisable verdict: only the defaults' shape is checked
+        ("Unclear response without proper format.", None),
+    ])
+    def test_parse_verdict(self, mock_analyzer, response, expected):
+        """Test parsing the classification from a response."""
+        verdict = mock_analyzer._parse_verdict(response)
 
-        verdict = analyzer._parse_verdict(response)
-
-        assert verdict['classification'] == 'FAKE'
+        assert 'classification' in verdict
+        if expected is not None:
+            assert verdict['classification'] == expected
         # Confidence extraction is tested separately; just ensure it's in valid range
         assert 0 <= verdict['confidence'] <= 100
 
-    def test_parse_verdict_real(self):
-        """Test parsing REAL classification from response."""
-        analyzer = LLMAnalyzer(api_provider='mock')
-
-        response = """
-        Classification: REAL
-        Confidence: 90%
+    def test_parse_verdict_explicit_classification_wins(self, mock_analyzer):
+        """Test an explicit classification outranks earlier hedged phrases."""
+        response = "Initially this looked likely real.\nVerdict: FAKE\nConfidence: 85%"
 
-        The video appears authentic.
-        """
+        verdict = mock_analyzer._parse_verdict(response)
 
-        verdict = analyzer._parse_verdict(response)
+        assert verdict['classification'] == 'FAKE'
+        assert verdict['confidence'] == 85
 
+    def test_parse_verdict_confidence_formats(self, mock_analyzer):
+        """Test confidence is found in looser phrasings and capped at 100."""
+        verdict = mock_analyzer._parse_verdict("Classification:\tREAL\nconfidence level = 92%")
         assert verdict['classification'] == 'REAL'
-        # Confidence extraction is tested separately; just ensure it's in valid range
-        assert 0 <= verdict['confidence'] <= 100
-
-    def test_parse_verdict_likely_fake(self):
-        """Test parsing LIKELY FAKE classification."""
-        analyzer = LLMAnalyzer(api_provider='mock')
-
-        response = "This is LIKELY FAKE with some artifacts visible."
-
-        verdict = analyzer._parse_verdict(response)
+        assert verdict['confidence'] == 92
 
+        verdict = mock_analyzer._parse_verdict("Probably\nfake. Confidence: 150%")
         assert verdict['classification'] == 'LIKELY FAKE'
+        assert verdict['confidence'] == 100
+
+    @pytest.mark.parametrize('response,expected', [
+        ("Low confidence in frame 3 artifacts. VERDICT: FAKE. Confidence: 85%", ('FAKE', 85)),
+        ("High confidence that lighting is natural.\nClassification: REAL\n"
+         "Confidence Level: 70%", ('REAL', 70)),
+        ("We have little confidence either way.", ('UNCERTAIN', 50)),
+    ])
+    def test_parse_verdict_confidence_ignores_prose(self, mock_analyzer, response, expected):
+        """Test only the labelled confidence field is read, not prose mentions."""
+        verdict = mock_analyzer._parse_verdict(response)
+
+        assert (verdict['classification'], verdict['confidence']) == expected
+
+    @pytest.mark.parametrize('response,expected', [
+        ("VERDICT:FAKE", 'FAKE'),
+        ("Classification:\n  REAL", 'REAL'),
+        ("likely  fake overall", 'LIKELY FAKE'),
+        ("Probably\treal.", 'LIKELY REAL'),
+        ("Verdict - FAKE", 'UNCERTAIN'),
+    ])
+    def test_parse_verdict_whitespace_between_words(self, mock_analyzer, response, expected):
+        """Test verdict phrases tolerate any whitespace, but still need the colon."""
+        assert mock_analyzer._parse_verdict(response)['classification'] == expected
+
+    def test_parse_verdict_returns_fresh_dicts(self, mock_analyzer):
+        """Test memoized parsing still hands each caller its own dict."""
+        response = "Classification: REAL\nConfidence: 90%"
+
+        first = mock_analyzer._parse_verdict(response)
+        first['classification'] = 'CHANGED'
+
+        assert mock_analyzer._parse_verdict(response)['classification'] == 'REAL'
+
+
+@pytest.mark.encoding
+class TestImageEncoding:
+    """Test image encoding for LLM APIs."""
 
-    def test_parse_verdict_uncertain(self):
-        """Test parsing UNCERTAIN classification."""
-        analyzer = LLMAnalyzer(api_provider='mock')
-
-        response = "Classification: UNCERTAIN due to insufficient evidence."
-
-        verdict = analyzer._parse_verdict(response)
-
-        assert verdict['classification'] == 'UNCERTAIN'
-
-    def test_parse_verdict_default(self):
-        """Test default values when parsing fails."""
-        analyzer = LLMAnalyzer(api_provider='mock')
-
-        response = "Unclear response without proper format."
-
-        verdict = analyzer._parse_verdict(response)
+    def test_encode_image_to_base64(self, mock_analyzer, fake_small_image):
+        """Test image encoding produces valid base64."""
+        base64_str = mock_analyzer._encode_image_to_base64(fake_small_image)
 
-        assert 'classification' in verdict
-        assert 'confidence' in verdict
-        assert 0 <= verdict['confidence'] <= 100
+        assert isinstance(base64_str, str)
+        assert len(base64_str) > 0
+        # Deleting every base64 character must leave nothing behind
+        assert base64_str.encode('ascii').translate(None, _B64_ALPHABET) == b''
 
+    def test_encode_reversed_channel_view(self, mock_analyzer, fake_small_image):
+        """Test a zero-copy RGB view of a BGR frame encodes like its copy."""
+        view = fake_small_image[..., ::-1]
 
-class TestImageEncoding:
-    """Test image encoding for LLM APIs."""
+        assert (mock_analyzer._encode_image_to_base64(view)
+                == mock_analyzer._encode_image_to_base64(view.copy()))
 
-    def test_encode_image_to_base64(self):
-        """Test image encoding produces valid base64."""
-        analyzer = LLMAnalyzer(api_provider='mock')
+    def test_encode_jpeg_bytes_passthrough(self, mock_analyzer):
+        """Test already-encoded JPEG bytes are base64-encoded as-is."""
+        import base64
 
-        # Create fake image
-        fake_image = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+        jpeg_bytes = b'\xff\xd8\xff\xe0fake-jpeg'
 
-        base64_str = analyzer._encode_image_to_base64(fake_image)
+        base64_str = mock_analyzer._encode_image_to_base64(jpeg_bytes)
 
-        assert isinstance(base64_str, str)
-        assert len(base64_str) > 0
-        # Base64 strings only contain these characters
-        assert all(c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=' for c in base64_str)
+        assert base64.b64decode(base64_str) == jpeg_bytes
 
 
+@pytest.mark.mock_analysis
 class TestMockAnalysis:
     """Test analysis with mock LLM provider."""
 
-    def test_analyze_frame_mock(self):
+    def test_analyze_frame_mock(self, mock_analyzer, fake_frame_480p, sample_metadata):
         """Test frame analysis with mock provider."""
-        analyzer = LLMAnalyzer(api_provider='mock')
-
-        fake_frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        metadata = {'resolution': '640x480', 'duration': 5.0}
-
-        result = analyzer.analyze_frame(
-            frame=fake_frame,
+        result = mock_analyzer.analyze_frame(
+            frame=fake_frame_480p,
             frame_index=0,
-            metadata=metadata
+            metadata=sample_metadata
         )
 
         assert 'frame_index' in result
@@ -182,14 +230,10 @@ class TestMockAnalysis:
         assert isinstance(result['analysis'], str)
         assert len(result['analysis']) > 0
 
-    def test_analyze_temporal_mock(self):
+    def test_analyze_temporal_mock(self, mock_analyzer, fake_frame_sequence):
         """Test temporal analysis with mock provider."""
-        analyzer = LLMAnalyzer(api_provider='mock')
-
-        fake_frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
-
-        result = analyzer.analyze_temporal_sequence(
-            frames=fake_frames,
+        result = mock_analyzer.analyze_temporal_sequence(
+            frames=fake_frame_sequence,
             frame_indices=[0, 1, 2, 3, 4]
         )
 
@@ -198,10 +242,16 @@ class TestMockAnalysis:
         assert 'analysis' in result
         assert isinstance(result['analysis'], str)
 
-    def test_synthesize_verdict_mock(self):
-        """Test verdict synthesis with mock provider."""
-        analyzer = LLMAnalyzer(api_provider='mock')
+    def test_mock_skips_encoding(self, mock_analyzer, fake_frame_480p, fake_frame_sequence):
+        """Test the mock provider never runs the JPEG/base64 encode step."""
+        with patch.object(mock_analyzer, '_encode_image_to_base64') as mock_encode:
+            mock_analyzer.analyze_frame(frame=fake_frame_480p, frame_index=0)
+            mock_analyzer.analyze_temporal_sequence(frames=fake_frame_sequence)
+
+        mock_encode.assert_not_called()
 
+    def test_synthesize_verdict_mock(self, mock_analyzer, sample_metadata):
+        """Test verdict synthesis with mock provider."""
         frame_analyses = [
             {'frame_index': 0, 'analysis': 'Some smoothing detected'},
             {'frame_index': 1, 'analysis': 'Lighting inconsistency'}
@@ -212,16 +262,10 @@ class TestMockAnalysis:
             'analysis': 'Motion appears natural'
         }
 
-        metadata = {
-            'filename': 'test.mp4',
-            'duration': 5.0,
-            'resolution': '1920x1080'
-        }
-
-        result = analyzer.synthesize_verdict(
+        result = mock_analyzer.synthesize_verdict(
             frame_analyses=frame_analyses,
             temporal_analysis=temporal_analysis,
-            metadata=metadata
+            metadata=sample_metadata
         )
 
         assert 'classification' in result
@@ -231,13 +275,12 @@ class TestMockAnalysis:
         assert 0 <= result['confidence'] <= 100
 
 
+@pytest.mark.mock_analysis
 class TestEvidenceCompilation:
     """Test evidence compilation from analyses."""
 
-    def test_compile_evidence(self):
+    def test_compile_evidence(self, mock_analyzer):
         """Test evidence compilation from frame and temporal analyses."""
-        analyzer = LLMAnalyzer(api_provider='mock')
-
         frame_analyses = [
             {
                 'frame_index': 0,
@@ -253,7 +296,7 @@ class TestEvidenceCompilation:
             'analysis': 'Motion continuity is good. No significant temporal artifacts.'
         }
 
-        evidence = analyzer._compile_evidence(frame_analyses, temporal_analysis)
+        evidence = mock_analyzer._compile_evidence(frame_analyses, temporal_analysis)
 
         assert 'frame_observations' in evidence
         assert 'temporal_observations' in evidence
@@ -262,36 +305,74 @@ class TestEvidenceCompilation:
         assert len(evidence['frame_observations']) > 0
         assert len(evidence['temporal_observations']) > 0
 
+    def test_compile_evidence_limits_to_first_five_frames(self, mock_analyzer):
+        """Test only the first five frames are summarized."""
+        frame_analyses = [
+            {'frame_index': i, 'analysis': f'Observation {i}'} for i in range(200)
+        ]
+
+        evidence = mock_analyzer._compile_evidence(frame_analyses, {'analysis': 'ok'})
+
+        assert evidence['frame_observations'].splitlines() == [
+            f"Frame {i}: Observation {i}..." for i in range(5)
+        ]
 
+
+@pytest.mark.mock_analysis
 class TestProviderAbstraction:
     """Test provider abstraction layer."""
 
-    def test_mock_provider_vision_response(self):
+    def test_mock_provider_vision_response(self, mock_analyzer, fake_small_image):
         """Test mock provider returns vision analysis."""
-        analyzer = LLMAnalyzer(api_provider='mock')
-
-        fake_frame = np.zeros((100, 100, 3), dtype=np.uint8)
         prompt = "Analyze this frame"
 
-        response = analyzer._call_llm_vision(prompt, [fake_frame])
+        response = mock_analyzer._call_llm_vision(prompt, [fake_small_image])
 
         assert isinstance(response, str)
         assert len(response) > 0
         assert 'MOCK' in response.upper() or 'analysis' in response.lower()
 
-    def test_mock_provider_text_response(self):
+    def test_mock_provider_text_response(self, mock_analyzer):
         """Test mock provider returns text synthesis."""
-        analyzer = LLMAnalyzer(api_provider='mock')
-
         prompt = "Synthesize the evidence"
 
-        response = analyzer._call_llm_text(prompt)
+        response = mock_analyzer._call_llm_text(prompt)
 
         assert isinstance(response, str)
         assert len(response) > 0
         assert 'classification' in response.lower()
 
+    def test_anthropic_caches_prompt_template(self, fake_small_image):
+        """Test Anthropic calls send the prompt template as a cached system block."""
+        analyzer = LLMAnalyzer(api_provider='mock')
+        analyzer.api_provider = 'anthropic'
+        analyzer.client = MagicMock()
+        analyzer.client.messages.create.return_value.content = [Mock(text="ok")]
 
+        analyzer.analyze_frame(fake_small_image, frame_index=0)
+
+        kwargs = analyzer.client.messages.create.call_args.kwargs
+        assert kwargs['system'] == [{
+            'type': 'text',
+            'text': analyzer.prompts['frame_analysis'],
+            'cache_control': {'type': 'ephemeral'}
+        }]
+        # Without metadata there is no per-call text, only the image
+        assert [block['type'] for block in kwargs['messages'][0]['content']] == ['image']
+
+    def test_other_providers_receive_combined_prompt(self, mock_analyzer, fake_small_image):
+        """Test non-caching providers get context followed by the template."""
+        metadata = {'resolution': '640x480', 'duration': 2.0, 'codec': 'h264'}
+
+        with patch.object(mock_analyzer, '_mock_vision_response', return_value="ok") as mock_call:
+            mock_analyzer.analyze_frame(fake_small_image, frame_index=0, metadata=metadata)
+
+        prompt = mock_call.call_args.args[0]
+        assert prompt.startswith("\n\nVideo metadata:\n- Resolution: 640x480")
+        assert prompt.endswith("\n" + mock_analyzer.prompts['frame_analysis'])
+
+
+@pytest.mark.prompts
 class TestPromptFallback:
     """Test prompt fallback mechanism."""
 
@@ -308,3 +389,25 @@ class TestPromptFallback:
         # Verify prompts have content
         assert len(analyzer.prompts['frame_analysis']) > 100
         assert 'deepfake' in analyzer.prompts['frame_analysis'].lower()
+
+    def test_prompts_cached_per_directory(self, tmp_path):
+        """Test prompt files are read once per directory and shared read-only."""
+        (tmp_path / 'synthesis.txt').write_text("custom synthesis prompt")
+
+        first = LLMAnalyzer(api_provider='mock', prompts_dir=str(tmp_path))
+        second = LLMAnalyzer(api_provider='mock', prompts_dir=str(tmp_path))
+
+        assert first.prompts is second.prompts
+        assert first.prompts['synthesis'] == "custom synthesis prompt"
+        assert 'deepfake' in first.prompts['frame_analysis'].lower()
+        with pytest.raises(TypeError):
+            first.prompts['synthesis'] = "changed"
+
+    def test_prompt_files_read_as_utf8(self, tmp_path):
+        """Test prompt files are read verbatim as UTF-8."""
+        text = "Évaluez la vidéo — frame by frame.\n"
+        (tmp_path / 'frame_analysis.txt').write_bytes(text.encode('utf-8'))
+
+        analyzer = LLMAnalyzer(api_provider='mock', prompts_dir=str(tmp_path))
+
+        assert analyzer.prompts['frame_analysis'] == text
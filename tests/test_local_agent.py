@@ -11,75 +11,134 @@ from pathlib import Path
 import yaml
 import cv2
 
-from src.local_agent import LocalAgentRunner, LocalAgentProvider
+from src.local_agent import LocalAgentRunner, LocalAgentProvider, _YAML_LOADER
+
+
+def _bare_agent():
+    """Create a LocalAgentRunner without running __init__, for pure-method tests."""
+    return LocalAgentRunner.__new__(LocalAgentRunner)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mute_print():
+    """Silence the agent's init banner once for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('builtins.print', lambda *args, **kwargs: None)
+        yield
+
+
+@pytest.fixture(scope="module")
+def agent_config():
+    """Minimal agent definition, shared read-only across tests."""
+    return {
+        'agent': {'name': 'Test', 'version': '1.0.0', 'type': 'local_reasoning'}
+    }
+
+
+@pytest.fixture(scope="module")
+def visual_rules():
+    """Detection rules with visual weights only."""
+    return {
+        'visual_rules': {
+            'facial_smoothing': {'weight': 0.25},
+            'lighting_inconsistency': {'weight': 0.20},
+            'boundary_artifacts': {'weight': 0.20}
+        }
+    }
+
+
+@pytest.fixture(scope="module")
+def confidence_rules():
+    """Detection rules with confidence thresholds only."""
+    return {
+        'confidence_calculation': {
+            'high_confidence_threshold': 0.75,
+            'moderate_confidence_threshold': 0.55,
+            'uncertain_threshold': 0.45
+        }
+    }
+
+
+@pytest.fixture(scope="module")
+def random_frame():
+    """Textured 32x32 frame, shared read-only (the agent never writes frames).
+
+    The agent's heuristics are per-pixel statistics, so a tiny frame behaves
+    the same as a full-size one.
+    """
+    frame = np.random.default_rng(0).integers(0, 255, (32, 32, 3), dtype=np.uint8)
+    frame.setflags(write=False)
+    return frame
+
+
+@pytest.fixture(scope="module")
+def frame_sequence():
+    """Five distinct textured frames, generated once as one read-only block."""
+    frames = np.random.default_rng(1).integers(0, 255, (5, 32, 32, 3), dtype=np.uint8)
+    frames.setflags(write=False)
+    return list(frames)
+
+
+@pytest.fixture(scope="module")
+def reasoning_agent():
+    """One bare agent shared by the reasoning cases; reasoning generation is stateless."""
+    return _bare_agent()
+
+
+@pytest.fixture
+def patch_loaders(monkeypatch, agent_config):
+    """Stub the agent's YAML/template loaders."""
+    def apply(rules=None, config=None, templates=None):
+        config = agent_config if config is None else config
+        rules = {} if rules is None else rules
+        templates = {} if templates is None else templates
+        monkeypatch.setattr(LocalAgentRunner, '_load_agent_config', lambda self: config)
+        monkeypatch.setattr(LocalAgentRunner, '_load_detection_rules', lambda self: rules)
+        monkeypatch.setattr(LocalAgentRunner, '_load_templates', lambda self: templates)
+
+    return apply
+
+
+@pytest.fixture
+def make_agent(patch_loaders):
+    """Build a LocalAgentRunner on stubbed loaders with the given rules."""
+    def build(rules=None, config=None, templates=None, **kwargs):
+        patch_loaders(rules, config, templates)
+        return LocalAgentRunner(**kwargs)
+
+    return build
 
 
 class TestLocalAgentRunnerInitialization:
     """Test LocalAgentRunner initialization."""
 
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_init_default_version(self, mock_print, mock_templates, mock_rules, mock_config):
+    def test_init_default_version(self, make_agent, agent_config):
         """Test initialization with default version."""
-        mock_config.return_value = {
-            'agent': {
-                'name': 'Test Agent',
-                'version': '1.0.0',
-                'type': 'local_reasoning'
-            }
-        }
-        mock_rules.return_value = {}
-        mock_templates.return_value = {}
-
-        agent = LocalAgentRunner()
+        agent = make_agent()
 
         assert agent.agent_version == "v1.0"
-        assert mock_config.called
-        assert mock_rules.called
-        assert mock_templates.called
-
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_init_custom_version(self, mock_print, mock_templates, mock_rules, mock_config):
+        # Each loader's result lands on the agent, so all three were called
+        assert agent.config is agent_config
+        assert agent.rules == {}
+        assert agent.templates == {}
+
+    def test_init_custom_version(self, make_agent, agent_config):
         """Test initialization with custom version."""
-        mock_config.return_value = {
-            'agent': {
-                'name': 'Test Agent',
-                'version': '2.0.0',
-                'type': 'local_reasoning'
-            }
-        }
-        mock_rules.return_value = {}
-        mock_templates.return_value = {}
+        config = {'agent': {**agent_config['agent'], 'version': '2.0.0'}}
 
-        agent = LocalAgentRunner(agent_version="v2.0")
+        agent = make_agent(config=config, agent_version="v2.0")
 
         assert agent.agent_version == "v2.0"
 
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_init_sets_attributes(self, mock_print, mock_templates, mock_rules, mock_config):
+    def test_init_sets_attributes(self, make_agent, agent_config):
         """Test that initialization sets all required attributes."""
-        test_config = {
-            'agent': {
-                'name': 'Test Agent',
-                'version': '1.0.0',
-                'type': 'local_reasoning'
-            },
-            'deterministic': True,
-            'requires_api': False
-        }
-        mock_config.return_value = test_config
-        mock_rules.return_value = {'test': 'rules'}
-        mock_templates.return_value = {'test': 'template'}
+        test_config = {**agent_config, 'deterministic': True, 'requires_api': False}
 
-        agent = LocalAgentRunner()
+        agent = make_agent(
+            config=test_config,
+            rules={'test': 'rules'},
+            templates={'test': 'template'}
+        )
 
         assert agent.config == test_config
         assert agent.rules == {'test': 'rules'}
@@ -89,47 +148,33 @@ class TestLocalAgentRunnerInitialization:
 class TestConfigLoading:
     """Test configuration loading methods."""
 
-    @patch('builtins.open', new_callable=mock_open, read_data='agent:\n  name: Test\n  version: 1.0.0\n  type: local_reasoning')
-    @patch('pathlib.Path.exists')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_load_agent_config_success(self, mock_print, mock_templates, mock_rules, mock_exists, mock_file):
+    @patch('builtins.open', new_callable=mock_open, read_data='')
+    @patch('pathlib.Path.exists', return_value=True)
+    @patch.multiple(
+        LocalAgentRunner,
+        _load_detection_rules=Mock(return_value={}),
+        _load_templates=Mock(return_value={})
+    )
+    def test_load_agent_config_success(self, mock_exists, mock_file, agent_config):
         """Test successful agent config loading."""
-        mock_exists.return_value = True
-        mock_rules.return_value = {}
-        mock_templates.return_value = {}
-
-        agent = LocalAgentRunner()
-        config = agent._load_agent_config()
+        # The parser itself is not under test; hand back the parsed document
+        with patch('src.local_agent.yaml.load', return_value=agent_config) as mock_load:
+            agent = LocalAgentRunner()
+            config = agent._load_agent_config()
 
-        assert 'agent' in config
-        assert config['agent']['name'] == 'Test'
+        assert config is agent_config
+        assert mock_load.call_args.kwargs['Loader'] is _YAML_LOADER
+        assert mock_file.call_args.args[0] == agent.agent_dir / "agent_definition.yaml"
 
-    @patch('pathlib.Path.exists')
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_load_agent_config_not_found(self, mock_print, mock_templates, mock_load_config, mock_exists):
+    @patch('pathlib.Path.exists', return_value=False)
+    def test_load_agent_config_not_found(self, mock_exists):
         """Test agent config loading when file not found."""
-        mock_exists.return_value = False
-        mock_load_config.side_effect = FileNotFoundError("Agent definition not found")
-
-        with pytest.raises(FileNotFoundError):
-            agent = LocalAgentRunner()
+        with pytest.raises(FileNotFoundError, match="Agent definition not found"):
+            LocalAgentRunner()
 
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_get_default_rules(self, mock_print, mock_templates, mock_config):
+    def test_get_default_rules(self):
         """Test default rules generation."""
-        mock_config.return_value = {
-            'agent': {'name': 'Test', 'version': '1.0.0', 'type': 'local_reasoning'}
-        }
-        mock_templates.return_value = {}
-
-        agent = LocalAgentRunner()
-        default_rules = agent._get_default_rules()
+        default_rules = _bare_agent()._get_default_rules()
 
         assert 'visual_rules' in default_rules
         assert 'temporal_rules' in default_rules
@@ -141,30 +186,13 @@ class TestConfigLoading:
 class TestVisualArtifactDetection:
     """Test visual artifact detection methods."""
 
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_detect_visual_artifacts_clean_frame(self, mock_print, mock_templates, mock_rules, mock_config):
+    @pytest.mark.opencv
+    def test_detect_visual_artifacts_clean_frame(self, make_agent, visual_rules, random_frame):
         """Test artifact detection on clean frame."""
-        mock_config.return_value = {
-            'agent': {'name': 'Test', 'version': '1.0.0', 'type': 'local_reasoning'}
-        }
-        mock_rules.return_value = {
-            'visual_rules': {
-                'facial_smoothing': {'weight': 0.25},
-                'lighting_inconsistency': {'weight': 0.20},
-                'boundary_artifacts': {'weight': 0.20}
-            }
-        }
-        mock_templates.return_value = {}
+        agent = make_agent(rules=visual_rules)
 
-        agent = LocalAgentRunner()
-
-        # Create a clean frame with high texture variance
-        frame = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
-
-        artifacts = agent._detect_visual_artifacts(frame)
+        # A clean frame with high texture variance
+        artifacts = agent._detect_visual_artifacts(random_frame)
 
         assert 'facial_smoothing' in artifacts
         assert 'lighting_inconsistency' in artifacts
@@ -173,64 +201,34 @@ class TestVisualArtifactDetection:
         assert 'findings' in artifacts
         assert isinstance(artifacts['findings'], list)
 
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_detect_visual_artifacts_smooth_frame(self, mock_print, mock_templates, mock_rules, mock_config):
+    @pytest.mark.opencv
+    def test_detect_visual_artifacts_smooth_frame(self, make_agent, visual_rules):
         """Test artifact detection on overly smooth frame."""
-        mock_config.return_value = {
-            'agent': {'name': 'Test', 'version': '1.0.0', 'type': 'local_reasoning'}
-        }
-        mock_rules.return_value = {
-            'visual_rules': {
-                'facial_smoothing': {'weight': 0.25},
-                'lighting_inconsistency': {'weight': 0.20},
-                'boundary_artifacts': {'weight': 0.20}
-            }
-        }
-        mock_templates.return_value = {}
-
-        agent = LocalAgentRunner()
+        agent = make_agent(rules=visual_rules)
 
         # Create a smooth frame (low texture variance)
-        frame = np.ones((480, 640, 3), dtype=np.uint8) * 128
+        frame = np.full((32, 32, 3), 128, dtype=np.uint8)
 
         artifacts = agent._detect_visual_artifacts(frame)
 
         # Smooth frame should have high facial_smoothing score
         assert artifacts['facial_smoothing'] > 0
         assert len(artifacts['findings']) > 0
-        assert any('smoothing' in finding.lower() for finding in artifacts['findings'])
+        lowered_findings = '\n'.join(artifacts['findings']).lower()
+        assert 'smoothing' in lowered_findings
 
 
 class TestFrameAnalysis:
     """Test individual frame analysis."""
 
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_analyze_frame_structure(self, mock_print, mock_templates, mock_rules, mock_config):
+    @pytest.mark.opencv
+    def test_analyze_frame_structure(self, make_agent, visual_rules, random_frame):
         """Test that analyze_frame returns correct structure."""
-        mock_config.return_value = {
-            'agent': {'name': 'Test', 'version': '1.0.0', 'type': 'local_reasoning'}
-        }
-        mock_rules.return_value = {
-            'visual_rules': {
-                'facial_smoothing': {'weight': 0.25},
-                'lighting_inconsistency': {'weight': 0.20},
-                'boundary_artifacts': {'weight': 0.20}
-            }
-        }
-        mock_templates.return_value = {}
+        agent = make_agent(rules=visual_rules)
 
-        agent = LocalAgentRunner()
-
-        frame = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
         metadata = {'duration': 10.0, 'fps': 30}
 
-        result = agent.analyze_frame(frame, frame_index=5, metadata=metadata)
+        result = agent.analyze_frame(random_frame, frame_index=5, metadata=metadata)
 
         assert 'frame_index' in result
         assert 'artifacts_detected' in result
@@ -239,19 +237,9 @@ class TestFrameAnalysis:
         assert result['frame_index'] == 5
         assert isinstance(result['analysis'], str)
 
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_format_frame_analysis_no_findings(self, mock_print, mock_templates, mock_rules, mock_config):
+    def test_format_frame_analysis_no_findings(self):
         """Test frame analysis formatting with no findings."""
-        mock_config.return_value = {
-            'agent': {'name': 'Test', 'version': '1.0.0', 'type': 'local_reasoning'}
-        }
-        mock_rules.return_value = {}
-        mock_templates.return_value = {}
-
-        agent = LocalAgentRunner()
+        agent = _bare_agent()
 
         artifacts = {'findings': [], 'total_score': 0.0}
         analysis = agent._format_frame_analysis(5, artifacts)
@@ -259,19 +247,9 @@ class TestFrameAnalysis:
         assert 'Frame 5' in analysis
         assert 'No significant artifacts' in analysis
 
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_format_frame_analysis_with_findings(self, mock_print, mock_templates, mock_rules, mock_config):
+    def test_format_frame_analysis_with_findings(self):
         """Test frame analysis formatting with findings."""
-        mock_config.return_value = {
-            'agent': {'name': 'Test', 'version': '1.0.0', 'type': 'local_reasoning'}
-        }
-        mock_rules.return_value = {}
-        mock_templates.return_value = {}
-
-        agent = LocalAgentRunner()
+        agent = _bare_agent()
 
         artifacts = {
             'findings': ['Low texture variance detected', 'Uniform lighting detected'],
@@ -288,25 +266,14 @@ class TestFrameAnalysis:
 class TestTemporalAnalysis:
     """Test temporal sequence analysis."""
 
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_analyze_temporal_sequence_structure(self, mock_print, mock_templates, mock_rules, mock_config):
+    @pytest.mark.opencv
+    def test_analyze_temporal_sequence_structure(self, make_agent, frame_sequence):
         """Test temporal analysis returns correct structure."""
-        mock_config.return_value = {
-            'agent': {'name': 'Test', 'version': '1.0.0', 'type': 'local_reasoning'}
-        }
-        mock_rules.return_value = {}
-        mock_templates.return_value = {}
-
-        agent = LocalAgentRunner()
+        agent = make_agent()
 
-        # Create sequence of frames
-        frames = [np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8) for _ in range(5)]
         frame_indices = [0, 5, 10, 15, 20]
 
-        result = agent.analyze_temporal_sequence(frames, frame_indices)
+        result = agent.analyze_temporal_sequence(frame_sequence, frame_indices)
 
         assert 'num_frames' in result
         assert 'temporal_findings' in result
@@ -315,23 +282,15 @@ class TestTemporalAnalysis:
         assert result['num_frames'] == 5
         assert isinstance(result['temporal_findings'], list)
 
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_analyze_temporal_sequence_identical_frames(self, mock_print, mock_templates, mock_rules, mock_config):
+    @pytest.mark.opencv
+    def test_analyze_temporal_sequence_identical_frames(self, make_agent):
         """Test temporal analysis on identical frames (frozen video)."""
-        mock_config.return_value = {
-            'agent': {'name': 'Test', 'version': '1.0.0', 'type': 'local_reasoning'}
-        }
-        mock_rules.return_value = {}
-        mock_templates.return_value = {}
-
-        agent = LocalAgentRunner()
+        agent = make_agent()
 
         # Create identical frames
-        base_frame = np.random.randint(100, 150, (480, 640, 3), dtype=np.uint8)
-        frames = [base_frame.copy() for _ in range(3)]
+        base_frame = np.random.randint(100, 150, (32, 32, 3), dtype=np.uint8)
+        base_frame.setflags(write=False)
+        frames = [base_frame] * 3
         frame_indices = [0, 1, 2]
 
         result = agent.analyze_temporal_sequence(frames, frame_indices)
@@ -343,25 +302,9 @@ class TestTemporalAnalysis:
 class TestVerdictSynthesis:
     """Test verdict synthesis."""
 
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_synthesize_verdict_structure(self, mock_print, mock_templates, mock_rules, mock_config):
+    def test_synthesize_verdict_structure(self, make_agent, confidence_rules):
         """Test that synthesize_verdict returns correct structure."""
-        mock_config.return_value = {
-            'agent': {'name': 'Test', 'version': '1.0.0', 'type': 'local_reasoning'}
-        }
-        mock_rules.return_value = {
-            'confidence_calculation': {
-                'high_confidence_threshold': 0.75,
-                'moderate_confidence_threshold': 0.55,
-                'uncertain_threshold': 0.45
-            }
-        }
-        mock_templates.return_value = {}
-
-        agent = LocalAgentRunner()
+        agent = make_agent(rules=confidence_rules)
 
         frame_analyses = [
             {
@@ -394,114 +337,42 @@ class TestVerdictSynthesis:
         assert isinstance(result['confidence'], int)
         assert result['classification'] in ['FAKE', 'LIKELY FAKE', 'UNCERTAIN', 'LIKELY REAL', 'REAL']
 
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_synthesize_verdict_high_suspicion(self, mock_print, mock_templates, mock_rules, mock_config):
-        """Test verdict synthesis with high suspicion scores."""
-        mock_config.return_value = {
-            'agent': {'name': 'Test', 'version': '1.0.0', 'type': 'local_reasoning'}
-        }
-        mock_rules.return_value = {
-            'confidence_calculation': {
-                'high_confidence_threshold': 0.75,
-                'moderate_confidence_threshold': 0.55,
-                'uncertain_threshold': 0.45
-            }
-        }
-        mock_templates.return_value = {}
+    @pytest.mark.parametrize('frame_scores,frame_findings,temporal_score,temporal_findings,expected', [
+        # High suspicion should lead to a FAKE classification
+        ((0.9, 0.8), (['High artifacts'], ['More artifacts']), 0.7, ['Temporal issue'],
+         ['FAKE', 'LIKELY FAKE']),
+        # Low suspicion should lead to a REAL classification
+        ((0.1, 0.05), ([], []), 0.0, [], ['REAL', 'LIKELY REAL']),
+    ], ids=['high_suspicion', 'low_suspicion'])
+    def test_synthesize_verdict_suspicion(self, make_agent, confidence_rules, frame_scores,
+                                          frame_findings, temporal_score, temporal_findings,
+                                          expected):
+        """Test verdict synthesis follows the strength of the evidence."""
+        agent = make_agent(rules=confidence_rules)
 
-        agent = LocalAgentRunner()
-
-        # High artifact scores
         frame_analyses = [
             {
-                'frame_index': 0,
-                'artifact_score': 0.9,
-                'artifacts_detected': {'findings': ['High artifacts']}
-            },
-            {
-                'frame_index': 5,
-                'artifact_score': 0.8,
-                'artifacts_detected': {'findings': ['More artifacts']}
+                'frame_index': frame_index,
+                'artifact_score': score,
+                'artifacts_detected': {'findings': findings}
             }
+            for frame_index, score, findings in zip((0, 5), frame_scores, frame_findings)
         ]
 
         temporal_analysis = {
-            'temporal_findings': ['Temporal issue'],
-            'temporal_score': 0.7,
-            'analysis': 'High temporal score'
+            'temporal_findings': temporal_findings,
+            'temporal_score': temporal_score,
+            'analysis': 'Temporal analysis text'
         }
 
-        metadata = {}
-
-        result = agent.synthesize_verdict(frame_analyses, temporal_analysis, metadata)
+        result = agent.synthesize_verdict(frame_analyses, temporal_analysis, {})
 
-        # High suspicion should lead to FAKE classification
-        assert result['classification'] in ['FAKE', 'LIKELY FAKE']
+        assert result['classification'] in expected
         assert result['confidence'] > 50
 
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_synthesize_verdict_low_suspicion(self, mock_print, mock_templates, mock_rules, mock_config):
-        """Test verdict synthesis with low suspicion scores."""
-        mock_config.return_value = {
-            'agent': {'name': 'Test', 'version': '1.0.0', 'type': 'local_reasoning'}
-        }
-        mock_rules.return_value = {
-            'confidence_calculation': {
-                'high_confidence_threshold': 0.75,
-                'moderate_confidence_threshold': 0.55,
-                'uncertain_threshold': 0.45
-            }
-        }
-        mock_templates.return_value = {}
-
-        agent = LocalAgentRunner()
-
-        # Low artifact scores
-        frame_analyses = [
-            {
-                'frame_index': 0,
-                'artifact_score': 0.1,
-                'artifacts_detected': {'findings': []}
-            },
-            {
-                'frame_index': 5,
-                'artifact_score': 0.05,
-                'artifacts_detected': {'findings': []}
-            }
-        ]
-
-        temporal_analysis = {
-            'temporal_findings': [],
-            'temporal_score': 0.0,
-            'analysis': 'Clean temporal analysis'
-        }
-
-        metadata = {}
-
-        result = agent.synthesize_verdict(frame_analyses, temporal_analysis, metadata)
-
-        # Low suspicion should lead to REAL classification
-        assert result['classification'] in ['REAL', 'LIKELY REAL']
-
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_compile_frame_evidence_empty(self, mock_print, mock_templates, mock_rules, mock_config):
+    def test_compile_frame_evidence_empty(self):
         """Test compiling evidence with no findings."""
-        mock_config.return_value = {
-            'agent': {'name': 'Test', 'version': '1.0.0', 'type': 'local_reasoning'}
-        }
-        mock_rules.return_value = {}
-        mock_templates.return_value = {}
-
-        agent = LocalAgentRunner()
+        agent = _bare_agent()
 
         frame_analyses = [
             {'frame_index': 0, 'artifacts_detected': {'findings': []}},
@@ -512,19 +383,9 @@ class TestVerdictSynthesis:
 
         assert 'No significant visual artifacts' in evidence
 
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_compile_frame_evidence_with_findings(self, mock_print, mock_templates, mock_rules, mock_config):
+    def test_compile_frame_evidence_with_findings(self):
         """Test compiling evidence with findings."""
-        mock_config.return_value = {
-            'agent': {'name': 'Test', 'version': '1.0.0', 'type': 'local_reasoning'}
-        }
-        mock_rules.return_value = {}
-        mock_templates.return_value = {}
-
-        agent = LocalAgentRunner()
+        agent = _bare_agent()
 
         frame_analyses = [
             {
@@ -548,17 +409,9 @@ class TestVerdictSynthesis:
 class TestLocalAgentProvider:
     """Test LocalAgentProvider wrapper class."""
 
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_provider_initialization(self, mock_print, mock_templates, mock_rules, mock_config):
+    def test_provider_initialization(self, patch_loaders):
         """Test provider initialization."""
-        mock_config.return_value = {
-            'agent': {'name': 'Test', 'version': '1.0.0', 'type': 'local_reasoning'}
-        }
-        mock_rules.return_value = {}
-        mock_templates.return_value = {}
+        patch_loaders()
 
         provider = LocalAgentProvider(agent_version="v1.0")
 
@@ -566,74 +419,40 @@ class TestLocalAgentProvider:
         assert isinstance(provider.agent, LocalAgentRunner)
         assert provider.model_name == "local_agent_v1.0"
 
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_provider_analyze_frame(self, mock_print, mock_templates, mock_rules, mock_config):
+    def test_provider_analyze_frame(self, patch_loaders, random_frame):
         """Test provider analyze_frame delegates to agent."""
-        mock_config.return_value = {
-            'agent': {'name': 'Test', 'version': '1.0.0', 'type': 'local_reasoning'}
-        }
-        mock_rules.return_value = {
-            'visual_rules': {
-                'facial_smoothing': {'weight': 0.25},
-                'lighting_inconsistency': {'weight': 0.20},
-                'boundary_artifacts': {'weight': 0.20}
-            }
-        }
-        mock_templates.return_value = {}
+        patch_loaders()
 
         provider = LocalAgentProvider()
+        sentinel = {'frame_index': 0, 'artifacts_detected': {}, 'analysis': 'x'}
+        provider.agent.analyze_frame = Mock(return_value=sentinel)
 
-        frame = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
         metadata = {}
 
-        result = provider.analyze_frame(frame, frame_index=0, metadata=metadata)
+        result = provider.analyze_frame(random_frame, frame_index=0, metadata=metadata)
 
-        assert 'frame_index' in result
-        assert 'artifacts_detected' in result
-        assert 'analysis' in result
+        assert result is sentinel
+        provider.agent.analyze_frame.assert_called_once_with(random_frame, 0, metadata)
 
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_provider_analyze_temporal_sequence(self, mock_print, mock_templates, mock_rules, mock_config):
+    def test_provider_analyze_temporal_sequence(self, patch_loaders, frame_sequence):
         """Test provider analyze_temporal_sequence delegates to agent."""
-        mock_config.return_value = {
-            'agent': {'name': 'Test', 'version': '1.0.0', 'type': 'local_reasoning'}
-        }
-        mock_rules.return_value = {}
-        mock_templates.return_value = {}
+        patch_loaders()
 
         provider = LocalAgentProvider()
+        sentinel = {'num_frames': 3, 'temporal_findings': []}
+        provider.agent.analyze_temporal_sequence = Mock(return_value=sentinel)
 
-        frames = [np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8) for _ in range(3)]
+        frames = frame_sequence[:3]
         frame_indices = [0, 5, 10]
 
         result = provider.analyze_temporal_sequence(frames, frame_indices)
 
-        assert 'num_frames' in result
-        assert 'temporal_findings' in result
+        assert result is sentinel
+        provider.agent.analyze_temporal_sequence.assert_called_once_with(frames, frame_indices)
 
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_provider_synthesize_verdict(self, mock_print, mock_templates, mock_rules, mock_config):
+    def test_provider_synthesize_verdict(self, patch_loaders, confidence_rules):
         """Test provider synthesize_verdict delegates to agent."""
-        mock_config.return_value = {
-            'agent': {'name': 'Test', 'version': '1.0.0', 'type': 'local_reasoning'}
-        }
-        mock_rules.return_value = {
-            'confidence_calculation': {
-                'high_confidence_threshold': 0.75,
-                'moderate_confidence_threshold': 0.55,
-                'uncertain_threshold': 0.45
-            }
-        }
-        mock_templates.return_value = {}
+        patch_loaders(rules=confidence_rules)
 
         provider = LocalAgentProvider()
 
@@ -663,107 +482,32 @@ class TestLocalAgentProvider:
 class TestReasoningGeneration:
     """Test reasoning text generation."""
 
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_generate_reasoning_fake_classification(self, mock_print, mock_templates, mock_rules, mock_config):
-        """Test reasoning generation for fake classification."""
-        mock_config.return_value = {
-            'agent': {'name': 'Test', 'version': '1.0.0', 'type': 'local_reasoning'}
-        }
-        mock_rules.return_value = {}
-        mock_templates.return_value = {}
-
-        agent = LocalAgentRunner()
-
-        frame_analyses = [
-            {'frame_index': 0, 'artifacts_detected': {'findings': ['Test finding']}}
-        ]
-
-        temporal_analysis = {'temporal_findings': []}
-
-        reasoning = agent._generate_reasoning(
-            classification='FAKE',
-            confidence=85,
-            combined_score=0.8,
-            all_findings=['Test finding'],
-            frame_analyses=frame_analyses,
-            temporal_analysis=temporal_analysis,
-            metadata={}
-        )
-
-        assert 'FAKE' in reasoning
-        assert '85%' in reasoning
-        assert 'CONCLUSION' in reasoning
-        assert 'synthetic' in reasoning.lower() or 'manipulated' in reasoning.lower()
-
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_generate_reasoning_real_classification(self, mock_print, mock_templates, mock_rules, mock_config):
-        """Test reasoning generation for real classification."""
-        mock_config.return_value = {
-            'agent': {'name': 'Test', 'version': '1.0.0', 'type': 'local_reasoning'}
-        }
-        mock_rules.return_value = {}
-        mock_templates.return_value = {}
-
-        agent = LocalAgentRunner()
-
-        frame_analyses = [
-            {'frame_index': 0, 'artifacts_detected': {'findings': []}}
-        ]
-
-        temporal_analysis = {'temporal_findings': []}
-
-        reasoning = agent._generate_reasoning(
-            classification='REAL',
-            confidence=90,
-            combined_score=0.1,
-            all_findings=[],
-            frame_analyses=frame_analyses,
-            temporal_analysis=temporal_analysis,
-            metadata={}
-        )
-
-        assert 'REAL' in reasoning
-        assert '90%' in reasoning
-        assert 'CONCLUSION' in reasoning
-        assert 'authentic' in reasoning.lower() or 'natural' in reasoning.lower()
-
-    @patch('src.local_agent.LocalAgentRunner._load_agent_config')
-    @patch('src.local_agent.LocalAgentRunner._load_detection_rules')
-    @patch('src.local_agent.LocalAgentRunner._load_templates')
-    @patch('builtins.print')
-    def test_generate_reasoning_uncertain_classification(self, mock_print, mock_templates, mock_rules, mock_config):
-        """Test reasoning generation for uncertain classification."""
-        mock_config.return_value = {
-            'agent': {'name': 'Test', 'version': '1.0.0', 'type': 'local_reasoning'}
-        }
-        mock_rules.return_value = {}
-        mock_templates.return_value = {}
-
-        agent = LocalAgentRunner()
-
+    @pytest.mark.parametrize('classification,confidence,combined_score,findings,expected_any', [
+        ('FAKE', 85, 0.8, ['Test finding'], ['synthetic', 'manipulated']),
+        ('REAL', 90, 0.1, [], ['authentic', 'natural']),
+        ('UNCERTAIN', 50, 0.5, ['Ambiguous finding'], ['inconclusive', 'mixed']),
+    ])
+    def test_generate_reasoning(self, reasoning_agent, classification, confidence,
+                                combined_score, findings, expected_any):
+        """Test reasoning generation for each classification."""
         frame_analyses = [
-            {'frame_index': 0, 'artifacts_detected': {'findings': ['Ambiguous finding']}}
+            {'frame_index': 0, 'artifacts_detected': {'findings': findings}}
         ]
 
         temporal_analysis = {'temporal_findings': []}
 
-        reasoning = agent._generate_reasoning(
-            classification='UNCERTAIN',
-            confidence=50,
-            combined_score=0.5,
-            all_findings=['Ambiguous finding'],
+        reasoning = reasoning_agent._generate_reasoning(
+            classification=classification,
+            confidence=confidence,
+            combined_score=combined_score,
+            all_findings=findings,
             frame_analyses=frame_analyses,
             temporal_analysis=temporal_analysis,
             metadata={}
         )
 
-        assert 'UNCERTAIN' in reasoning
-        assert '50%' in reasoning
+        assert classification in reasoning
+        assert f'{confidence}%' in reasoning
         assert 'CONCLUSION' in reasoning
-        assert 'inconclusive' in reasoning.lower() or 'mixed' in reasoning.lower()
+        lowered = reasoning.lower()
+        assert any(word in lowered for word in expected_any)
@@ -8,14 +8,20 @@ No external dependencies required.
 import pytest
 import json
 from pathlib import Path
+from types import MappingProxyType
 
 from src.output_formatter import OutputFormatter
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_results():
-    """Sample detection results for testing."""
-    return {
+    """
+    Sample detection results for testing, built once and shared read-only.
+
+    Nested dicts stay plain dicts because format_json passes them straight
+    to json.dumps, which cannot serialize mappingproxy objects.
+    """
+    return MappingProxyType({
         'classification': 'LIKELY FAKE',
         'confidence': 75,
         'reasoning': 'The video shows unnatural facial smoothing and lighting inconsistencies.',
@@ -36,7 +42,19 @@ def sample_results():
         'model_name': 'claude-3-5-sonnet',
         'api_provider': 'anthropic',
         'timestamp': '2025-12-27T12:00:00'
-    }
+    })
+
+
+@pytest.fixture(scope="module")
+def parsed_json(sample_results):
+    """format_json output for sample_results, encoded and parsed once."""
+    return json.loads(OutputFormatter.format_json(sample_results))
+
+
+@pytest.fixture(scope="module")
+def save_dir(tmp_path_factory):
+    """One output directory shared by the file-saving tests in this module."""
+    return tmp_path_factory.mktemp("outfmt")
 
 
 class TestConsoleFormatting:
@@ -81,31 +99,22 @@ class TestConsoleFormatting:
 class TestJSONFormatting:
     """Test JSON output formatting."""
 
-    def test_format_json_valid(self, sample_results):
+    def test_format_json_valid(self, parsed_json):
         """Test JSON output is valid JSON."""
-        json_str = OutputFormatter.format_json(sample_results)
-
-        # Should parse without error
-        parsed = json.loads(json_str)
-        assert isinstance(parsed, dict)
+        # The fixture parsed it without error
+        assert isinstance(parsed_json, dict)
 
-    def test_format_json_structure(self, sample_results):
+    def test_format_json_structure(self, parsed_json):
         """Test JSON output has correct structure."""
-        json_str = OutputFormatter.format_json(sample_results)
-        parsed = json.loads(json_str)
+        assert 'video_path' in parsed_json or 'filename' in parsed_json
+        assert 'metadata' in parsed_json
+        assert 'detection' in parsed_json
+        assert 'analysis' in parsed_json
+        assert 'system' in parsed_json
 
-        assert 'video_path' in parsed or 'filename' in parsed
-        assert 'metadata' in parsed
-        assert 'detection' in parsed
-        assert 'analysis' in parsed
-        assert 'system' in parsed
-
-    def test_format_json_detection_fields(self, sample_results):
+    def test_format_json_detection_fields(self, parsed_json):
         """Test JSON detection section has required fields."""
-        json_str = OutputFormatter.format_json(sample_results)
-        parsed = json.loads(json_str)
-
-        detection = parsed['detection']
+        detection = parsed_json['detection']
         assert detection['classification'] == 'LIKELY FAKE'
         assert detection['confidence'] == 75
         assert detection['num_frames_analyzed'] == 10
@@ -129,9 +138,9 @@ class TestJSONFormatting:
 class TestFileOperations:
     """Test saving to files."""
 
-    def test_save_json(self, sample_results, tmp_path):
+    def test_save_json(self, sample_results, save_dir, request):
         """Test saving JSON to file."""
-        output_file = tmp_path / "result.json"
+        output_file = save_dir / f"result_{request.node.name}.json"
 
         OutputFormatter.save_json(sample_results, str(output_file))
 
@@ -142,9 +151,9 @@ class TestFileOperations:
             data = json.load(f)
         assert data['detection']['classification'] == 'LIKELY FAKE'
 
-    def test_save_text_report(self, sample_results, tmp_path):
+    def test_save_text_report(self, sample_results, save_dir, request):
         """Test saving text report to file."""
-        output_file = tmp_path / "report.txt"
+        output_file = save_dir / f"report_{request.node.name}.txt"
 
         OutputFormatter.save_text_report(sample_results, str(output_file))
 
@@ -156,9 +165,9 @@ class TestFileOperations:
         assert 'LIKELY FAKE' in content
         assert 'test_video.mp4' in content
 
-    def test_save_creates_directories(self, sample_results, tmp_path):
+    def test_save_creates_directories(self, sample_results, save_dir, request):
         """Test that save functions create parent directories."""
-        output_file = tmp_path / "nested" / "dir" / "result.json"
+        output_file = save_dir / request.node.name / "nested" / "dir" / "result.json"
 
         OutputFormatter.save_json(sample_results, str(output_file))
 
@@ -179,29 +188,34 @@ class TestSummaryFormatting:
         # Should be single line
         assert '\n' not in summary or summary.count('\n') <= 1
 
-    def test_format_summary_different_classifications(self):
+    @pytest.mark.parametrize(
+        'classification', ['REAL', 'FAKE', 'UNCERTAIN', 'LIKELY REAL', 'LIKELY FAKE']
+    )
+    def test_format_summary_different_classifications(self, classification):
         """Test summary handles different classification types."""
-        for classification in ['REAL', 'FAKE', 'UNCERTAIN', 'LIKELY REAL']:
-            results = {
-                'classification': classification,
-                'confidence': 80,
-                'metadata': {'filename': 'test.mp4'}
-            }
+        results = {
+            'classification': classification,
+            'confidence': 80,
+            'metadata': {'filename': 'test.mp4'}
+        }
 
-            summary = OutputFormatter.format_summary(results)
-            assert classification in summary
+        summary = OutputFormatter.format_summary(results)
+        assert classification in summary
 
 
 class TestClassificationEmoji:
     """Test emoji classification helpers."""
 
-    def test_get_classification_emoji(self):
+    @pytest.mark.parametrize('classification,emoji', [
+        ('REAL', '✅'),
+        ('FAKE', '❌'),
+        ('UNCERTAIN', '❓'),
+        ('LIKELY FAKE', '⚠️'),
+        ('LIKELY REAL', '✓'),
+    ])
+    def test_get_classification_emoji(self, classification, emoji):
         """Test emoji mapping for classifications."""
-        assert OutputFormatter.get_classification_emoji('REAL') == '✅'
-        assert OutputFormatter.get_classification_emoji('FAKE') == '❌'
-        assert OutputFormatter.get_classification_emoji('UNCERTAIN') == '❓'
-        assert OutputFormatter.get_classification_emoji('LIKELY FAKE') == '⚠️'
-        assert OutputFormatter.get_classification_emoji('LIKELY REAL') == '✓'
+        assert OutputFormatter.get_classification_emoji(classification) == emoji
 
     def test_get_classification_emoji_case_insensitive(self):
         """Test emoji mapping is case insensitive."""
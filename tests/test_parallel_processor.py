@@ -19,6 +19,33 @@ from src.parallel_processor import (
     detect_optimal_workers
 )
 
+# Frame index sets shared by tests (tuples: built once, never mutated)
+_UNIFORM_INDICES = (0, 10, 20, 30, 40)
+_CUSTOM_INDICES = (10, 20, 30, 40, 50)
+_BENCHMARK_INDICES = tuple(range(0, 50, 5))
+
+
+@pytest.fixture(scope="module")
+def shared_frame():
+    """One read-only frame; the analysis callbacks never look at pixels."""
+    frame = np.zeros((100, 100, 3), dtype=np.uint8)
+    frame.setflags(write=False)
+    return frame
+
+
+@pytest.fixture(scope="session")
+def child_counts():
+    """Live child-process counts around one real extraction, run once."""
+    video_path = "data/videos/real/real_video_v1.mp4"
+    if not Path(video_path).exists():
+        pytest.skip(f"Test video not found: {video_path}")
+
+    before = len(mp.active_children())
+    ParallelFrameProcessor(max_workers=2).extract_frames_parallel(
+        video_path, _CUSTOM_INDICES
+    )
+    return before, len(mp.active_children())
+
 
 class TestParallelFrameProcessor:
     """Test cases for ParallelFrameProcessor class."""
@@ -47,6 +74,22 @@ class TestParallelFrameProcessor:
         assert processor.timeout == 60
         assert processor.color_space == 'BGR'
 
+    def test_invalid_threads_per_worker_raises_error(self):
+        """Test that a non-positive thread count raises ValueError."""
+        with pytest.raises(ValueError, match="threads_per_worker must be"):
+            ParallelFrameProcessor(threads_per_worker=0)
+
+    def test_extract_frames_with_pinned_workers(self, video_path):
+        """Test extraction with single-threaded, CPU-pinned workers."""
+        if not Path(video_path).exists():
+            pytest.skip(f"Test video not found: {video_path}")
+
+        processor = ParallelFrameProcessor(max_workers=2, pin_workers=True)
+        frames, metadata = processor.extract_frames_parallel(video_path, [0, 10])
+
+        assert metadata['total_frames_extracted'] == len(frames)
+        assert len(frames) > 0
+
     def test_invalid_color_space_raises_error(self):
         """Test that invalid color space raises ValueError."""
         with pytest.raises(ValueError, match="color_space must be"):
@@ -57,7 +100,7 @@ class TestParallelFrameProcessor:
         if not Path(video_path).exists():
             pytest.skip(f"Test video not found: {video_path}")
 
-        frame_indices = [0, 10, 20, 30, 40]
+        frame_indices = _UNIFORM_INDICES
         frames, metadata = processor.extract_frames_parallel(video_path, frame_indices)
 
         # Verify frames extracted
@@ -102,6 +145,7 @@ class TestParallelFrameProcessor:
         # OpenCV may return None or fail gracefully
         assert frame is None or isinstance(frame, np.ndarray)
 
+    @pytest.mark.slow
     def test_benchmark_speedup(self, processor, video_path):
         """Test speedup benchmark comparing sequential vs parallel."""
         if not Path(video_path).exists():
@@ -149,6 +193,28 @@ class TestParallelFrameProcessor:
         with pytest.raises(FileNotFoundError):
             processor.extract_frames_parallel(invalid_path, [0, 1, 2])
 
+    @pytest.mark.parametrize('prefetch', [False, True])
+    def test_prefetch_hint_only_when_enabled(self, tmp_path, prefetch):
+        """Test the readahead hint is skipped unless prefetch is requested."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"\0" * 16)
+        processor = ParallelFrameProcessor(max_workers=1, prefetch=prefetch)
+
+        with patch.object(ParallelFrameProcessor, '_prefetch_file') as mock_prefetch, \
+                patch.object(ParallelFrameProcessor, '_collect_frames', return_value=([], [])):
+            processor.extract_frames_parallel(str(video), _CUSTOM_INDICES)
+
+        assert mock_prefetch.called is prefetch
+
+    def test_prefetch_file(self, video_path):
+        """Test readahead hint is issued for existing files only."""
+        if not Path(video_path).exists():
+            pytest.skip(f"Test video not found: {video_path}")
+
+        result = ParallelFrameProcessor._prefetch_file(video_path)
+        assert isinstance(result, bool)
+        assert ParallelFrameProcessor._prefetch_file("nonexistent.mp4") is False
+
     def test_empty_frame_indices(self, processor, video_path):
         """Test extraction with empty frame indices list."""
         if not Path(video_path).exists():
@@ -174,9 +240,9 @@ class TestParallelLLMAnalyzer:
         )
 
     @pytest.fixture
-    def mock_frames(self):
+    def mock_frames(self, shared_frame):
         """Create mock frames for testing."""
-        return [np.random.rand(100, 100, 3) for _ in range(5)]
+        return [shared_frame] * 5
 
     def test_initialization(self):
         """Test analyzer initialization."""
@@ -197,7 +263,6 @@ class TestParallelLLMAnalyzer:
 
         def mock_analysis_func(frame, frame_idx, **kwargs):
             """Mock analysis function that succeeds."""
-            time.sleep(0.05)  # Simulate processing time
             return {
                 'frame_index': frame_idx,
                 'result': 'analyzed',
@@ -254,14 +319,18 @@ class TestParallelLLMAnalyzer:
 
         active_count = {'max': 0, 'current': 0}
         lock = threading.Lock()
+        saturated = threading.Event()
 
         def concurrent_tracking_func(frame, frame_idx, **kwargs):
             """Track maximum concurrent executions."""
             with lock:
                 active_count['current'] += 1
                 active_count['max'] = max(active_count['max'], active_count['current'])
+                if active_count['current'] >= analyzer.max_concurrent_requests:
+                    saturated.set()
 
-            time.sleep(0.1)  # Simulate work
+            # Hold the slot until every permit is in use, instead of sleeping
+            saturated.wait(timeout=1)
 
             with lock:
                 active_count['current'] -= 1
@@ -270,8 +339,8 @@ class TestParallelLLMAnalyzer:
 
         analyzer.analyze_frames_parallel(mock_frames, concurrent_tracking_func)
 
-        # Max concurrent should not exceed semaphore limit
-        assert active_count['max'] <= analyzer.max_concurrent_requests
+        # The limit is reached but never exceeded
+        assert active_count['max'] == analyzer.max_concurrent_requests
 
     def test_retry_logic_on_failure(self, analyzer, mock_frames):
         """Test that failed requests are retried."""
@@ -306,19 +375,16 @@ class TestParallelLLMAnalyzer:
     def test_rate_limiting(self, analyzer, mock_frames):
         """Test that rate limiting adds delays between requests."""
 
-        start_time = time.time()
-
         def quick_func(frame, frame_idx, **kwargs):
             """Very fast function to test rate limiting overhead."""
             return {'frame_index': frame_idx}
 
-        analyzer.analyze_frames_parallel(mock_frames, quick_func)
-
-        elapsed = time.time() - start_time
+        _, metadata = analyzer.analyze_frames_parallel(mock_frames, quick_func)
 
-        # With rate_limit_delay=0.1 and 5 frames, should take at least 0.5s
-        # (accounting for parallel execution, may be less)
-        assert elapsed > 0  # At least some delay
+        # Each request waits rate_limit_delay while holding one of the
+        # max_concurrent_requests permits, so 5 frames need 2 delayed waves
+        waves = -(-len(mock_frames) // analyzer.max_concurrent_requests)
+        assert metadata['total_time_seconds'] >= waves * analyzer.rate_limit_delay
 
     def test_empty_frames_list(self, analyzer):
         """Test analysis with empty frames list."""
@@ -335,7 +401,7 @@ class TestParallelLLMAnalyzer:
     def test_custom_frame_indices(self, analyzer, mock_frames):
         """Test analysis with custom frame indices."""
 
-        custom_indices = [10, 20, 30, 40, 50]
+        custom_indices = _CUSTOM_INDICES
 
         def index_tracking_func(frame, frame_idx, **kwargs):
             return {'frame_index': frame_idx}
@@ -362,6 +428,72 @@ class TestResourceManager:
             assert manager.active_pools == []
             assert manager.active_executors == []
 
+    def test_resource_manager_reuses_pools(self):
+        """Test that pools are created once, reused, and shut down on exit."""
+
+        with ResourceManager(max_workers=2, max_threads=2) as manager:
+            process_pool = manager.get_process_pool()
+            thread_pool = manager.get_thread_pool()
+
+            assert manager.get_process_pool() is process_pool
+            assert manager.get_thread_pool() is thread_pool
+            assert manager.active_executors == [process_pool, thread_pool]
+
+        assert manager.process_pool is None
+        assert manager.thread_pool is None
+        with pytest.raises(RuntimeError):
+            thread_pool.submit(time.sleep, 0)
+
+    def test_resource_manager_keys_process_pools_on_options(self):
+        """Test that differently configured callers do not share a pool."""
+
+        with ResourceManager(max_workers=2) as manager:
+            default_pool = manager.get_process_pool()
+            single_pool = manager.get_process_pool(max_workers=1)
+
+            assert single_pool is not default_pool
+            assert manager.get_process_pool(max_workers=2) is default_pool
+            assert manager.get_process_pool(max_workers=1) is single_pool
+            assert manager.process_pool is default_pool
+            assert manager.active_executors == [default_pool, single_pool]
+
+        assert manager.process_pool is None
+
+    def test_pinned_extraction_reuses_manager_pool(self, tmp_path):
+        """Test pinned workers keep the same pool options across calls."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"\0" * 16)
+        processor = ParallelFrameProcessor(max_workers=1, pin_workers=True)
+
+        with ResourceManager() as manager:
+            with patch.object(ParallelFrameProcessor, '_collect_frames', return_value=([], [])):
+                processor.extract_frames_parallel(str(video), [0], resource_manager=manager)
+                processor.extract_frames_parallel(str(video), [1], resource_manager=manager)
+
+            assert len(manager.active_executors) == 1
+
+    def test_extract_frames_with_resource_manager(self):
+        """Test that extraction reuses the manager's process pool."""
+        video_path = "data/videos/real/real_video_v1.mp4"
+
+        if not Path(video_path).exists():
+            pytest.skip(f"Test video not found: {video_path}")
+
+        processor = ParallelFrameProcessor(max_workers=2)
+
+        with ResourceManager() as manager:
+            first, _ = processor.extract_frames_parallel(
+                video_path, [0, 10], resource_manager=manager
+            )
+            pool = manager.process_pool
+            second, _ = processor.extract_frames_parallel(
+                video_path, [20], resource_manager=manager
+            )
+
+            assert manager.process_pool is pool
+            assert len(first) == 2
+            assert len(second) == 1
+
     def test_resource_manager_exception_handling(self):
         """Test that ResourceManager doesn't suppress exceptions."""
 
@@ -393,7 +525,7 @@ class TestOptimalWorkers:
 class TestThreadSafety:
     """Test thread safety and race conditions."""
 
-    def test_no_race_conditions_in_parallel_analyzer(self):
+    def test_no_race_conditions_in_parallel_analyzer(self, shared_frame):
         """Test that parallel analyzer doesn't have race conditions."""
 
         shared_state = {'counter': 0}
@@ -409,24 +541,25 @@ class TestThreadSafety:
 
             return {'frame_index': frame_idx}
 
-        frames = [np.random.rand(10, 10, 3) for _ in range(20)]
-        analyzer = ParallelLLMAnalyzer(max_concurrent_requests=5)
+        frames = [shared_frame] * 20
+        analyzer = ParallelLLMAnalyzer(max_concurrent_requests=5, rate_limit_delay=0)
 
         analyzer.analyze_frames_parallel(frames, increment_func)
 
         # If thread-safe, counter should equal number of frames
         assert shared_state['counter'] == len(frames)
 
-    def test_deadlock_prevention(self):
+    def test_deadlock_prevention(self, shared_frame):
         """Test that system doesn't deadlock with circular dependencies."""
 
         def circular_waiting_func(frame, frame_idx, **kwargs):
             """Function that could cause deadlock if not handled properly."""
-            time.sleep(0.05)
             return {'frame_index': frame_idx}
 
-        frames = [np.random.rand(10, 10, 3) for _ in range(10)]
-        analyzer = ParallelLLMAnalyzer(max_concurrent_requests=3, retry_attempts=0)
+        frames = [shared_frame] * 10
+        analyzer = ParallelLLMAnalyzer(
+            max_concurrent_requests=3, rate_limit_delay=0, retry_attempts=0
+        )
 
         # This should complete without hanging
         start = time.time()
@@ -441,34 +574,10 @@ class TestThreadSafety:
 class TestProcessCleanup:
     """Test proper cleanup of processes and resources."""
 
-    def test_process_pool_cleanup_on_success(self):
-        """Test that process pool is cleaned up after successful execution."""
-
-        processor = ParallelFrameProcessor(max_workers=2)
-        video_path = "data/videos/real/real_video_v1.mp4"
-
-        if not Path(video_path).exists():
-            pytest.skip(f"Test video not found: {video_path}")
-
-        # Extract frames
-        processor.extract_frames_parallel(video_path, [0, 1, 2])
-
-        # Process pool should be terminated (no zombie processes)
-        # This is handled by context manager in the implementation
-
-    def test_process_pool_cleanup_on_exception(self):
-        """Test that process pool is cleaned up even if exception occurs."""
-
-        processor = ParallelFrameProcessor(max_workers=2)
-
-        try:
-            # Try to process invalid video (should raise exception)
-            processor.extract_frames_parallel("nonexistent.mp4", [0, 1, 2])
-        except FileNotFoundError:
-            pass  # Expected
-
-        # Process pool should still be cleaned up
-        # This is handled by context manager in the implementation
+    def test_process_pool_leaves_no_children(self, child_counts):
+        """Test that the worker pool is shut down once extraction returns."""
+        before, after = child_counts
+        assert after == before
 
 
 # Integration tests
@@ -476,6 +585,7 @@ class TestProcessCleanup:
 class TestIntegration:
     """Integration tests combining multiple components."""
 
+    @pytest.mark.slow
     def test_end_to_end_parallel_pipeline(self):
         """Test complete parallel pipeline: extraction + analysis."""
 
@@ -500,6 +610,7 @@ class TestIntegration:
         assert len(analyses) == len(frames)
         assert all('analysis' in a for a in analyses)
 
+    @pytest.mark.slow
     def test_benchmark_comparison(self):
         """Test that parallel execution is faster than sequential."""
 
@@ -509,7 +620,7 @@ class TestIntegration:
             pytest.skip(f"Test video not found: {video_path}")
 
         processor = ParallelFrameProcessor(max_workers=mp.cpu_count())
-        benchmark = processor.benchmark_speedup(video_path, list(range(0, 50, 5)))
+        benchmark = processor.benchmark_speedup(video_path, _BENCHMARK_INDICES)
 
         # Parallel should be at least as fast as sequential
         # (may not always be faster for very small workloads due to overhead)
@@ -2,6 +2,9 @@
 Tests for Plugin System Module
 """
 
+import json
+import os
+import types
 import pytest
 from pathlib import Path
 from src.plugin_system import (
@@ -12,6 +15,15 @@ from src.plugin_system import (
 )
 
 
+def _sampler(name, desc=""):
+    """Minimal frame sampler plugin returning the first num frame indices."""
+    return types.SimpleNamespace(
+        name=name,
+        description=desc,
+        sample_frames=lambda total, num, metadata=None: list(range(num))
+    )
+
+
 class TestPluginManager:
     """Test cases for PluginManager class."""
 
@@ -29,15 +41,7 @@ class TestPluginManager:
 
     def test_register_frame_sampler(self, plugin_manager):
         """Test registering a frame sampler plugin."""
-
-        class TestSampler:
-            name = "test_sampler"
-            description = "Test sampler"
-
-            def sample_frames(self, total_frames, num_frames, metadata=None):
-                return list(range(num_frames))
-
-        sampler = TestSampler()
+        sampler = _sampler("test_sampler", "Test sampler")
         plugin_manager.register_frame_sampler(sampler)
 
         assert "test_sampler" in plugin_manager.frame_samplers
@@ -45,15 +49,8 @@ class TestPluginManager:
 
     def test_register_frame_sampler_duplicate_error(self, plugin_manager):
         """Test that duplicate registration raises error."""
-
-        class TestSampler:
-            name = "duplicate"
-
-            def sample_frames(self, total_frames, num_frames, metadata=None):
-                return []
-
-        sampler1 = TestSampler()
-        sampler2 = TestSampler()
+        sampler1 = _sampler("duplicate")
+        sampler2 = _sampler("duplicate")
 
         plugin_manager.register_frame_sampler(sampler1)
 
@@ -62,21 +59,27 @@ class TestPluginManager:
 
     def test_register_frame_sampler_overwrite(self, plugin_manager):
         """Test overwriting existing plugin."""
-
-        class TestSampler:
-            name = "overwrite_test"
-
-            def sample_frames(self, total_frames, num_frames, metadata=None):
-                return []
-
-        sampler1 = TestSampler()
-        sampler2 = TestSampler()
+        sampler1 = _sampler("overwrite_test")
+        sampler2 = _sampler("overwrite_test")
 
         plugin_manager.register_frame_sampler(sampler1)
         plugin_manager.register_frame_sampler(sampler2, overwrite=True)
 
         assert plugin_manager.get_frame_sampler("overwrite_test") is sampler2
 
+    def test_register_frame_samplers_bulk(self, plugin_manager):
+        """Test registering several samplers in one call."""
+        plugin_manager.register_frame_samplers([_sampler("bulk1"), _sampler("bulk2")])
+
+        assert plugin_manager.list_frame_samplers() == ["bulk1", "bulk2"]
+
+    def test_register_frame_samplers_bulk_is_all_or_nothing(self, plugin_manager):
+        """Test a duplicate inside the batch leaves the registry unchanged."""
+        with pytest.raises(ValueError, match="already registered"):
+            plugin_manager.register_frame_samplers([_sampler("same"), _sampler("same")])
+
+        assert plugin_manager.list_frame_samplers() == []
+
     def test_register_invalid_sampler(self, plugin_manager):
         """Test that invalid sampler raises error."""
 
@@ -106,21 +109,8 @@ class TestPluginManager:
 
     def test_list_frame_samplers(self, plugin_manager):
         """Test listing registered frame samplers."""
-
-        class Sampler1:
-            name = "sampler1"
-
-            def sample_frames(self, total_frames, num_frames, metadata=None):
-                return []
-
-        class Sampler2:
-            name = "sampler2"
-
-            def sample_frames(self, total_frames, num_frames, metadata=None):
-                return []
-
-        plugin_manager.register_frame_sampler(Sampler1())
-        plugin_manager.register_frame_sampler(Sampler2())
+        plugin_manager.register_frame_sampler(_sampler("sampler1"))
+        plugin_manager.register_frame_sampler(_sampler("sampler2"))
 
         samplers = plugin_manager.list_frame_samplers()
         assert "sampler1" in samplers
@@ -180,6 +170,30 @@ class TestPluginManager:
 
         assert called["count"] == 1
 
+    def test_overwritten_hook_replaces_cached_hook(self, plugin_manager):
+        """Test that overwrite=True swaps the hook the execute_* methods run."""
+
+        calls = []
+
+        class OldHook:
+            name = "swap_hook"
+
+            def pre_analysis_hook(self, frames, metadata):
+                calls.append("old")
+
+        class NewHook:
+            name = "swap_hook"
+
+            def pre_analysis_hook(self, frames, metadata):
+                calls.append("new")
+
+        plugin_manager.register_analysis_hook(OldHook())
+        plugin_manager.register_analysis_hook(NewHook(), overwrite=True)
+        plugin_manager.execute_pre_analysis_hooks(frames=[], metadata={})
+        plugin_manager.execute_post_analysis_hooks(analyses=[], metadata={})
+
+        assert calls == ["new"]
+
     def test_hook_error_handling(self, plugin_manager):
         """Test that hook errors are handled gracefully."""
 
@@ -196,15 +210,7 @@ class TestPluginManager:
 
     def test_get_plugin_info(self, plugin_manager):
         """Test getting plugin information."""
-
-        class TestSampler:
-            name = "info_sampler"
-            description = "Test description"
-
-            def sample_frames(self, total_frames, num_frames, metadata=None):
-                return []
-
-        plugin_manager.register_frame_sampler(TestSampler())
+        plugin_manager.register_frame_sampler(_sampler("info_sampler", "Test description"))
 
         info = plugin_manager.get_plugin_info()
 
@@ -213,6 +219,22 @@ class TestPluginManager:
         assert "info_sampler" in info["frame_samplers"]
         assert info["frame_samplers"]["info_sampler"]["description"] == "Test description"
 
+    def test_get_plugin_info_cached_and_invalidated(self, plugin_manager):
+        """Test plugin info copies are independent, serializable, and refreshed on register."""
+        plugin_manager.register_frame_sampler(_sampler("cached_sampler", "Cached"))
+
+        info = plugin_manager.get_plugin_info()
+        info["frame_samplers"]["cached_sampler"]["description"] = "mutated"
+        info["analysis_hooks"] = None
+
+        fresh = plugin_manager.get_plugin_info()
+        assert fresh["frame_samplers"]["cached_sampler"]["description"] == "Cached"
+        assert fresh["analysis_hooks"] == {}
+        assert json.loads(json.dumps(fresh)) == fresh
+
+        plugin_manager.register_frame_sampler(_sampler("later_sampler"))
+        assert "later_sampler" in plugin_manager.get_plugin_info()["frame_samplers"]
+
     def test_get_nonexistent_sampler(self, plugin_manager):
         """Test getting a non-existent sampler returns None."""
         sampler = plugin_manager.get_frame_sampler("nonexistent")
@@ -227,6 +249,26 @@ class TestPluginManager:
         # Should load at least the example plugins
         assert count >= 0  # May be 0 if plugins dir doesn't exist in test env
 
+    def test_load_plugins_reuses_unchanged_modules(self, plugin_manager, tmp_path):
+        """Test repeat loads reuse the imported module until the file changes."""
+        plugin_file = tmp_path / "counting_sampler.py"
+        plugin_file.write_text(
+            "class CountingSampler:\n"
+            "    name = 'counting'\n"
+            "    def sample_frames(self, total_frames, num_frames, metadata=None):\n"
+            "        return []\n"
+        )
+
+        first = PluginManager._import_plugin_module(plugin_file)
+        assert PluginManager._import_plugin_module(plugin_file) is first
+
+        assert plugin_manager.load_plugins_from_directory(str(tmp_path)) == 1
+        assert "counting" in plugin_manager.frame_samplers
+
+        stat = plugin_file.stat()
+        os.utime(plugin_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert PluginManager._import_plugin_module(plugin_file) is not first
+
     def test_load_plugins_nonexistent_directory(self, plugin_manager):
         """Test loading from non-existent directory."""
         count = plugin_manager.load_plugins_from_directory("nonexistent_dir")
@@ -5,16 +5,71 @@ Tests frame extraction, metadata parsing, and sampling strategies.
 FFmpeg calls are mocked to avoid external dependencies.
 """
 
+import io
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import numpy as np
 from pathlib import Path
 import json
+import struct
 import subprocess
 
 from src.video_processor import VideoProcessor, validate_video_file
 
 
+# ffprobe output for a 5 s, 150-frame 1080p30 H.264 video
+_FFPROBE_FIXTURE = {
+    "streams": [{
+        "codec_type": "video",
+        "codec_name": "h264",
+        "width": 1920,
+        "height": 1080,
+        "r_frame_rate": "30/1",
+        "nb_frames": "150"
+    }],
+    "format": {
+        "duration": "5.0",
+        "size": "1000000",
+        "bit_rate": "200000"
+    }
+}
+_FFPROBE_JSON = json.dumps(_FFPROBE_FIXTURE)
+
+# tkhd display matrices (a, b, c, d in 16.16 fixed point) by clockwise rotation
+_ROTATION_MATRICES = {
+    0: (0x10000, 0, 0, 0x10000),
+    90: (0, 0x10000, -0x10000, 0),
+    180: (-0x10000, 0, 0, -0x10000),
+    270: (0, -0x10000, 0x10000, 0),
+}
+
+
+def _mp4_box(kind, payload):
+    """Wrap a payload in an MP4 box header."""
+    return struct.pack('>I4s', 8 + len(payload), kind) + payload
+
+
+def _rotated_mp4(rotation, width=64, height=48):
+    """Build a minimal moov-only MP4 (60 frames, 30 fps) with a display rotation."""
+    a, b, c, d = _ROTATION_MATRICES[rotation]
+    tkhd = _mp4_box(b'tkhd', bytes(40) + struct.pack(
+        '>9iII', a, b, 0, c, d, 0, 0, 0, 0x40000000, width << 16, height << 16
+    ))
+    entry = struct.pack('>I4s6xH16xHH', 86, b'avc1', 1, width, height) + bytes(50)
+    stbl = _mp4_box(b'stbl', (
+        _mp4_box(b'stsd', struct.pack('>4xI', 1) + entry)
+        + _mp4_box(b'stts', struct.pack('>4xIII', 1, 60, 1))
+        + _mp4_box(b'stsz', struct.pack('>4xII', 0, 60))
+    ))
+    mdia = _mp4_box(b'mdia', (
+        _mp4_box(b'mdhd', struct.pack('>4xIIII', 0, 0, 30, 60))
+        + _mp4_box(b'hdlr', bytes(8) + b'vide' + bytes(12))
+        + _mp4_box(b'minf', stbl)
+    ))
+    mvhd = _mp4_box(b'mvhd', struct.pack('>4xIIII', 0, 0, 1000, 2000) + bytes(80))
+    return _mp4_box(b'moov', mvhd + _mp4_box(b'trak', tkhd + mdia))
+
+
 class TestFrameSampling:
     """Test frame sampling strategies."""
 
@@ -63,6 +118,16 @@ class TestFrameSampling:
         # Adaptive should have more at edges than middle
         assert first_20_percent + last_20_percent > middle_60_percent
 
+    def test_sampling_results_are_independent_copies(self):
+        """Test cached index math hands out fresh lists each call."""
+        processor = VideoProcessor.__new__(VideoProcessor)
+        processor.num_frames = 5
+
+        first = processor._uniform_sampling(total_frames=100)
+        first.append(999)
+
+        assert processor._uniform_sampling(total_frames=100) == [0, 20, 40, 60, 80]
+
 
 class TestVideoValidation:
     """Test video file validation."""
@@ -92,36 +157,10 @@ class TestMetadataExtraction:
     @patch('subprocess.run')
     def test_extract_metadata_success(self, mock_run):
         """Test successful metadata extraction."""
-        # Mock FFmpeg response
-        mock_ffprobe_output = {
-            "streams": [{
-                "codec_type": "video",
-                "codec_name": "h264",
-                "width": 1920,
-                "height": 1080,
-                "r_frame_rate": "30/1",
-                "nb_frames": "150"
-            }],
-            "format": {
-                "duration": "5.0",
-                "size": "1000000",
-                "bit_rate": "200000"
-            }
-        }
+        mock_run.return_value = Mock(stdout=_FFPROBE_JSON, returncode=0)
 
-        mock_run.return_value = Mock(
-            stdout=json.dumps(mock_ffprobe_output),
-            returncode=0
-        )
-
-        # Create processor with mocked path
-        with patch('pathlib.Path.exists', return_value=True):
-            with patch('pathlib.Path.suffix', '.mp4'):
-                processor = VideoProcessor.__new__(VideoProcessor)
-                processor.video_path = Path("/fake/video.mp4")
-                processor.num_frames = 10
-
-                metadata = processor.extract_metadata()
+        processor = VideoProcessor("/fake/video.mp4", _skip_validate=True)
+        metadata = processor.extract_metadata()
 
         assert metadata['width'] == 1920
         assert metadata['height'] == 1080
@@ -150,45 +189,189 @@ class TestMetadataExtraction:
         fps = processor._parse_fps("30/0")  # Division by zero
         assert fps == 0.0
 
+    @patch('subprocess.run')
+    def test_extract_metadata_from_mp4_container(self, mock_run):
+        """Test metadata is read from the moov box without running ffprobe."""
+        video_path = "data/videos/fake/deepfake_inframe_v1.mp4"
+        if not Path(video_path).exists():
+            pytest.skip(f"Test video not found: {video_path}")
+
+        metadata = VideoProcessor(video_path).extract_metadata()
+
+        mock_run.assert_not_called()
+        assert metadata['resolution'] == "1280x720"
+        assert metadata['codec'] == "h264"
+        assert metadata['fps'] == 24.0
+        assert metadata['total_frames'] == 192
+        assert metadata['duration'] == 8.0
+        assert metadata['size_bytes'] == Path(video_path).stat().st_size
+
+    @patch('subprocess.run')
+    def test_extract_metadata_falls_back_to_ffprobe(self, mock_run, tmp_path):
+        """Test files without a parseable moov box are probed with ffprobe."""
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b'\x00\x00\x00\x08free' + b'\x00' * 64)
+        mock_run.return_value = Mock(
+            stdout=json.dumps({
+                "streams": [{"codec_type": "video", "codec_name": "h264",
+                             "width": 64, "height": 48}],
+                "format": {"duration": "1.0"}
+            }),
+            returncode=0
+        )
+
+        metadata = VideoProcessor(str(video_file)).extract_metadata()
+
+        assert mock_run.called
+        assert metadata['resolution'] == "64x48"
+
+    @pytest.mark.parametrize('rotation', [0, 90, 180, 270])
+    @patch('subprocess.run')
+    def test_extract_metadata_reads_mp4_rotation(self, mock_run, rotation, tmp_path):
+        """Test the display rotation is read from the tkhd matrix, dimensions stay coded."""
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(_rotated_mp4(rotation))
+
+        metadata = VideoProcessor(str(video_file)).extract_metadata()
+
+        mock_run.assert_not_called()
+        assert metadata['rotation'] == rotation
+        assert metadata['resolution'] == "64x48"
+        assert metadata['total_frames'] == 60
+
+    @pytest.mark.parametrize('stream_extra,rotation', [
+        ({}, 0),
+        ({'side_data_list': [{'side_data_type': 'Display Matrix', 'rotation': -90}]}, 90),
+        ({'side_data_list': [{'side_data_type': 'Display Matrix', 'rotation': 90}]}, 270),
+        ({'tags': {'rotate': '180'}}, 180),
+    ])
+    @patch('subprocess.run')
+    def test_extract_metadata_reads_ffprobe_rotation(self, mock_run, stream_extra, rotation, tmp_path):
+        """Test ffprobe's display matrix or rotate tag becomes a clockwise rotation."""
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b'\x00\x00\x00\x08free')
+        stream = {"codec_type": "video", "width": 64, "height": 48, **stream_extra}
+        mock_run.return_value = Mock(
+            stdout=json.dumps({"streams": [stream], "format": {}}), returncode=0
+        )
+
+        metadata = VideoProcessor(str(video_file)).extract_metadata()
+
+        assert metadata['rotation'] == rotation
+
 
 class TestFrameExtraction:
     """Test frame extraction with mocked OpenCV."""
 
-    @patch('cv2.VideoCapture')
-    def test_extract_frames_count(self, mock_videocapture):
-        """Test correct number of frames extracted."""
-        # Mock OpenCV VideoCapture
-        mock_cap = MagicMock()
-        mock_cap.isOpened.return_value = True
-        mock_cap.get.return_value = 30  # 30 frames total
+    @pytest.fixture
+    def mock_cv2(self, monkeypatch):
+        """Replace cv2.VideoCapture; its return_value is an opened capture."""
+        mock_videocapture = MagicMock()
+        mock_videocapture.return_value.isOpened.return_value = True
+        monkeypatch.setattr('cv2.VideoCapture', mock_videocapture)
+        return mock_videocapture
+
+    @patch('src.video_processor.shutil.which', return_value='/usr/bin/ffmpeg')
+    @patch('src.video_processor._pyav', return_value=None)
+    @patch('src.video_processor.subprocess.Popen')
+    def test_extract_frames_count(self, mock_popen, mock_pyav, mock_which, mock_cv2):
+        """Test correct number of frames extracted from one ffmpeg pipe."""
+        import cv2
+
+        # Mock OpenCV VideoCapture for frame count and geometry only
+        props = {
+            cv2.CAP_PROP_FRAME_COUNT: 30,
+            cv2.CAP_PROP_FRAME_WIDTH: 640,
+            cv2.CAP_PROP_FRAME_HEIGHT: 480,
+        }
+        mock_cap = mock_cv2.return_value
+        mock_cap.get.side_effect = lambda prop: props.get(prop, 30)
 
-        # Mock frame reading
-        fake_frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        mock_cap.read.return_value = (True, fake_frame)
+        # ffmpeg streams all selected frames back-to-back as raw RGB
+        mock_popen.return_value.stdout = io.BytesIO(
+            np.zeros((5, 480, 640, 3), dtype=np.uint8).tobytes()
+        )
+        mock_popen.return_value.poll.return_value = 0
 
-        mock_videocapture.return_value = mock_cap
+        processor = VideoProcessor("/fake/video.mp4", num_frames=5, _skip_validate=True)
+        frames = processor.extract_frames(sampling_strategy='uniform')
+
+        assert mock_popen.call_count == 1
+        mock_cap.read.assert_not_called()
+        assert len(frames) == 5
+        assert all(isinstance(f, np.ndarray) for f in frames)
+
+    @patch('src.video_processor.shutil.which', return_value=None)
+    @patch('src.video_processor._pyav', return_value=None)
+    def test_extract_frames_list_and_tensor(self, mock_pyav, mock_which, mock_cv2):
+        """Test frames are stored as a mutable list and stacked on demand."""
+        mock_cap = mock_cv2.return_value
+        mock_cap.get.return_value = 3
+        mock_cap.read.side_effect = lambda: (True, np.zeros((48, 64, 3), dtype=np.uint8))
 
         with patch('pathlib.Path.exists', return_value=True):
             processor = VideoProcessor("/fake/video.mp4", num_frames=5)
-            frames = processor.extract_frames(sampling_strategy='uniform')
+            frames = processor.extract_frames()
+
+        assert len(frames) == 3
+        assert processor.frames is frames
+        assert processor.frames_tensor.shape == (3, 48, 64, 3)
+        assert processor.frames_tensor.dtype == np.uint8
+
+        processor.frames.append(np.ones((48, 64, 3), dtype=np.uint8))
+        processor.frames[0] = np.full((48, 64, 3), 7, dtype=np.uint8)
+        assert len(processor.frames) == 4
+        assert processor.frames[0][0, 0, 0] == 7
+        assert processor.frames_tensor.shape == (4, 48, 64, 3)
+
+    @patch('src.video_processor.shutil.which', return_value=None)
+    @patch('src.video_processor._pyav', return_value=None)
+    def test_extract_frames_store_as_jpeg(self, mock_pyav, mock_which, mock_cv2, tmp_path):
+        """Test JPEG storage keeps encoded bytes and decodes frames on demand."""
+        mock_cap = mock_cv2.return_value
+        mock_cap.get.return_value = 3
+        mock_cap.read.side_effect = lambda: (True, np.full((48, 64, 3), 128, dtype=np.uint8))
 
-        assert len(frames) == 5
-        assert all(isinstance(f, np.ndarray) for f in frames)
+        with patch('pathlib.Path.exists', return_value=True):
+            processor = VideoProcessor("/fake/video.mp4", num_frames=5, store_as_jpeg=True)
+            encoded = processor.extract_frames()
 
-    @patch('cv2.VideoCapture')
-    def test_extract_frames_empty_video(self, mock_videocapture):
-        """Test extraction fails gracefully on empty video."""
-        mock_cap = MagicMock()
-        mock_cap.isOpened.return_value = True
-        mock_cap.get.return_value = 0  # Zero frames
+        assert processor.frames_tensor is None
+        assert len(encoded) == 3
+        assert all(data[:2] == b'\xff\xd8' for data in encoded)
 
-        mock_videocapture.return_value = mock_cap
+        frame = processor.get_frame(1)
+        assert frame.shape == (48, 64, 3)
+        assert np.abs(frame.astype(int) - 128).max() <= 2
+
+        saved = processor.save_frames(str(tmp_path))
+        assert saved[0].read_bytes() == encoded[0]
+
+    def test_extract_frames_iter_streams_and_releases_early(self, mock_cv2):
+        """Test lazy extraction yields frames and cleans up on early exit."""
+        mock_cap = mock_cv2.return_value
+        mock_cap.get.return_value = 30
+        mock_cap.read.side_effect = lambda: (True, np.zeros((48, 64, 3), dtype=np.uint8))
 
         with patch('pathlib.Path.exists', return_value=True):
-            processor = VideoProcessor("/fake/video.mp4", num_frames=10)
+            processor = VideoProcessor("/fake/video.mp4", num_frames=5, use_ffmpeg=False)
+            frames = processor.extract_frames_iter(sampling_strategy='uniform')
 
-            with pytest.raises(ValueError, match="no frames"):
-                processor.extract_frames()
+            first = next(frames)
+            frames.close()
+
+        assert first.shape == (48, 64, 3)
+        mock_cap.release.assert_called_once()
+        assert processor.frames == []
+
+    def test_extract_frames_empty_video(self, mock_cv2):
+        """Test extraction fails gracefully on empty video."""
+        mock_cv2.return_value.get.return_value = 0  # Zero frames
+
+        processor = VideoProcessor("/fake/video.mp4", num_frames=10, _skip_validate=True)
+
+        with pytest.raises(ValueError, match="no frames"):
+            processor.extract_frames()
 
 
 class TestTimestamps:
@@ -209,7 +392,19 @@ class TestTimestamps:
         assert len(timestamps) == 5
         assert timestamps[0] == 0.0  # First frame at 0
         assert timestamps[-1] > timestamps[0]  # Last frame later
-        assert all(timestamps[i] <= timestamps[i+1] for i in range(len(timestamps)-1))  # Sorted
+        ts = np.asarray(timestamps, dtype=np.float64)
+        assert np.all(np.diff(ts) >= 0)  # Sorted
+
+    @pytest.mark.parametrize('fps', [0.0, -25.0])
+    def test_get_frame_timestamps_invalid_fps_falls_back(self, fps):
+        """Test a zero or negative frame rate falls back to 30 fps."""
+        processor = VideoProcessor.__new__(VideoProcessor)
+        processor.metadata = {'fps': fps, 'total_frames': 150}
+        processor.frames = [None] * 5
+
+        timestamps = processor.get_frame_timestamps()
+
+        assert timestamps == pytest.approx([0.0, 1.0, 2.0, 3.0, 4.0])
 
     @patch('subprocess.run')
     def test_get_frame_timestamps_extracts_metadata_if_missing(self, mock_run):
@@ -266,6 +461,12 @@ class TestInitializationErrors:
         with pytest.raises(ValueError, match="Only MP4 files supported"):
             VideoProcessor(str(test_file))
 
+    def test_init_invalid_target_size(self):
+        """Test initialization with a non-positive target size."""
+        with patch('pathlib.Path.exists', return_value=True):
+            with pytest.raises(ValueError, match="target_size"):
+                VideoProcessor("/fake/video.mp4", target_size=(0, 240))
+
 
 class TestMetadataExtractionErrors:
     """Test metadata extraction error handling."""
@@ -392,6 +593,309 @@ class TestFrameExtractionErrors:
 
             assert len(frames) == 10
 
+    @patch('cv2.VideoCapture')
+    def test_open_capture_falls_back_to_software(self, mock_videocapture):
+        """Test a failed hardware-accelerated open retries with default decode."""
+        import cv2
+
+        if not hasattr(cv2, 'CAP_PROP_HW_ACCELERATION'):
+            pytest.skip("OpenCV build without hardware acceleration properties")
+
+        hw_cap = MagicMock()
+        hw_cap.isOpened.return_value = False
+        sw_cap = MagicMock()
+        mock_videocapture.side_effect = [hw_cap, sw_cap]
+
+        with patch('pathlib.Path.exists', return_value=True):
+            processor = VideoProcessor("/fake/video.mp4")
+            cap = processor._open_capture()
+
+        assert cap is sw_cap
+        hw_cap.release.assert_called_once()
+        assert mock_videocapture.call_args_list[0].args[1] == cv2.CAP_FFMPEG
+        assert mock_videocapture.call_args_list[1].args == ("/fake/video.mp4",)
+
+
+class TestFrameReading:
+    """Test sequential-decode vs seek frame reading."""
+
+    def test_read_frames_sequential_skips_unwanted(self):
+        """Test dense indices decode sequentially without seeking."""
+        processor = VideoProcessor.__new__(VideoProcessor)
+
+        mock_cap = MagicMock()
+        fake_frame = np.zeros((4, 4, 3), dtype=np.uint8)
+        mock_cap.read.return_value = (True, fake_frame)
+        mock_cap.grab.return_value = True
+
+        frames = processor._read_frames(mock_cap, [0, 5, 10])
+
+        assert len(frames) == 3
+        assert mock_cap.read.call_count == 3
+        assert mock_cap.grab.call_count == 8
+        mock_cap.set.assert_not_called()
+
+    def test_read_frames_sparse_uses_seek(self):
+        """Test very sparse indices fall back to per-index seeking."""
+        processor = VideoProcessor.__new__(VideoProcessor)
+
+        mock_cap = MagicMock()
+        mock_cap.read.return_value = (True, np.zeros((4, 4, 3), dtype=np.uint8))
+
+        frames = processor._read_frames(mock_cap, [0, 100000])
+
+        assert len(frames) == 2
+        assert mock_cap.set.call_count == 2
+        mock_cap.grab.assert_not_called()
+
+    def test_read_frames_sparse_skips_seek_for_consecutive(self):
+        """Test consecutive sparse indices continue reading without a seek."""
+        processor = VideoProcessor.__new__(VideoProcessor)
+
+        mock_cap = MagicMock()
+        mock_cap.read.return_value = (True, np.zeros((4, 4, 3), dtype=np.uint8))
+
+        frames = processor._read_frames(mock_cap, [100000, 100001, 100002])
+
+        assert len(frames) == 3
+        assert mock_cap.set.call_count == 1
+
+    def test_decode_and_convert_preserves_order(self):
+        """Test pipelined decode returns RGB frames ordered like the request."""
+        processor = VideoProcessor.__new__(VideoProcessor)
+        processor.zero_copy_rgb = False
+        processor.target_size = None
+
+        frames_by_index = {
+            i: np.full((2, 2, 3), (i, 0, 255), dtype=np.uint8) for i in range(6)
+        }
+        position = {'i': 0}
+
+        def read():
+            frame = frames_by_index[position['i']]
+            position['i'] += 1
+            return True, frame
+
+        def grab():
+            position['i'] += 1
+            return True
+
+        mock_cap = MagicMock()
+        mock_cap.read.side_effect = read
+        mock_cap.grab.side_effect = grab
+
+        frames = processor._decode_and_convert(mock_cap, [5, 1, 3])
+
+        assert [int(f[0, 0, 2]) for f in frames] == [5, 1, 3]
+        assert all(f[0, 0, 0] == 255 for f in frames)
+
+    def test_decode_and_convert_zero_copy_rgb(self):
+        """Test zero-copy mode returns reversed-channel views of decoded frames."""
+        processor = VideoProcessor.__new__(VideoProcessor)
+        processor.zero_copy_rgb = True
+        processor.target_size = None
+
+        decoded = [np.full((2, 2, 3), (i, 0, 255), dtype=np.uint8) for i in range(3)]
+        mock_cap = MagicMock()
+        mock_cap.read.side_effect = [(True, frame) for frame in decoded]
+
+        frames = processor._decode_and_convert(mock_cap, [0, 1, 2])
+
+        for frame, bgr in zip(frames, decoded):
+            assert np.shares_memory(frame, bgr)
+            assert frame[0, 0].tolist() == bgr[0, 0, ::-1].tolist()
+
+    def test_decode_and_convert_propagates_decode_errors(self):
+        """Test errors raised on the decode thread reach the caller."""
+        processor = VideoProcessor.__new__(VideoProcessor)
+        processor.zero_copy_rgb = False
+        processor.target_size = None
+
+        mock_cap = MagicMock()
+        mock_cap.read.side_effect = RuntimeError("decoder crashed")
+
+        with pytest.raises(RuntimeError, match="decoder crashed"):
+            processor._decode_and_convert(mock_cap, [0, 1])
+
+    def test_read_frames_matches_seek_on_real_video(self):
+        """Test sequential decode returns the same pixels as seeking."""
+        import cv2
+
+        video_path = "data/videos/fake/deepfake_inframe_v1.mp4"
+        if not Path(video_path).exists():
+            pytest.skip(f"Test video not found: {video_path}")
+
+        processor = VideoProcessor(video_path, num_frames=5)
+        indices = [0, 37, 75, 150]
+
+        cap = cv2.VideoCapture(video_path)
+        try:
+            sequential = processor._read_frames(cap, indices)
+        finally:
+            cap.release()
+
+        processor.SEEK_GAP_THRESHOLD = 0
+        cap = cv2.VideoCapture(video_path)
+        try:
+            seeked = processor._read_frames(cap, indices)
+        finally:
+            cap.release()
+
+        assert len(sequential) == len(seeked) == len(indices)
+        for a, b in zip(sequential, seeked):
+            assert np.array_equal(a, b)
+
+
+class TestFFmpegExtraction:
+    """Test single-pass ffmpeg frame extraction."""
+
+    @patch('src.video_processor.shutil.which', return_value='/usr/bin/ffmpeg')
+    @patch('src.video_processor.subprocess.Popen', side_effect=OSError("no ffmpeg"))
+    @patch('cv2.VideoCapture')
+    def test_extract_frames_falls_back_to_opencv(self, mock_videocapture, mock_popen, mock_which):
+        """Test OpenCV path is used when ffmpeg cannot run."""
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.get.return_value = 30
+        mock_cap.read.return_value = (True, np.zeros((480, 640, 3), dtype=np.uint8))
+        mock_videocapture.return_value = mock_cap
+
+        with patch('pathlib.Path.exists', return_value=True):
+            processor = VideoProcessor("/fake/video.mp4", num_frames=5)
+            frames = processor.extract_frames()
+
+        assert mock_popen.called
+        assert len(frames) == 5
+
+    @patch('src.video_processor.shutil.which', return_value=None)
+    @patch('cv2.VideoCapture')
+    def test_extract_frames_downscales_to_target_size(self, mock_videocapture, mock_which):
+        """Test OpenCV-decoded frames are resized to target_size."""
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.get.return_value = 30
+        mock_cap.read.side_effect = lambda: (True, np.zeros((480, 640, 3), dtype=np.uint8))
+        mock_videocapture.return_value = mock_cap
+
+        with patch('pathlib.Path.exists', return_value=True):
+            processor = VideoProcessor("/fake/video.mp4", num_frames=3, target_size=(320, 240))
+            frames = processor.extract_frames()
+
+        assert len(frames) == 3
+        assert all(f.shape == (240, 320, 3) for f in frames)
+
+    def test_extract_frames_ffmpeg_matches_opencv(self):
+        """Test ffmpeg and OpenCV paths return identical RGB frames."""
+        import shutil
+
+        video_path = "data/videos/fake/deepfake_inframe_v1.mp4"
+        if not Path(video_path).exists():
+            pytest.skip(f"Test video not found: {video_path}")
+        if not shutil.which('ffmpeg'):
+            pytest.skip("ffmpeg not installed")
+
+        ffmpeg_frames = VideoProcessor(video_path, num_frames=4).extract_frames()
+        opencv_frames = VideoProcessor(
+            video_path, num_frames=4, use_ffmpeg=False
+        ).extract_frames()
+
+        assert len(ffmpeg_frames) == len(opencv_frames) == 4
+        for a, b in zip(ffmpeg_frames, opencv_frames):
+            assert a.shape == b.shape
+            assert np.array_equal(a, b)
+
+    def test_extract_frames_pyav_matches_opencv(self):
+        """Test PyAV and OpenCV paths return identical RGB frames."""
+        pytest.importorskip('av')
+
+        video_path = "data/videos/fake/deepfake_inframe_v1.mp4"
+        if not Path(video_path).exists():
+            pytest.skip(f"Test video not found: {video_path}")
+
+        processor = VideoProcessor(video_path, num_frames=4)
+        indices = processor.get_frame_indices()
+        pyav_frames = list(processor._iter_frames_pyav(indices))
+        opencv_frames = VideoProcessor(
+            video_path, num_frames=4, use_ffmpeg=False
+        ).extract_frames()
+
+        assert len(pyav_frames) == len(opencv_frames) == 4
+        for a, b in zip(pyav_frames, opencv_frames):
+            assert np.array_equal(a, b)
+
+    @pytest.mark.parametrize('rotation,size', [(0, (64, 48)), (90, (48, 64)), (270, (48, 64))])
+    @patch('src.video_processor.shutil.which', return_value='/usr/bin/ffmpeg')
+    @patch('cv2.VideoCapture')
+    def test_ffmpeg_pipe_uses_rotated_geometry(self, mock_videocapture, mock_which,
+                                               rotation, size, tmp_path):
+        """Test the known-metadata pipe is sized for ffmpeg's auto-rotated output."""
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(_rotated_mp4(rotation))
+        processor = VideoProcessor(str(video_file), num_frames=2)
+        processor.extract_metadata()
+
+        def fake_ffmpeg(indices, width, height):
+            for _ in indices:
+                yield np.zeros((height, width, 3), dtype=np.uint8)
+            return len(indices)
+
+        with patch.object(processor, '_iter_frames_ffmpeg', side_effect=fake_ffmpeg) as mock_ffmpeg:
+            frames = processor.extract_frames()
+
+        mock_videocapture.assert_not_called()
+        assert mock_ffmpeg.call_args.args[1:] == size
+        assert all(f.shape == (size[1], size[0], 3) for f in frames)
+
+    def test_cached_metadata_without_rotation_needs_capture(self):
+        """Test metadata lacking a rotation falls back to OpenCV's rotated geometry."""
+        metadata = {'total_frames': 60, 'width': 64, 'height': 48}
+        with patch('pathlib.Path.exists', return_value=True):
+            processor = VideoProcessor.from_cached_metadata("/fake/video.mp4", metadata)
+
+        assert not processor._has_frame_geometry()
+
+    @patch('src.video_processor._pyav', return_value=None)
+    def test_pyav_missing_yields_nothing(self, mock_pyav):
+        """Test the PyAV path defers to the fallbacks when not installed."""
+        with patch('pathlib.Path.exists', return_value=True):
+            processor = VideoProcessor("/fake/video.mp4")
+
+        assert list(processor._iter_frames_pyav([0, 1])) == []
+
+    @pytest.mark.parametrize('rotation', [0, 90])
+    def test_pyav_skipped_for_rotated_video(self, rotation, tmp_path):
+        """Test PyAV is not used when frames would ignore the display rotation."""
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(_rotated_mp4(rotation))
+        processor = VideoProcessor(str(video_file), use_pyav=True)
+        fake_av = MagicMock(FFmpegError=Exception)
+
+        with patch('src.video_processor._pyav', return_value=fake_av):
+            assert list(processor._iter_frames_pyav([0, 1])) == []
+
+        assert fake_av.open.called is (rotation == 0)
+
+    @pytest.mark.parametrize('use_pyav', [False, True])
+    def test_pyav_only_when_enabled(self, use_pyav):
+        """Test PyAV is tried only with use_pyav, ahead of the ffmpeg binary."""
+        with patch('pathlib.Path.exists', return_value=True):
+            processor = VideoProcessor("/fake/video.mp4", use_pyav=use_pyav)
+
+        pyav_frame = np.zeros((4, 4, 3), dtype=np.uint8)
+
+        def fake_pyav(indices):
+            yield pyav_frame
+            return 1
+
+        with patch.object(processor, '_iter_frames_pyav', side_effect=fake_pyav) as mock_pyav, \
+                patch.object(processor, '_iter_frames_ffmpeg') as mock_ffmpeg, \
+                patch('src.video_processor.shutil.which', return_value=None):
+            frames = list(processor._iter_frames_single_pass([0], 4, 4))
+
+        assert mock_pyav.called is use_pyav
+        mock_ffmpeg.assert_not_called()
+        assert len(frames) == (1 if use_pyav else 0)
+
 
 class TestSaveFrames:
     """Test frame saving functionality."""
@@ -402,10 +906,9 @@ class TestSaveFrames:
         mock_imwrite.return_value = True
 
         processor = VideoProcessor.__new__(VideoProcessor)
-        processor.frames = [
-            np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
-            for _ in range(3)
-        ]
+        processor.frames = list(
+            np.random.default_rng(0).integers(0, 255, (3, 480, 640, 3), dtype=np.uint8)
+        )
 
         output_dir = tmp_path / "output"
         saved_paths = processor.save_frames(str(output_dir), prefix="test")
@@ -414,6 +917,25 @@ class TestSaveFrames:
         assert all(p.name.startswith("test_") for p in saved_paths)
         assert mock_imwrite.call_count == 3
 
+    def test_save_frames_writes_files_in_order(self, tmp_path):
+        """Test concurrently saved frames land at their indexed paths."""
+        import cv2
+
+        processor = VideoProcessor.__new__(VideoProcessor)
+        processor.frames = [
+            np.full((16, 16, 3), value, dtype=np.uint8) for value in (0, 128, 255)
+        ]
+
+        saved_paths = processor.save_frames(str(tmp_path), prefix="ordered")
+
+        assert [p.name for p in saved_paths] == [
+            "ordered_000.jpg", "ordered_001.jpg", "ordered_002.jpg"
+        ]
+        for path, value in zip(saved_paths, (0, 128, 255)):
+            image = cv2.imread(str(path))
+            assert image is not None
+            assert abs(int(image.mean()) - value) <= 2
+
 
 class TestCompleteProcessing:
     """Test complete processing pipeline."""
@@ -423,26 +945,7 @@ class TestCompleteProcessing:
     def test_process_complete_pipeline(self, mock_run, mock_videocapture):
         """Test complete processing pipeline."""
         # Mock ffprobe
-        mock_ffprobe_output = {
-            "streams": [{
-                "codec_type": "video",
-                "codec_name": "h264",
-                "width": 1920,
-                "height": 1080,
-                "r_frame_rate": "30/1",
-                "nb_frames": "150"
-            }],
-            "format": {
-                "duration": "5.0",
-                "size": "1000000",
-                "bit_rate": "200000"
-            }
-        }
-
-        mock_run.return_value = Mock(
-            stdout=json.dumps(mock_ffprobe_output),
-            returncode=0
-        )
+        mock_run.return_value = Mock(stdout=_FFPROBE_JSON, returncode=0)
 
         # Mock VideoCapture
         mock_cap = MagicMock()
@@ -501,6 +1004,57 @@ class TestGetMetadata:
             assert metadata1 == metadata2
             assert mock_run.call_count == 1  # Only called once
 
+    @patch('subprocess.run')
+    def test_ffprobe_memoized_per_file_version(self, mock_run, tmp_path):
+        """Test ffprobe output is reused across processors for an unchanged file."""
+        from src.video_processor import _run_ffprobe
+
+        mock_run.return_value = Mock(
+            stdout=json.dumps({
+                "streams": [{"codec_type": "video", "width": 64, "height": 48,
+                             "r_frame_rate": "25/1", "nb_frames": "50"}],
+                "format": {"duration": "2.0"}
+            }),
+            returncode=0
+        )
+
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(b"not really a video")
+
+        _run_ffprobe.cache_clear()
+        try:
+            first = VideoProcessor(str(video)).extract_metadata()
+            second = VideoProcessor(str(video)).extract_metadata()
+
+            assert first == second
+            assert mock_run.call_count == 1
+
+            cmd = mock_run.call_args.args[0]
+            assert '-show_streams' not in cmd
+            assert cmd[cmd.index('-select_streams') + 1] == 'v:0'
+
+            video.write_bytes(b"rewritten with different size")
+            VideoProcessor(str(video)).extract_metadata()
+
+            assert mock_run.call_count == 2
+        finally:
+            _run_ffprobe.cache_clear()
+
+    @patch('subprocess.run')
+    def test_from_cached_metadata_skips_ffprobe(self, mock_run):
+        """Test a processor built from known metadata never runs ffprobe."""
+        metadata = {'fps': 30.0, 'total_frames': 150, 'width': 640, 'height': 480}
+
+        with patch('pathlib.Path.exists', return_value=True):
+            processor = VideoProcessor.from_cached_metadata(
+                "/fake/video.mp4", metadata, num_frames=5
+            )
+
+        assert processor.get_metadata() == metadata
+        assert processor.get_metadata() is not metadata
+        assert processor.num_frames == 5
+        mock_run.assert_not_called()
+
 
 class TestGetFrameIndices:
     """Test get_frame_indices method."""
@@ -521,6 +1075,58 @@ class TestGetFrameIndices:
             assert len(indices) == 10
             assert indices == [0, 10, 20, 30, 40, 50, 60, 70, 80, 90]
 
+    @patch('cv2.VideoCapture')
+    def test_get_frame_indices_uses_known_metadata(self, mock_videocapture):
+        """Test a known frame count avoids opening the video."""
+        with patch('pathlib.Path.exists', return_value=True):
+            processor = VideoProcessor.from_cached_metadata(
+                "/fake/video.mp4", {'total_frames': 100}, num_frames=5
+            )
+            indices = processor.get_frame_indices()
+
+        assert indices == [0, 20, 40, 60, 80]
+        mock_videocapture.assert_not_called()
+
+    @patch('src.video_processor.shutil.which', return_value=None)
+    @patch('src.video_processor._pyav', return_value=None)
+    @patch('cv2.VideoCapture')
+    def test_capture_reused_by_extraction(self, mock_videocapture, mock_pyav, mock_which):
+        """Test extraction reuses the capture opened by get_frame_indices."""
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.get.return_value = 10
+        mock_cap.read.side_effect = lambda: (True, np.zeros((4, 4, 3), dtype=np.uint8))
+        mock_videocapture.return_value = mock_cap
+
+        with patch('pathlib.Path.exists', return_value=True):
+            with VideoProcessor("/fake/video.mp4", num_frames=5) as processor:
+                processor.get_frame_indices()
+                mock_cap.release.assert_not_called()
+
+                frames = processor.extract_frames()
+
+        assert len(frames) == 5
+        assert mock_videocapture.call_count == 1
+        mock_cap.release.assert_called_once()
+
+    @patch('cv2.VideoCapture')
+    def test_get_frame_indices_requests_hardware_decode(self, mock_videocapture):
+        """Test the capture kept for extraction is opened like extraction's own."""
+        import cv2
+
+        if not hasattr(cv2, 'CAP_PROP_HW_ACCELERATION'):
+            pytest.skip("OpenCV build without hardware acceleration properties")
+
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.get.return_value = 100
+        mock_videocapture.return_value = mock_cap
+
+        with VideoProcessor("/fake/video.mp4", _skip_validate=True) as processor:
+            processor.get_frame_indices()
+
+        assert mock_videocapture.call_args.args[1] == cv2.CAP_FFMPEG
+
     @patch('cv2.VideoCapture')
     def test_get_frame_indices_custom_num_frames(self, mock_videocapture):
         """Test getting frame indices with custom num_frames."""
@@ -618,6 +1224,20 @@ class TestGetFrameIndices:
 class TestValidateVideoFileAdvanced:
     """Test advanced video file validation."""
 
+    def test_import_does_not_load_opencv(self):
+        """Test importing the module and validating paths leaves OpenCV unloaded."""
+        import sys
+
+        code = (
+            "import sys\n"
+            "from src.video_processor import validate_video_file\n"
+            "validate_video_file('/nonexistent/video.mp4')\n"
+            "assert 'cv2' not in sys.modules\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True)
+
+        assert result.returncode == 0, result.stderr.decode()
+
     def test_validate_video_file_not_a_file(self, tmp_path):
         """Test validation when path is a directory."""
         directory = tmp_path / "not_a_file"
@@ -687,3 +1307,23 @@ class TestValidateVideoFileAdvanced:
 
         assert is_valid is True
         assert error is None
+
+    @patch('cv2.VideoCapture')
+    def test_validate_video_file_cached_until_file_changes(self, mock_videocapture, tmp_path):
+        """Test repeat validation skips OpenCV until the file is rewritten."""
+        test_file = tmp_path / "cached.mp4"
+        test_file.write_text("fake video content")
+
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.read.return_value = (True, np.zeros((48, 64, 3), dtype=np.uint8))
+        mock_videocapture.return_value = mock_cap
+
+        assert validate_video_file(str(test_file)) == (True, None)
+        assert validate_video_file(str(test_file)) == (True, None)
+        assert mock_videocapture.call_count == 1
+
+        test_file.write_text("rewritten, longer fake video content")
+
+        assert validate_video_file(str(test_file)) == (True, None)
+        assert mock_videocapture.call_count == 2